@@ -0,0 +1 @@
+"""Data loading and aggregation for the Global Aircrash Analysis Dashboard."""
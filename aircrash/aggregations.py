@@ -0,0 +1,300 @@
+"""Pre-aggregated crash cubes and roll-ups over them."""
+
+import numpy as np
+import pandas as pd
+
+from .data import align_categories
+from .filters import DATE_COLUMN, STATE_COLUMNS, filter_positions, is_all
+from .frozen import freeze
+
+# --- CRASH CUBE ---
+# Crash counts and people sums pre-aggregated per dimension combination;
+# KPIs and summaries roll up from here instead of scanning raw rows. Date is
+# not a dimension, so cells do not multiply by day.
+CUBE_DIMENSIONS = ["Year", "Quarter", "Continent", "Country/Region", "Aircraft Manufacturer", "Aircraft"]
+CUBE_MEASURES = ["Crashes", "Aboard", "Fatalities (air)", "Ground", "Survivors"]
+
+
+def build_cells(df, dimensions):
+    # Measures summed per combination of `dimensions`; rows of `df` count one
+    # crash each unless it is itself a cube with a "Crashes" column. One plain
+    # sum over a column of ones is far cheaper than a named size aggregation.
+    if "Crashes" not in df:
+        df = df.assign(Crashes=1)
+    cells = df.groupby(dimensions, observed=True)[CUBE_MEASURES].sum().reset_index()
+    cells[CUBE_MEASURES] = cells[CUBE_MEASURES].astype("int64")
+    return cells
+
+
+def build_crash_cube(df):
+    return build_cells(df, CUBE_DIMENSIONS)
+
+
+# --- CRASH RECORDS ---
+# The loaded rows with the cube dimensions and the date, one crash each and
+# kept in date order so that a date range is one slice of positions. States
+# with a date range and the daily survivors per manufacturer are answered
+# from them.
+RECORD_DIMENSIONS = CUBE_DIMENSIONS + [DATE_COLUMN]
+STREAMED_DATES = "date ranges need the crash records, which streaming ingestion does not keep"
+
+
+def in_date_order(records):
+    # Records sorted by date, ties keeping their order
+    return records.sort_values(DATE_COLUMN, kind="stable", ignore_index=True)
+
+
+def crash_records(df):
+    # The rows of `df` the cube counts (every dimension and the date present)
+    records = df[RECORD_DIMENSIONS + CUBE_MEASURES[1:]].dropna(subset=RECORD_DIMENSIONS)
+    return in_date_order(records)
+
+
+def has_crash_records(dataset):
+    # False for streamed snapshots (aircrash.ingest), which keep the daily
+    # tables below instead
+    return "crashes" in dataset
+
+
+# --- DAILY TABLES ---
+# What streaming keeps of the dates in place of the crash records: totals per
+# day, for the date slider's span, and survivors per manufacturer and day, for
+# the moving averages. Neither grows past the distinct days (times
+# manufacturers), whatever the number of rows.
+MANUFACTURER_DAY_DIMENSIONS = ["Aircraft Manufacturer", DATE_COLUMN]
+
+
+def build_day_totals(df):
+    return build_cells(df, [DATE_COLUMN])
+
+
+def build_manufacturer_days(df):
+    days = df.groupby(MANUFACTURER_DAY_DIMENSIONS, observed=True)["Survivors"].sum().reset_index()
+    days["Survivors"] = days["Survivors"].astype("int64")
+    return days
+
+
+def merge_cubes(parts, dimensions, measures):
+    # Partial cubes over disjoint rows combine by summing matching cells
+    merged = pd.concat(parts, ignore_index=True)
+    return merged.groupby(dimensions, observed=True, sort=False)[measures].sum().reset_index()
+
+
+def append_cells(cube, partial, dimensions, measures):
+    # Fold a partial cube into `cube` without moving existing cells: matching
+    # cells are summed and new cells go at the end. Returns the new cube and
+    # the positions of the appended cells; `cube` itself is left untouched.
+    cube, partial = align_categories(cube, partial)
+    cells = pd.MultiIndex.from_frame(cube[dimensions])
+    locs = cells.get_indexer(pd.MultiIndex.from_frame(partial[dimensions]))
+    matched = locs >= 0
+    for measure in measures:
+        values = cube[measure].to_numpy(copy=True)
+        values[locs[matched]] += partial[measure].to_numpy()[matched]
+        cube[measure] = values
+
+    start = len(cube)
+    cube = pd.concat([cube, partial.loc[~matched, list(cube.columns)]], ignore_index=True)
+    return cube, np.arange(start, len(cube), dtype=np.int32)
+
+
+def rollup(cube, positions=None, by=None):
+    # Totals over the selected cube cells or crash records (all of them when
+    # positions is None), optionally grouped by one or more dimensions
+    cells = cube if positions is None else cube.take(positions)
+    if "Crashes" not in cells:
+        cells = cells.assign(Crashes=1)
+    if by is None:
+        return cells[CUBE_MEASURES].sum()
+    return cells.groupby(by, observed=True)[CUBE_MEASURES].sum().reset_index()
+
+
+# --- DASHBOARD AGGREGATES ---
+# Dimensions the filter-dependent sections are summed over
+SECTION_DIMENSIONS = ["Aircraft Manufacturer", "Continent", "Quarter", "Country/Region", "Aircraft"]
+
+
+def dimension_totals(cube, column, positions=None):
+    # Cube measures summed per category of `column` over the selected cells
+    # (all cells when positions is None) with vectorized bincounts over the
+    # category codes, keeping only categories that have crashes. The cells
+    # are read in place through `positions`; no filtered frame is built.
+    # Crash records without a "Crashes" column count one crash each.
+    categories = cube[column].cat.categories
+    codes = cube[column].cat.codes.to_numpy()
+    if positions is not None:
+        codes = codes[positions]
+    totals = {}
+    for measure in CUBE_MEASURES:
+        weights = None
+        if measure in cube:
+            weights = cube[measure].to_numpy()
+            if positions is not None:
+                weights = weights[positions]
+        totals[measure] = np.bincount(codes, weights=weights, minlength=len(categories)).astype("int64")
+    present = totals["Crashes"] > 0
+    return pd.DataFrame(
+        {column: categories[present], **{measure: values[present] for measure, values in totals.items()}}
+    )
+
+
+def measure_totals(cube, positions=None):
+    # Sum of every cube measure over the selected cells or records
+    totals = {}
+    for measure in CUBE_MEASURES:
+        if measure not in cube:
+            totals[measure] = len(cube) if positions is None else len(positions)
+            continue
+        values = cube[measure].to_numpy()
+        totals[measure] = (values if positions is None else values[positions]).sum()
+    return pd.Series(totals, dtype="int64")
+
+
+def top_n(frame, column, n):
+    return frame.sort_values(column, ascending=False, kind="stable").head(n).reset_index(drop=True)
+
+
+def filter_source(dataset, selections):
+    # The table a selection (aircrash.filters) is answered from and its
+    # filter index: the cube, or the crash records when a date range is set
+    if is_all(selections.get(DATE_COLUMN)):
+        return dataset["cube"], dataset["cube_index"]
+    if not has_crash_records(dataset):
+        raise ValueError(STREAMED_DATES)
+    return dataset["crashes"], dataset["crash_index"]
+
+
+def filtered_positions(dataset, state):
+    # (table, positions) for a filter state: the table its totals are summed
+    # from and the positions matching it there, None when everything matches
+    selections = dict(zip(STATE_COLUMNS, state))
+    table, index = filter_source(dataset, selections)
+    return table, filter_positions(index, selections)
+
+
+def filtered_records(dataset, state):
+    # Positions of the crash records matching a filter state; None for all
+    return filter_positions(dataset["crash_index"], dict(zip(STATE_COLUMNS, state)))
+
+
+def filtered_cells(dataset, state):
+    # Crash records matching a filter state, as a frame of their own; cube
+    # cells, with a "Crashes" count, when the snapshot was streamed
+    if has_crash_records(dataset):
+        table, positions = dataset["crashes"], filtered_records(dataset, state)
+    else:
+        table, positions = filtered_positions(dataset, state)
+    return table if positions is None else table.take(positions)
+
+
+def manufacturer_daily_rows(dataset, state, table, positions):
+    # (Aircraft Manufacturer, Date, Survivors) rows matching a filter state.
+    # Streamed snapshots only keep survivors per manufacturer and day, so
+    # there the manufacturer filter is the only one that applies.
+    if not has_crash_records(dataset):
+        manufacturer = dict(zip(STATE_COLUMNS, state))["Aircraft Manufacturer"]
+        rows = dataset["manufacturer_days"]
+        matched = filter_positions(dataset["manufacturer_day_index"], {"Aircraft Manufacturer": manufacturer})
+    else:
+        records = dataset["crashes"]
+        rows = records[MANUFACTURER_DAY_DIMENSIONS + ["Survivors"]]
+        matched = positions if table is records else filtered_records(dataset, state)
+    return rows if matched is None else rows.take(matched)
+
+
+def filtered_aggregates(dataset, state):
+    # Data for every filter-dependent dashboard section in one pass over the
+    # filtered cells (or records) of a store snapshot
+    table, positions = filtered_positions(dataset, state)
+    by_dimension = {column: dimension_totals(table, column, positions) for column in SECTION_DIMENSIONS}
+
+    # Survivors per day and manufacturer
+    manufacturer_daily = (
+        manufacturer_daily_rows(dataset, state, table, positions)
+            .groupby(MANUFACTURER_DAY_DIMENSIONS, observed=True)["Survivors"]
+            .sum()
+            .reset_index()
+    )
+
+    return section_results(
+        len(table) if positions is None else len(positions),
+        measure_totals(table, positions),
+        by_dimension,
+        manufacturer_daily,
+        dataset["country_iso"],
+    )
+
+
+def section_results(rows, totals, by_dimension, manufacturer_daily, country_iso):
+    # Every section's data from the measure totals per section dimension,
+    # whichever backend summed them; frozen so that the one result can be
+    # shared by every session that asks for the same state
+    by_manufacturer = by_dimension["Aircraft Manufacturer"]
+    by_continent = by_dimension["Continent"]
+    by_quarter = by_dimension["Quarter"]
+    by_country = by_dimension["Country/Region"]
+    by_aircraft = by_dimension["Aircraft"]
+
+    country_survival = by_country[["Country/Region", "Survivors", "Fatalities (air)", "Aboard"]].rename(
+        columns={"Country/Region": "Country", "Fatalities (air)": "Fatalities"}
+    )
+    # NaN where nobody was aboard, as in aircrash.intervals: there is no rate to show
+    country_survival["Survival_Rate"] = country_survival["Survivors"] / country_survival["Aboard"] * 100
+    # ISO-3 codes were resolved once when the data loaded
+    country_survival["ISO"] = country_iso.reindex(country_survival["Country"]).to_numpy()
+
+    return freeze({
+        "rows": rows,
+        "totals": totals,
+        "manufacturer_fatalities": top_n(by_manufacturer, "Fatalities (air)", 10)[["Aircraft Manufacturer", "Fatalities (air)"]],
+        "continent_summary": by_continent[["Continent", "Crashes", "Fatalities (air)"]].rename(
+            columns={"Crashes": "Crash_Count", "Fatalities (air)": "Total_Fatalities"}
+        ),
+        "type_crashes": top_n(by_aircraft, "Crashes", 10)[["Aircraft", "Crashes"]].rename(columns={"Crashes": "Crash_Count"}),
+        "quarter_summary": by_quarter[["Quarter", "Fatalities (air)", "Survivors"]].rename(
+            columns={"Fatalities (air)": "Fatalities"}
+        ),
+        "survivors_by_continent": top_n(by_continent, "Survivors", len(by_continent))[["Continent", "Survivors"]],
+        "manufacturer_survivors": top_n(by_manufacturer, "Survivors", len(by_manufacturer))["Aircraft Manufacturer"].tolist(),
+        "manufacturer_daily": manufacturer_daily,
+        "country_survival": country_survival,
+    })
+
+
+# --- ROLLING STATISTICS ---
+def time_rolling_mean(frame, group_col, date_col, value_col, window):
+    # Trailing time-window mean of `value_col` within each group, matching
+    # groupby(group).rolling(window, min_periods=1) over a date index: each
+    # row averages the rows of its group dated in (date - window, date].
+    # All groups are done at once with cumulative sums and a binary search.
+    window_days = pd.Timedelta(window).days
+    days = frame[date_col].to_numpy("datetime64[D]").astype("int64")
+    codes = pd.factorize(frame[group_col])[0]
+    values = frame[value_col].to_numpy(dtype="float64")
+    if not len(values):
+        return values
+
+    # One sorted key per row: groups laid end to end with a gap wider than the window
+    order = np.lexsort((days, codes))
+    offsets = days - days.min()
+    stride = int(offsets.max()) + window_days + 1
+    keys = codes[order] * stride + offsets[order]
+
+    start = np.searchsorted(keys, keys - window_days + 1, side="left")
+    end = np.arange(1, len(keys) + 1)
+    totals = np.concatenate(([0.0], np.cumsum(values[order])))
+
+    means = np.empty(len(values))
+    means[order] = (totals[end] - totals[start]) / (end - start)
+    return means
+
+
+def top_manufacturer_moving_average(aggregates, top, window):
+    # Daily survivors and their moving average for the `top` manufacturers
+    # with the most survivors in a state's section aggregates
+    leaders = aggregates["manufacturer_survivors"][:top]
+    daily = aggregates["manufacturer_daily"]
+    daily = daily[daily["Aircraft Manufacturer"].isin(leaders)].reset_index(drop=True)
+    daily["Moving_Avg"] = time_rolling_mean(daily, "Aircraft Manufacturer", "Date", "Survivors", window)
+    # Chronological rows so every manufacturer's line is drawn in date order
+    return freeze({"daily": daily.sort_values("Date", kind="stable").reset_index(drop=True), "leaders": leaders})
@@ -0,0 +1,311 @@
+"""Headless JSON API over the dashboard's aggregations, no Streamlit needed.
+
+Every endpoint takes the sidebar's filters as query parameters (year,
+country, continent, quarter and the search's aircraft and manufacturer,
+repeated to select several values, and from/to dates; "All" when omitted)::
+
+    python -m aircrash.api --port 8502
+    curl 'http://127.0.0.1:8502/kpis?continent=Europe&continent=Asia&quarter=Qtr%203&from=1990-01-01&to=2010-12-31'
+
+Responses are cached per endpoint and filter state and carry an ETag derived
+from the data version, so polling clients revalidate with If-None-Match and
+get a 304 without anything being recomputed. GET /metrics returns the
+per-endpoint latency histograms in Prometheus text format.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import date
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from . import metrics
+from .aggregations import (
+    CUBE_MEASURES,
+    STREAMED_DATES,
+    filtered_aggregates,
+    filtered_positions,
+    has_crash_records,
+    rollup,
+)
+from .data import DATA_PATH
+from .filters import FILTERS, SEARCH_FILTERS
+from .ingest import DEFAULT_CHUNKSIZE
+from .store import DataStore, state_revision
+
+RESPONSE_CACHE_SIZE = 1024  # cached response bodies, least recently used evicted first
+AGGREGATE_CACHE_SIZE = 256  # filter states whose section aggregates are kept
+DEFAULT_REFRESH_SECONDS = 5.0
+
+
+def records(frame):
+    # JSON-ready rows, with missing values as null
+    return frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+
+
+def to_builtin(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.date().isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+# Endpoints get the snapshot, the filter state and `aggregates`, which returns
+# filtered_aggregates() for that state from a cache shared by every endpoint
+def kpis(dataset, state, aggregates):
+    totals = aggregates()["totals"]
+    payload = {measure: int(totals[measure]) for measure in CUBE_MEASURES}
+    payload["Survival_Rate"] = payload["Survivors"] / payload["Aboard"] * 100 if payload["Aboard"] else None
+    return payload
+
+
+def yearly_trend(dataset, state, aggregates):
+    table, positions = filtered_positions(dataset, state)
+    if positions is not None and not len(positions):
+        return records(pd.DataFrame(columns=["Year"] + CUBE_MEASURES))
+    return records(rollup(table, positions, by="Year"))
+
+
+def top_manufacturers(dataset, state, aggregates):
+    return records(aggregates()["manufacturer_fatalities"])
+
+
+def continents(dataset, state, aggregates):
+    sections = aggregates()
+    summary = sections["continent_summary"].merge(sections["survivors_by_continent"], on="Continent")
+    return records(summary)
+
+
+def survival(dataset, state, aggregates):
+    country_survival = aggregates()["country_survival"]
+    return records(country_survival.sort_values("Survival_Rate", ascending=False, kind="stable"))
+
+
+ENDPOINTS = {
+    "/kpis": kpis,
+    "/yearly-trend": yearly_trend,
+    "/top-manufacturers": top_manufacturers,
+    "/continents": continents,
+    "/survival": survival,
+}
+
+
+def parse_state(query):
+    # The filter state for the query string, as the sidebar would pass it to
+    # the aggregates: a repeated parameter selects several values, `from` and
+    # `to` bound the dates (inclusive)
+    params = parse_qs(query)
+    state = []
+    for key in [key for key, _, _ in FILTERS] + [key for key, _ in SEARCH_FILTERS]:
+        values = [value for value in params.get(key, []) if value != "All"]
+        if key == "year":
+            values = [int(value) for value in values]
+        state.append(tuple(sorted(set(values))) or "All")
+    dates = tuple(
+        None if bound not in params else date.fromisoformat(params[bound][-1]).isoformat() for bound in ("from", "to")
+    )
+    state.append("All" if dates == (None, None) else dates)
+    return tuple(state)
+
+
+class BuildCache:
+    # Values keyed by endpoint or filter state and data revision, evicted
+    # least recently used first. A value being built is never built twice:
+    # concurrent misses on one key wait for the first. `counted` caches note
+    # their hits and misses in the section metrics.
+
+    def __init__(self, max_entries, counted=True):
+        self.max_entries = max_entries
+        self.counted = counted
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                self._values.move_to_end(key)
+                self.hits += 1
+                if self.counted:
+                    metrics.note_hit()
+                return value
+            self.misses += 1
+            if self.counted:
+                metrics.note_miss()
+            # The first caller to miss claims the build; later ones wait on it
+            pending = self._pending.get(key)
+            if pending is None:
+                owned = self._pending[key] = Future()
+
+        return pending.result() if pending is not None else self._build(key, build, owned)
+
+    def _build(self, key, build, future):
+        try:
+            value = build()
+        except BaseException as error:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_exception(error)
+            raise
+        with self._lock:
+            self._pending.pop(key, None)
+            self._values[key] = value
+            while len(self._values) > self.max_entries:
+                self._values.popitem(last=False)
+        future.set_result(value)
+        return value
+
+
+class AnalyticsAPI:
+    # Endpoint dispatch over one DataStore, polled for appended rows in the
+    # background so responses follow the CSV like the dashboard does
+
+    def __init__(self, store, refresh_seconds=DEFAULT_REFRESH_SECONDS, cache_size=RESPONSE_CACHE_SIZE):
+        self.store = store
+        self.cache = BuildCache(cache_size)
+        self.aggregate_cache = BuildCache(AGGREGATE_CACHE_SIZE, counted=False)
+        self.refresh_seconds = refresh_seconds
+        self._stopped = threading.Event()
+
+    def cache_key(self, path, state, dataset=None):
+        dataset = dataset or self.store.snapshot
+        return (path, state, dataset["version"], state_revision(dataset, state))
+
+    @staticmethod
+    def etag(key):
+        return '"' + hashlib.sha1(repr(key).encode()).hexdigest()[:20] + '"'
+
+    def respond(self, path, state):
+        # One snapshot for both the key and the body, even if refresh() swaps it
+        dataset = self.store.snapshot
+        key = self.cache_key(path, state, dataset)
+        with metrics.section("api" + path):
+            return self.etag(key), self.cache.get_or_build(key, lambda: self.body(key, dataset, state))
+
+    def body(self, key, dataset, state):
+        # The encoded response for `key`; the section aggregates are built once
+        # per state and data revision, whichever endpoint asks first
+        path, aggregate_key = key[0], key[1:]
+
+        def aggregates():
+            return self.aggregate_cache.get_or_build(aggregate_key, lambda: filtered_aggregates(dataset, state))
+
+        return json.dumps(ENDPOINTS[path](dataset, state, aggregates), default=to_builtin).encode()
+
+    def watch(self):
+        while not self._stopped.wait(self.refresh_seconds):
+            self.store.refresh()
+
+    def start_watching(self):
+        if self.refresh_seconds:
+            threading.Thread(target=self.watch, name="aircrash-api-refresh", daemon=True).start()
+
+    def stop(self):
+        self._stopped.set()
+
+
+def make_handler(api):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            if url.path == "/":
+                return self.send_json(HTTPStatus.OK, json.dumps({"endpoints": sorted(ENDPOINTS)}).encode())
+            if url.path == "/metrics":
+                body = metrics.prometheus_text().encode()
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            if url.path not in ENDPOINTS:
+                return self.send_json(HTTPStatus.NOT_FOUND, b'{"error": "unknown endpoint"}')
+            try:
+                state = parse_state(url.query)
+            except ValueError:
+                return self.send_json(HTTPStatus.BAD_REQUEST, b'{"error": "year must be an integer and from/to ISO dates"}')
+            if state[-1] != "All" and not has_crash_records(api.store.snapshot):
+                return self.send_json(HTTPStatus.BAD_REQUEST, json.dumps({"error": STREAMED_DATES}).encode())
+
+            # Revalidation only needs the key, never the body
+            etag = api.etag(api.cache_key(url.path, state))
+            if etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                return
+            etag, body = api.respond(url.path, state)
+            self.send_json(HTTPStatus.OK, body, etag)
+
+        def send_json(self, status, body, etag=None):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if etag:
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(host="127.0.0.1", port=8502, store=None, refresh_seconds=DEFAULT_REFRESH_SECONDS):
+    # A ThreadingHTTPServer answering on (host, port); the caller runs
+    # serve_forever() and owns shutdown
+    api = AnalyticsAPI(store or DataStore(DATA_PATH), refresh_seconds)
+    api.start_watching()
+    server = ThreadingHTTPServer((host, port), make_handler(api))
+    server.daemon_threads = True
+    server.api = api
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the dashboard aggregations as a JSON API.")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to bind (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8502, help="port to listen on (default: %(default)s)")
+    parser.add_argument("--data", default=DATA_PATH, help="crash CSV (default: %(default)s)")
+    parser.add_argument(
+        "--ingest", choices=["memory", "stream"], default=os.environ.get("AIRCRASH_INGEST", "memory"),
+        help="load every row or only the aggregates"
+    )
+    parser.add_argument(
+        "--refresh", type=float, default=DEFAULT_REFRESH_SECONDS,
+        help="seconds between checks for appended rows (0 turns it off)"
+    )
+    args = parser.parse_args(argv)
+
+    store = DataStore(args.data, args.ingest, int(os.environ.get("AIRCRASH_CHUNKSIZE", DEFAULT_CHUNKSIZE)))
+    server = serve(args.host, args.port, store, args.refresh)
+    print(f"serving {', '.join(sorted(ENDPOINTS))} on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.api.stop()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""Query backends behind the dashboard: in-process pandas cubes or embedded DuckDB.
+
+Both answer the same questions (section aggregates per filter state, the
+unfiltered roll-ups, the sidebar's remaining options and the date span) and
+return the same frames, so the app does not care which one runs. AIRCRASH_BACKEND
+picks one::
+
+    AIRCRASH_BACKEND=duckdb streamlit run app.py
+
+"pandas" (the default) keeps the crash records and cube in memory, or with
+AIRCRASH_INGEST=stream only the cube and daily tables (aircrash.ingest).
+"duckdb" keeps nothing resident: every question is one SQL query over the
+file, which only reads the columns it needs (projection pushdown), skips
+Parquet row groups outside the filters (predicate pushdown) and runs on every
+core, so the data may be larger than RAM. It reads the Parquet file the cleaning step writes
+next to the CSV whenever that is at least as new as the CSV, and the CSV
+otherwise. duckdb is an optional dependency.
+"""
+
+import datetime
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from .aggregations import (
+    CUBE_MEASURES,
+    RECORD_DIMENSIONS,
+    SECTION_DIMENSIONS,
+    STREAMED_DATES,
+    filter_source,
+    filtered_aggregates,
+    filtered_cells,
+    has_crash_records,
+    rollup,
+    section_results,
+)
+from .data import COLUMN_DTYPES, DATA_PATH, file_fingerprint, iso_lookup, unresolved_countries
+from .filters import DATE_COLUMN, STATE_COLUMNS, as_values, filter_options, filter_positions, is_all, make_state
+from .ingest import DEFAULT_CHUNKSIZE
+from .store import DataStore
+
+BACKENDS = ("pandas", "duckdb")
+
+
+def make_backend(name, path=DATA_PATH, mode="memory", chunksize=DEFAULT_CHUNKSIZE):
+    if name == "pandas":
+        return PandasBackend(DataStore(path, mode, chunksize))
+    if name == "duckdb":
+        return DuckDBBackend(path)
+    raise ValueError(f"unknown backend {name!r}, expected one of {', '.join(BACKENDS)}")
+
+
+class PandasBackend:
+    # The in-memory cubes and filter indexes of a DataStore
+
+    name = "pandas"
+
+    def __init__(self, store):
+        self.store = store
+
+    @property
+    def version(self):
+        snapshot = self.store.snapshot
+        return snapshot["version"], snapshot["revision"]
+
+    def refresh(self):
+        return self.store.refresh()
+
+    def cache_token(self, state):
+        # Changes whenever the results for `state` may have changed
+        return self.store.snapshot["version"], self.store.state_revision(state)
+
+    def aggregates(self, state):
+        return filtered_aggregates(self.store.snapshot, state)
+
+    def rollup(self, by):
+        return rollup(self.store.snapshot["cube"], by=by)
+
+    def cells(self, state, columns):
+        # `columns` of the crash records matching `state`, or of the cube
+        # cells when streamed
+        return filtered_cells(self.store.snapshot, state)[columns]
+
+    def options(self, selections, column):
+        _, index = filter_source(self.store.snapshot, selections)
+        return filter_options(index, selections, column)
+
+    @property
+    def filters_dates(self):
+        # Whether states may carry a date range; streamed snapshots keep no crash records
+        return has_crash_records(self.store.snapshot)
+
+    def date_range(self, selections=None):
+        # First and last crash date under `selections` (every crash when
+        # None); None when no crash matches
+        snapshot = self.store.snapshot
+        if not has_crash_records(snapshot):
+            # The daily totals carry no other column to filter on
+            if filter_positions(snapshot["cube_index"], selections or {}) is not None:
+                raise ValueError(STREAMED_DATES)
+            dates = snapshot["days"][DATE_COLUMN]
+            return (dates.min().date(), dates.max().date()) if len(dates) else None
+        index = snapshot["crash_index"]
+        keys = index[DATE_COLUMN]["keys"]
+        positions = filter_positions(index, selections or {})
+        if positions is not None:
+            keys = keys[positions]
+        if not len(keys):
+            return None
+        return pd.Timestamp(keys.min()).date(), pd.Timestamp(keys.max()).date()
+
+    def unresolved_countries(self):
+        return self.store.snapshot["unresolved_countries"]
+
+
+# --- DUCKDB ---
+SQL_TYPES = {"int8": "TINYINT", "int16": "SMALLINT", "category": "VARCHAR"}
+SUMS = ", ".join(["count(*) AS Crashes"] + [f'sum("{m}")::BIGINT AS "{m}"' for m in CUBE_MEASURES[1:]])
+
+
+def quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def literal(text):
+    return "'" + text.replace("'", "''") + "'"
+
+
+def source_path(path):
+    # The Parquet copy next to a CSV when it is at least as new, else the file itself
+    path = Path(path)
+    parquet = path.with_suffix(".parquet")
+    if path.suffix == ".csv" and parquet.exists() and parquet.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+        return parquet
+    return path
+
+
+def scan_sql(source):
+    # Table function reading `source`, with the CSV columns typed as pandas types them
+    if source.suffix == ".parquet":
+        return f"read_parquet({literal(source.as_posix())})"
+    header = pd.read_csv(source, nrows=0).columns
+    types = {column: SQL_TYPES.get(str(COLUMN_DTYPES[column]), "VARCHAR") for column in header if column in COLUMN_DTYPES}
+    types[DATE_COLUMN] = "DATE"
+    struct = ", ".join(f"{literal(column)}: {literal(sql_type)}" for column, sql_type in types.items())
+    return f"read_csv({literal(source.as_posix())}, header = true, types = {{{struct}}})"
+
+
+def where_clause(state, skip=None):
+    # SQL predicate and parameters for a filter state, leaving out `skip`
+    clauses, params = [], []
+    for column, value in zip(STATE_COLUMNS, state):
+        if column == skip or is_all(value):
+            continue
+        if column == DATE_COLUMN:
+            start, end = value
+            if start is not None:
+                clauses.append(f"{quote(column)} >= ?")
+                params.append(datetime.date.fromisoformat(start))
+            if end is not None:
+                clauses.append(f"{quote(column)} <= ?")
+                params.append(datetime.date.fromisoformat(end))
+        else:
+            values = [int(v) if column == "Year" else v for v in as_values(value)]
+            clauses.append(f"{quote(column)} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+class DuckDBBackend:
+    # SQL over the data file through one embedded DuckDB database; each
+    # query runs on its own cursor, so sessions can query concurrently
+
+    name = "duckdb"
+
+    def __init__(self, path=DATA_PATH, threads=None):
+        try:
+            import duckdb
+        except ImportError as error:
+            raise ImportError("the duckdb backend needs the duckdb package (pip install duckdb)") from error
+        self.path = Path(path)
+        self._connection = duckdb.connect()
+        if threads:
+            self._connection.execute(f"SET threads = {int(threads)}")
+        self._lock = threading.Lock()
+        self._open()
+
+    def _open(self):
+        # (Re)define the view over the current source file
+        source = source_path(self.path)
+        stat = source.stat()
+        scan = scan_sql(source)
+        # The crash records drop rows missing a dimension or the date; so does the view
+        present = " AND ".join(f"{quote(column)} IS NOT NULL" for column in RECORD_DIMENSIONS)
+        self._connection.execute(f"CREATE OR REPLACE VIEW cells AS SELECT * FROM {scan} WHERE {present}")
+        countries = self.query(f'SELECT DISTINCT {quote("Country/Region")} AS name FROM cells')["name"]
+        self._state = {
+            "source": source,
+            "stat": (stat.st_size, stat.st_mtime_ns),
+            "version": file_fingerprint(source, stat)["sha256"],
+            "country_iso": iso_lookup(countries.sort_values()),
+            "unresolved_countries": tuple(unresolved_countries(countries)),
+        }
+
+    def query(self, sql, params=()):
+        return self._connection.cursor().execute(sql, list(params)).df()
+
+    @property
+    def version(self):
+        return self._state["version"], 0
+
+    def refresh(self):
+        # Reopen when the source file changed; every cached result goes with the version
+        with self._lock:
+            source = source_path(self.path)
+            stat = source.stat()
+            if (source, (stat.st_size, stat.st_mtime_ns)) == (self._state["source"], self._state["stat"]):
+                return False
+            version = self._state["version"]
+            self._open()
+            return self._state["version"] != version
+
+    filters_dates = True
+
+    def cache_token(self, state):
+        return self._state["version"], 0
+
+    def aggregates(self, state):
+        where, params = where_clause(state)
+        dimensions = ", ".join(quote(column) for column in SECTION_DIMENSIONS)
+        sets = ", ".join(f"({quote(column)})" for column in SECTION_DIMENSIONS)
+        # One scan sums every section dimension and the grand total at once
+        grouped = self.query(
+            f"SELECT {dimensions}, grouping({dimensions}) AS grouping_id, {SUMS} "
+            f"FROM cells{where} GROUP BY GROUPING SETS ({sets}, ())",
+            params,
+        )
+        width = len(SECTION_DIMENSIONS)
+        by_dimension = {}
+        for i, column in enumerate(SECTION_DIMENSIONS):
+            # grouping() sets a bit for every column not grouped on, first column highest
+            rows = grouped[grouped["grouping_id"] == (2 ** width - 1) ^ (1 << (width - 1 - i))]
+            by_dimension[column] = (
+                rows[[column] + CUBE_MEASURES].sort_values(column, kind="stable").reset_index(drop=True)
+            )
+        # The empty grouping set always yields one row; its sums are NULL when nothing matched
+        total = grouped[grouped["grouping_id"] == 2 ** width - 1].iloc[0]
+        totals = total[CUBE_MEASURES].fillna(0).astype("int64").rename(None)
+
+        manufacturer_daily = self.query(
+            f'SELECT {quote("Aircraft Manufacturer")}, {quote(DATE_COLUMN)}, sum("Survivors")::BIGINT AS "Survivors" '
+            f"FROM cells{where} GROUP BY ALL ORDER BY ALL",
+            params,
+        )
+        return section_results(
+            int(totals["Crashes"]), totals, by_dimension, manufacturer_daily, self._state["country_iso"]
+        )
+
+    def rollup(self, by):
+        return self.query(f"SELECT {quote(by)}, {SUMS} FROM cells GROUP BY ALL ORDER BY ALL")
+
+    def cells(self, state, columns):
+        # The crash records matching `state`, one row per crash like the
+        # pandas backend's loaded rows
+        where, params = where_clause(state)
+        return self.query(f"SELECT {', '.join(quote(column) for column in columns)} FROM cells{where}", params)
+
+    def options(self, selections, column):
+        where, params = where_clause(make_state(selections), skip=column)
+        values = self.query(f"SELECT DISTINCT {quote(column)} AS value FROM cells{where}", params)["value"]
+        return sorted(int(v) if column == "Year" else v for v in values)
+
+    def date_range(self, selections=None):
+        where, params = where_clause(make_state(selections or {}))
+        span = self.query(
+            f"SELECT min({quote(DATE_COLUMN)}) AS first, max({quote(DATE_COLUMN)}) AS last FROM cells{where}", params
+        )
+        if pd.isna(span["first"].iloc[0]):
+            return None
+        return span["first"].iloc[0].date(), span["last"].iloc[0].date()
+
+    def unresolved_countries(self):
+        return self._state["unresolved_countries"]
+
+
+def write_parquet(path, output=None, row_group_size=122_880):
+    # Copy the CSV at `path` to Parquet (next to it by default) sorted by
+    # date, so row-group statistics let date filters skip most of the file;
+    # DuckDB streams the copy and spills the sort to disk when needed
+    import duckdb
+
+    path = Path(path)
+    output = Path(output or path.with_suffix(".parquet"))
+    duckdb.connect().execute(
+        f"COPY (SELECT * FROM {scan_sql(path)} ORDER BY {quote(DATE_COLUMN)}) TO {literal(output.as_posix())} "
+        f"(FORMAT parquet, ROW_GROUP_SIZE {int(row_group_size)})"
+    )
+    return output
@@ -0,0 +1,429 @@
+"""Plotly figure builders for the dashboard, a figure cache and trace downsampling.
+
+Plotly is imported inside each builder rather than at module level: a
+figure served from the cache never loads plotly.express or
+plotly.graph_objects, and a cold start only pays for the chart types that
+actually render.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+
+from . import metrics
+from .payload import figure_json
+
+manufacturer_col = "Aircraft Manufacturer"
+fatal_col = "Fatalities (air)"
+
+MOVING_AVERAGE_WINDOWS = {"7D": "7-day", "90D": "90-day", "365D": "365-day"}
+
+
+# --- FIGURE CACHE ---
+FIGURE_CACHE_BUDGET = 64 * 1024 * 1024  # bytes of figure JSON kept in memory
+
+
+class FigureCache:
+    # Compact figure JSON (aircrash.payload) keyed by chart id and the
+    # identity of the chart's input, evicted least recently used first once
+    # over budget.
+    # prefetch() builds a figure on a thread pool ahead of its get_or_build();
+    # a figure being built is never built twice, whoever asks for it.
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._specs = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            spec = self._specs.get(key)
+            if spec is not None:
+                self._specs.move_to_end(key)
+                self.hits += 1
+                metrics.note_hit()
+                return json.loads(spec)
+            self.misses += 1
+            metrics.note_miss()
+            # The first caller to miss claims the build; later ones wait on it
+            pending = self._pending.get(key)
+            if pending is None:
+                owned = self._pending[key] = Future()
+
+        spec = pending.result() if pending is not None else self._build(key, build, owned)
+        return json.loads(spec)
+
+    def prefetch(self, key, build, pool):
+        # Start building `key` on `pool` unless it is cached or already on its way
+        with self._lock:
+            if key in self._specs or key in self._pending:
+                return
+            owned = self._pending[key] = Future()
+        pool.submit(self._build, key, build, owned)
+
+    def _build(self, key, build, future):
+        try:
+            spec = figure_json(build())
+        except BaseException as error:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_exception(error)
+            raise
+        with self._lock:
+            self._pending.pop(key, None)
+            if key not in self._specs:
+                self._specs[key] = spec
+                self.size += len(spec)
+            while self.size > self.budget and len(self._specs) > 1:
+                _, evicted = self._specs.popitem(last=False)
+                self.size -= len(evicted)
+        future.set_result(spec)
+        return spec
+
+
+# --- DOWNSAMPLING ---
+POINT_BUDGET = 1500  # most points sent to the browser per time-series trace
+WEBGL_THRESHOLD = 1000  # above this many points a chart renders with WebGL
+
+
+def downsample_minmax(frame, x_col, y_col, group_col=None, budget=POINT_BUDGET):
+    # Cap every trace at `budget` points by splitting its x range into
+    # budget / 2 equal buckets and keeping each bucket's lowest and highest
+    # y, so spikes survive however far the series is thinned
+    if len(frame) <= budget:
+        return frame
+    x = frame[x_col].to_numpy()
+    x = x.astype("datetime64[ns]").astype("int64") if np.issubdtype(x.dtype, np.datetime64) else x.astype("float64")
+    y = frame[y_col].to_numpy(dtype="float64")
+    codes = np.zeros(len(frame), dtype="int64") if group_col is None else pd.factorize(frame[group_col])[0]
+
+    buckets = max(budget // 2, 1)
+    counts = np.bincount(codes)
+    x_min = np.full(len(counts), np.inf)
+    x_max = np.full(len(counts), -np.inf)
+    np.minimum.at(x_min, codes, x)
+    np.maximum.at(x_max, codes, x)
+    span = np.where(x_max > x_min, x_max - x_min, 1.0)[codes]
+    bucket = np.minimum(((x - x_min[codes]) / span * buckets).astype("int64"), buckets - 1)
+    # Traces already within budget keep every point (one bucket per row)
+    small = counts[codes] <= budget
+    bucket[small] = np.arange(len(frame))[small]
+
+    # Sort by (trace, bucket, y): a bucket's first row is its min, last its max
+    key = codes * len(frame) + bucket
+    order = np.lexsort((y, key))
+    sorted_key = key[order]
+    first = np.flatnonzero(np.r_[True, sorted_key[1:] != sorted_key[:-1]])
+    last = np.r_[first[1:] - 1, len(order) - 1]
+    keep = np.unique(np.concatenate((order[first], order[last])))
+    return frame.iloc[keep]
+
+
+def visible_moving_average(moving_average, start, end):
+    # A manufacturer moving average (aggregations.manufacturer_moving_average)
+    # over the full history, clipped to the visible date range and thinned
+    # to the point budget per manufacturer
+    daily = moving_average["daily"]
+    visible = daily[daily["Date"].between(pd.Timestamp(start), pd.Timestamp(end))]
+    return downsample_minmax(visible, "Date", "Moving_Avg", manufacturer_col), moving_average["leaders"]
+
+
+# --- FIGURES ---
+def yearly_trend_figure(yearly_trend):
+    import plotly.express as px
+
+    yearly_trend = downsample_minmax(yearly_trend, "Year", "Crash_Count")
+    # Plot line chart with color
+    fig = px.line(
+        yearly_trend,
+        x="Year",
+        y="Crash_Count",
+        title="✈️ Global Air Crash Trend Over Time",
+        markers=True,
+        line_shape='linear',
+        render_mode="webgl" if len(yearly_trend) > WEBGL_THRESHOLD else "svg",
+    )
+
+    # Update line color to crimson/red
+    fig.update_traces(line=dict(color='crimson', width=3), marker=dict(color='crimson'))
+
+    # Style layout
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Year",
+        yaxis_title="Number of Crashes",
+        title_font_size=20,
+    )
+    return fig
+
+
+def yearly_summary_figure(yearly_summary):
+    import plotly.express as px
+
+    # --- Plotly Combined Bar Chart with colors ---
+    fig = px.bar(
+        yearly_summary,
+        x="Year",
+        y=["Crash_Count", "Total_Fatalities"],
+        barmode="group",  # bars side by side
+        labels={"value": "Count", "variable": "Metric"},
+        title="📊 Total Crashes and Fatalities Per Year",
+        color_discrete_map={
+            "Crash_Count": "#2196F3",       
+            "Total_Fatalities": "#f44336"    
+        }
+    )
+
+    # Layout styling
+    fig.update_layout(
+        title_font_size=20,
+        xaxis_title="Year",
+        yaxis_title="Count",
+        legend_title="Metric",
+        xaxis_tickangle=-45,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+def manufacturer_fatalities_figure(manufacturer_fatalities):
+    import plotly.express as px
+
+    # Plot column/bar chart
+    fig = px.bar(
+        manufacturer_fatalities,
+        x=manufacturer_col,
+        y=fatal_col,
+        text=fatal_col,
+        color=fatal_col,
+        color_continuous_scale="Reds",
+        title="✈️ Top 10 Aircraft Manufacturers by Air Fatalities"
+    )
+
+    fig.update_layout(
+        xaxis_title="Manufacturer",
+        yaxis_title="Total Air Fatalities",
+        title_font_size=20
+    )
+
+    fig.update_traces(texttemplate='%{text}', textposition='outside')
+    return fig
+
+
+def top_countries_figure(top_countries):
+    import plotly.express as px
+
+    # Horizontal bar chart with color
+    fig = px.bar(
+        top_countries,
+        x="Crash_Count",
+        y="Country/Region",
+        orientation='h',
+        text="Crash_Count",
+        title="🛩️ Top 10 Countries by Air Crashes",
+        color="Crash_Count",
+        color_continuous_scale="Reds"  # gradient from light to dark red
+    )
+    fig.update_layout(
+        xaxis_title="Number of Crashes",
+        yaxis_title="Country",
+        yaxis=dict(autorange="reversed"),  # highest at top
+        title_font_size=20,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        coloraxis_colorbar=dict(title="Crash Count")
+    )
+    return fig
+
+
+def continent_summary_figure(continent_summary):
+    import plotly.express as px
+
+    fig = px.bar(
+        continent_summary,
+        x="Continent",
+        y=["Crash_Count", "Total_Fatalities"],
+        barmode="group",
+        labels={"value": "Count", "variable": "Metric"},
+        title="🌍 Air Crash Patterns by Continent",
+        color_discrete_map={
+            "Crash_Count": "#2196F3",        
+            "Total_Fatalities": "#f44336"    
+        }
+    )
+    # Layout styling
+    fig.update_layout(
+        title_font_size=20,
+        xaxis_title="Continent",
+        yaxis_title="Count",
+        legend_title="Metric",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+def type_crashes_figure(top_types):
+    import plotly.express as px
+
+    fig = px.funnel(
+        top_types,
+        x="Crash_Count",
+        y="Aircraft",
+        title="✈️ Top Aircraft Types Most Involved in Crashes",
+    )
+    # Set all bars to crimson
+    fig.update_traces(marker=dict(color='crimson'))
+
+    # Layout styling
+    fig.update_layout(
+        title_font_size=20,
+        xaxis_title="Crash Count",
+        yaxis_title="Aircraft",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+    return fig
+
+
+def quarter_summary_figure(quarter_summary):
+    import plotly.express as px
+
+    #  MELT TO LONG FORM
+    long_df = quarter_summary.melt(
+        id_vars="Quarter",
+        value_vars=["Fatalities", "Survivors"],
+        var_name="Metric",
+        value_name="Count"
+    )
+    #  CREATE SCATTER PLOT
+    fig = px.scatter(
+        long_df,
+        x="Quarter",
+        y="Count",
+        color="Metric",
+        labels={"Count": "Number of People", "Quarter": "Quarter"},
+        title="📊 Trend of Air Fatalities and Survivors by Quarter",
+        color_discrete_map={"Fatalities": "red", "Survivors": "green"}
+    )
+    fig.update_traces(mode="markers+lines")
+    fig.update_layout(title_font_size=20, xaxis_title="Quarter", yaxis_title="Count", legend_title="Metric")
+    return fig
+
+
+def survivors_by_continent_figure(survivors_by_continent):
+    import plotly.graph_objects as go
+
+    #  CREATE DOUGHNUT CHART
+    fig_survivors = go.Figure(
+        go.Pie(
+            labels=survivors_by_continent["Continent"],
+            values=survivors_by_continent["Survivors"],
+            hole=0.4,  # doughnut effect
+            textinfo="percent+label",
+            textposition="inside",
+            pull=[0.05]*len(survivors_by_continent),
+            marker=dict(
+                colors=[
+                    "#1f77b4", "#ff7f0e", "#2ca02c",
+                    "#d62728", "#9467bd", "#8c564b"
+                ],
+                line=dict(color="black", width=1)
+            )
+        )
+    )
+
+    fig_survivors.update_layout(
+        title="🌍 Share of Total Survivors by Continent",
+        title_font_size=20,
+        legend_title_text="Continent",
+        height=450,
+        width=450,
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)"
+    )
+    return fig_survivors
+
+
+def daily_summary_figure(daily_summary, leaders, window):
+    import plotly.express as px
+
+    # Define colors for each manufacturer, in survivor rank order
+    palette = px.colors.qualitative.D3
+    color_map = {name: palette[i % len(palette)] for i, name in enumerate(leaders)}
+    window_label = MOVING_AVERAGE_WINDOWS[window]
+    fig = px.line(
+        daily_summary,
+        x="Date",
+        y="Moving_Avg",
+        color=manufacturer_col,
+        labels={"Moving_Avg": f"Survivors ({window_label} MA)", "Date": "Date"},
+        title=f"📈 {window_label.capitalize()} Moving Average of Survivors by Top {len(leaders)} Manufacturers",
+        markers=True,
+        render_mode="webgl" if len(daily_summary) > WEBGL_THRESHOLD else "svg",
+        category_orders={manufacturer_col: leaders},
+        color_discrete_map=color_map  # assign specific colors
+    )
+    # Thicker lines and layout adjustments; the unified hover already heads
+    # each entry with the date, so a trace only adds its name and value
+    fig.update_traces(line=dict(width=4), hovertemplate="%{fullData.name}: %{y:.2f}<extra></extra>")
+    fig.update_layout(
+        title_font_size=24,
+        xaxis_title="Date",
+        yaxis_title="Number of Survivors",
+        legend_title="Manufacturer",
+        hovermode="x unified",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+def country_survival_figure(country_survival):
+    import plotly.graph_objects as go
+
+    # --- Choropleth Map ---
+    # Located by ISO-3 code, so Plotly does no name matching; the hover only
+    # carries the name plus survivors and aboard per country. A country with
+    # nobody aboard has no rate (NaN) and is left uncoloured rather than shown as 0%
+    mapped = country_survival.dropna(subset=["ISO"])
+    fig = go.Figure(go.Choropleth(
+        locations=mapped["ISO"],
+        z=mapped["Survival_Rate"].round(2),
+        text=mapped["Country"],
+        customdata=mapped[["Survivors", "Aboard"]].to_numpy(),
+        colorscale="greens",
+        colorbar_title="Survival_Rate",
+        hovertemplate="<b>%{text}</b><br>Survival_Rate=%{z:.2f}<br>Survivors=%{customdata[0]}<br>Aboard=%{customdata[1]}<extra></extra>",
+    ))
+
+    fig.update_layout(
+        title="🌍 Global Air-Crash Survival Rate by Country (%)",
+        title_font_size=20,
+        geo=dict(showframe=False, showcoastlines=True, projection_type="natural earth"),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+# Filter-dependent charts each drawn from the section aggregate of the same
+# name (aggregations.section_results), in page order
+SECTION_CHARTS = {
+    "manufacturer_fatalities": manufacturer_fatalities_figure,
+    "continent_summary": continent_summary_figure,
+    "type_crashes": type_crashes_figure,
+    "quarter_summary": quarter_summary_figure,
+    "survivors_by_continent": survivors_by_continent_figure,
+    "country_survival": country_survival_figure,
+}
@@ -0,0 +1,175 @@
+"""Batch cleaning of the raw crash export into the CSV the dashboard reads.
+
+Vectorized port of Cleaning_steps.ipynb. Every correction runs once per
+distinct value and the results are mapped back onto the rows by category
+code, so the cost follows the number of distinct names rather than rows::
+
+    python -m aircrash.cleaning datasets/aircrahesFullDataUpdated_2024.csv --seed 2024
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .corrections import (
+    AIRCRAFT_CORRECTIONS,
+    CONTINENTS,
+    COUNTRY_ALIASES,
+    MANUFACTURER_CORRECTIONS,
+    VALID_COUNTRIES,
+)
+from .data import COLUMN_DTYPES, DATA_PATH, ISO_COLUMN, MONTH_ORDER, UNKNOWN, iso_codes, unresolved_countries
+
+DEFAULT_SEED = 2024
+# Share of "Unknown" countries handed out to known ones, as in the notebook
+REDISTRIBUTE_SHARE = 0.95
+
+RAW_DTYPES = {
+    "Year": "int16",
+    "Quarter": "category",
+    "Month": "category",
+    "Day": "int8",
+    "Country/Region": "category",
+    "Aircraft Manufacturer": "category",
+    "Aircraft": "category",
+    "Location": "category",
+    "Operator": "category",
+    "Ground": "int16",
+    "Fatalities (air)": "int16",
+    "Aboard": "int16",
+}
+DROP_COLUMNS = ["Location", "Operator"]
+OUTPUT_COLUMNS = [
+    "Date", "Year", "Quarter", "Month", "Day", "Country/Region", "Aircraft Manufacturer",
+    "Aircraft", "Ground", "Fatalities (air)", "Aboard", "Survivors", "Continent", ISO_COLUMN,
+]
+MONTH_NUMBERS = {month: number for number, month in enumerate(MONTH_ORDER, start=1)}
+VALID_COUNTRY_LIST = sorted(VALID_COUNTRIES)
+
+
+def map_distinct(values, normalize, missing=UNKNOWN):
+    # Run `normalize` over the distinct values only and return a categorical
+    # with one entry per row. Missing rows factorize to -1, which picks the
+    # `missing` label appended at the end of the lookup table.
+    codes, uniques = pd.factorize(values)
+    cleaned = normalize(pd.Series(uniques.astype("str"), dtype="str"))
+    lookup = np.append(cleaned.to_numpy(dtype=object), missing)
+    lookup_codes, categories = pd.factorize(lookup, sort=True)
+    return pd.Categorical.from_codes(lookup_codes[codes], categories=categories)
+
+
+def normalize_countries(names):
+    titled = names.str.strip().str.title()
+    mapped = titled.map(COUNTRY_ALIASES).fillna(titled)
+    return mapped.where(mapped.isin(VALID_COUNTRY_LIST), UNKNOWN)
+
+
+def normalize_manufacturers(names):
+    return names.map(MANUFACTURER_CORRECTIONS).fillna(names)
+
+
+def normalize_aircraft(names):
+    return names.map(AIRCRAFT_CORRECTIONS).fillna(names)
+
+
+def lookup_continent(name):
+    # Only reached for countries missing from CONTINENTS; pycountry_convert is
+    # what the notebook used and stays optional here
+    try:
+        import pycountry_convert as pc
+    except ImportError:
+        return UNKNOWN
+    try:
+        country_code = pc.country_name_to_country_alpha2(name, cn_name_format="default")
+        return pc.convert_continent_code_to_continent_name(pc.country_alpha2_to_continent_code(country_code))
+    except (KeyError, ValueError):
+        return UNKNOWN
+
+
+def normalize_continents(names):
+    continents = names.map(CONTINENTS)
+    missing = continents.isna() & (names != UNKNOWN)
+    continents[missing] = names[missing].map(lookup_continent)
+    return continents.fillna(UNKNOWN)
+
+
+def redistribute_unknown(countries, seed=DEFAULT_SEED, share=REDISTRIBUTE_SHARE):
+    # Hand `share` of the "Unknown" rows to known countries drawn uniformly,
+    # from a seeded generator so that reruns give the same file
+    rng = np.random.default_rng(seed)
+    codes = countries.codes.copy()
+    categories = countries.categories
+    unknown_code = categories.get_loc(UNKNOWN) if UNKNOWN in categories else -1
+    known_codes = np.flatnonzero(np.bincount(codes, minlength=len(categories)))
+    known_codes = known_codes[known_codes != unknown_code]
+    unknown_rows = np.flatnonzero(codes == unknown_code)
+    count = int(len(unknown_rows) * share)
+    if count and len(known_codes):
+        chosen = rng.choice(unknown_rows, size=count, replace=False)
+        codes[chosen] = rng.choice(known_codes, size=count, replace=True)
+    return pd.Categorical.from_codes(codes, categories=categories).remove_unused_categories()
+
+
+def build_dates(df):
+    months = df["Month"].map(MONTH_NUMBERS).astype("float64")
+    return pd.to_datetime(
+        pd.DataFrame({"year": df["Year"], "month": months, "day": df["Day"]}), errors="coerce"
+    )
+
+
+def clean_frame(raw, seed=DEFAULT_SEED, share=REDISTRIBUTE_SHARE):
+    df = raw.drop(columns=DROP_COLUMNS, errors="ignore")
+    df["Date"] = build_dates(df)
+    countries = map_distinct(df["Country/Region"], normalize_countries)
+    countries = redistribute_unknown(countries, seed, share)
+    df["Country/Region"] = countries
+    df["Aircraft Manufacturer"] = map_distinct(df["Aircraft Manufacturer"], normalize_manufacturers)
+    df["Aircraft"] = map_distinct(df["Aircraft"], normalize_aircraft)
+    df["Survivors"] = df["Aboard"] - df["Fatalities (air)"]
+    df["Continent"] = map_distinct(countries, normalize_continents)
+    df[ISO_COLUMN] = iso_codes(df["Country/Region"])
+    df = df[OUTPUT_COLUMNS]
+    return df.astype({column: dtype for column, dtype in COLUMN_DTYPES.items() if column in df})
+
+
+def clean_file(raw_path, output=DATA_PATH, seed=DEFAULT_SEED, share=REDISTRIBUTE_SHARE):
+    # Clean the raw export at `raw_path` into `output` (CSV) plus a Parquet
+    # copy with the same stem next to it; returns the cleaned frame
+    raw = pd.read_csv(raw_path, dtype=RAW_DTYPES)
+    df = clean_frame(raw, seed, share)
+    output = Path(output)
+    df.to_csv(output, index=False)
+    df.to_parquet(output.with_suffix(".parquet"), index=False)
+    return df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Clean a raw crash export into the dashboard CSV and Parquet.")
+    parser.add_argument("raw", help="raw export, e.g. datasets/aircrahesFullDataUpdated_2024.csv")
+    parser.add_argument("-o", "--output", default=DATA_PATH, help="cleaned CSV (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed for the Unknown redistribution")
+    parser.add_argument(
+        "--share", type=float, default=REDISTRIBUTE_SHARE, help="share of Unknown countries to redistribute"
+    )
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    df = clean_file(args.raw, args.output, args.seed, args.share)
+    elapsed = time.perf_counter() - started
+
+    print(f"rows:          {len(df):,}")
+    print(f"countries:     {df['Country/Region'].nunique():,}")
+    print(f"manufacturers: {df['Aircraft Manufacturer'].nunique():,}")
+    print(f"aircraft:      {df['Aircraft'].nunique():,}")
+    print(f"unknown:       {(df['Country/Region'] == UNKNOWN).sum():,}")
+    unresolved = unresolved_countries(df["Country/Region"].cat.categories)
+    print(f"no ISO-3 code: {', '.join(unresolved) or 'none'}")
+    print(f"written:       {args.output} (+ {Path(args.output).with_suffix('.parquet').name})")
+    print(f"elapsed:       {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2922 @@
+"""Correction tables from Cleaning_steps.ipynb, lifted out of the per-row functions.
+
+The notebook rebuilt these dicts on every row; here they are built once at
+import and applied to distinct values only (see aircrash.cleaning).
+"""
+
+# Sub-national or variant names, matched after strip().title()
+COUNTRY_ALIASES = {
+    "Aichi": "Japan",
+    "Alabama": "United States",
+    " Alaska": "United States",
+    "Alaska": "United States",
+    "Alberta": "Canada",
+    "American": "United States",
+    "Arizona": "United States",
+    "Azores": "Portugal",
+    "Ayrshire": "United Kingdom",
+    "Bali": "Indonesia",
+    "Bavaria": "Germany",
+    "Beni": "Democratic Republic of the Congo",
+    "Bermuda": "United Kingdom",
+    "Boston": "United States",
+    "Brisbane": "Australia",
+    "Belgian": "Belgium",
+    "Brazil Amazonaves": "Brazil",
+    "Calabria": "Italy",
+    "California": "United States",
+    "Cameroons": "Cameroon",
+    "Canary": "Spain",
+    "Cape": "Cape Verde",
+    "Chicago": "United States",
+    "Colorado": "United States",
+    "Columbia": "United States",
+    "Connecticut": "United States",
+    "Corsica": "France",
+    "Cundinamarca": "Colombia",
+    "Chaina?": "China",
+    "D.C.Capital": "United States",
+    "Delaware": "United States",
+    "England": "United Kingdom",
+    "Florida": "United States",
+    "French": "France",
+    "Georgia": "United States",
+    "Greenland": "Denmark",
+    "Guam": "United States",
+    "Guantanamo": "Cuba",
+    "Guangxi": "China",
+    "Hawaii": "United States",
+    "Hong": "China",
+    "Idaho": "United States",
+    "Illinois": "United States",
+    "Indiana": "United States",
+    "India Pawan": "India",
+    "Iowa": "United States",
+    "Jersey": "United Kingdom",
+    "Jiangsu": "China",
+    "Kansas": "United States",
+    "Kent": "United Kingdom",
+    "Kentucky": "United States",
+    "Labrador": "Canada",
+    "Lancs": "United Kingdom",
+    "Leeward": "Antigua and Barbuda",
+    "London": "United Kingdom",
+    "Los": "United States",
+    "Louisiana": "United States",
+    "Macedonia": "North Macedonia",
+    "Maine": "United States",
+    "Manitoba": "Canada",
+    "Mariana": "United States",
+    "Margarita": "Venezuela",
+    "Martinique": "France",
+    "Maryland": "United States",
+    "Massachusetts": "United States",
+    "Michigan": "United States",
+    "Minnesota": "United States",
+    "Minnisota": "United States",
+    "Mississippi": "United States",
+    "Mississipi": "United States",
+    "Missouri": "United States",
+    "Montana": "United States",
+    "Nevada": "United States",
+    "Newfoundland": "Canada",
+    "Norway CHC": "Norway",
+    "Norrbotten": "Sweden",
+    "North": "South Africa",
+    "Northern": "United Kingdom",
+    "NSW": "Australia",
+    "NYUS": "United States",
+    "Ohio": "United States",
+    "Oklahoma": "United States",
+    "ON": "Canada",
+    "Ontario": "Canada",
+    "Oregon": "United States",
+    "Papua": "Papua New Guinea",
+    "Pennsylvania": "United States",
+    "Puerto": "Puerto Rico",
+    "Quebec": "Canada",
+    "Queensland": "Australia",
+    "Rhode": "United States",
+    "Rio": "Brazil",
+    "San": "San Marino",
+    "Sarawak": "Malaysia",
+    "Saudi": "Saudi Arabia",
+    "Scotland": "United Kingdom",
+    "Shetlands": "United Kingdom",
+    "Sicily": "Italy",
+    "SK": "South Korea",
+    "South": "South Africa",
+    "South-West": "Namibia",
+    "Sri": "Sri Lanka",
+    "Sulu": "Philippines",
+    "Surrey": "United Kingdom",
+    "Tennessee": "United States",
+    "Terceira": "Portugal",
+    "Texas": "United States",
+    "Trento": "Italy",
+    "Trinidad": "Trinidad and Tobago",
+    "U.S.": "United States",
+    "United": "United States",
+    "USSRAeroflot": "Russia",
+    "Utah": "United States",
+    "Valle": "Colombia",
+    "Vermont": "United States",
+    "Victoria": "Australia",
+    "Virgin": "Virgin Islands",
+    "Virginia": "United States",
+    "Vizcaya": "Spain",
+    "Wantagh": "United States",
+    "Washington": "United States",
+    "Warks": "United Kingdom",
+    "Wisconsin": "United States",
+    "Wisconson": "United States",
+    "WYUS": "United States",
+    "Yugoslavia": "Serbia",
+    "Yukon": "Canada",
+    "Zaire": "Democratic Republic of the Congo",
+}
+
+# Anything that does not land in this set after aliasing becomes "Unknown"
+VALID_COUNTRIES = frozenset({
+    "Afghanistan",
+    "Åland Islands",
+    "Albania",
+    "Algeria",
+    "American Samoa",
+    "Andorra",
+    "Angola",
+    "Anguilla",
+    "Antarctica",
+    "Antigua And Barbuda",
+    "Argentina",
+    "Armenia",
+    "Aruba",
+    "Australia",
+    "Austria",
+    "Azerbaijan",
+    "Bahamas",
+    "Bahrain",
+    "Bangladesh",
+    "Barbados",
+    "Belarus",
+    "Belgium",
+    "Belize",
+    "Benin",
+    "Bermuda",
+    "Bhutan",
+    "Bolivia",
+    "Bonaire, Sint Eustatius And Saba",
+    "Bosnia And Herzegovina",
+    "Botswana",
+    "Bouvet Island",
+    "Brazil",
+    "British Indian Ocean Territory",
+    "Brunei Darussalam",
+    "Bulgaria",
+    "Burkina Faso",
+    "Burundi",
+    "Cabo Verde",
+    "Cambodia",
+    "Cameroon",
+    "Canada",
+    "Cayman Islands",
+    "Central African Republic",
+    "Chad",
+    "Chile",
+    "China",
+    "Christmas Island",
+    "Cocos (Keeling) Islands",
+    "Colombia",
+    "Comoros",
+    "Congo",
+    "Congo, Democratic Republic Of The",
+    "Cook Islands",
+    "Costa Rica",
+    "Croatia",
+    "Cuba",
+    "Curaçao",
+    "Cyprus",
+    "Czechia",
+    "Denmark",
+    "Djibouti",
+    "Dominica",
+    "Dominican Republic",
+    "Ecuador",
+    "Egypt",
+    "El Salvador",
+    "Equatorial Guinea",
+    "Eritrea",
+    "Estonia",
+    "Eswatini",
+    "Ethiopia",
+    "Falkland Islands",
+    "Faroe Islands",
+    "Fiji",
+    "Finland",
+    "France",
+    "French Guiana",
+    "French Polynesia",
+    "French Southern Territories",
+    "Gabon",
+    "Gambia",
+    "Georgia",
+    "Germany",
+    "Ghana",
+    "Gibraltar",
+    "Greece",
+    "Greenland",
+    "Grenada",
+    "Guadeloupe",
+    "Guam",
+    "Guatemala",
+    "Guernsey",
+    "Guinea",
+    "Guinea-Bissau",
+    "Guyana",
+    "Haiti",
+    "Heard Island And Mcdonald Islands",
+    "Holy See",
+    "Honduras",
+    "Hong Kong",
+    "Hungary",
+    "Iceland",
+    "India",
+    "Indonesia",
+    "Iran",
+    "Iraq",
+    "Ireland",
+    "Isle Of Man",
+    "Israel",
+    "Italy",
+    "Jamaica",
+    "Japan",
+    "Jersey",
+    "Jordan",
+    "Kazakhstan",
+    "Kenya",
+    "Kiribati",
+    "Korea (Democratic People's Republic Of)",
+    "Korea (Republic Of)",
+    "Kuwait",
+    "Kyrgyzstan",
+    "Lao People's Democratic Republic",
+    "Latvia",
+    "Lebanon",
+    "Lesotho",
+    "Liberia",
+    "Libya",
+    "Liechtenstein",
+    "Lithuania",
+    "Luxembourg",
+    "Macao",
+    "Madagascar",
+    "Malawi",
+    "Malaysia",
+    "Maldives",
+    "Mali",
+    "Malta",
+    "Marshall Islands",
+    "Martinique",
+    "Mauritania",
+    "Mauritius",
+    "Mayotte",
+    "Mexico",
+    "Micronesia (Federated States Of)",
+    "Moldova",
+    "Monaco",
+    "Mongolia",
+    "Montenegro",
+    "Montserrat",
+    "Morocco",
+    "Mozambique",
+    "Myanmar",
+    "Namibia",
+    "Nauru",
+    "Nepal",
+    "Netherlands",
+    "New Caledonia",
+    "New Zealand",
+    "Nicaragua",
+    "Niger",
+    "Nigeria",
+    "Niue",
+    "Norfolk Island",
+    "Northern Mariana Islands",
+    "Norway",
+    "Oman",
+    "Pakistan",
+    "Palau",
+    "Palestine, State Of",
+    "Panama",
+    "Papua New Guinea",
+    "Paraguay",
+    "Peru",
+    "Philippines",
+    "Pitcairn",
+    "Poland",
+    "Portugal",
+    "Puerto Rico",
+    "Qatar",
+    "Réunion",
+    "Romania",
+    "Russia",
+    "Rwanda",
+    "Saint Barthélemy",
+    "Saint Helena, Ascension And Tristan Da Cunha",
+    "Saint Kitts And Nevis",
+    "Saint Lucia",
+    "Saint Martin (French Part)",
+    "Saint Pierre And Miquelon",
+    "Saint Vincent And The Grenadines",
+    "Samoa",
+    "San Marino",
+    "Sao Tome And Principe",
+    "Saudi Arabia",
+    "Senegal",
+    "Serbia",
+    "Seychelles",
+    "Sierra Leone",
+    "Singapore",
+    "Sint Maarten (Dutch Part)",
+    "Slovakia",
+    "Slovenia",
+    "Solomon Islands",
+    "Somalia",
+    "South Africa",
+    "South Georgia And The South Sandwich Islands",
+    "South Sudan",
+    "Spain",
+    "Sri Lanka",
+    "Sudan",
+    "Suriname",
+    "Svalbard And Jan Mayen",
+    "Sweden",
+    "Switzerland",
+    "Syrian Arab Republic",
+    "Taiwan",
+    "Tajikistan",
+    "Tanzania",
+    "Thailand",
+    "Timor-Leste",
+    "Togo",
+    "Tokelau",
+    "Tonga",
+    "Trinidad And Tobago",
+    "Tunisia",
+    "Turkey",
+    "Turkmenistan",
+    "Tuvalu",
+    "Uganda",
+    "Ukraine",
+    "United Arab Emirates",
+    "United Kingdom",
+    "United States",
+    "Uruguay",
+    "Uzbekistan",
+    "Vanuatu",
+    "Venezuela",
+    "Viet Nam",
+    "Western Sahara",
+    "Yemen",
+    "Zambia",
+    "Zimbabwe",
+})
+
+# Continent for every country in the cleaned export, as pycountry_convert resolved them
+CONTINENTS = {
+    "Afghanistan": "Asia",
+    "Albania": "Europe",
+    "Algeria": "Africa",
+    "Angola": "Africa",
+    "Argentina": "South America",
+    "Armenia": "Asia",
+    "Australia": "Oceania",
+    "Austria": "Europe",
+    "Azerbaijan": "Asia",
+    "Bahamas": "North America",
+    "Bahrain": "Asia",
+    "Bangladesh": "Asia",
+    "Barbados": "North America",
+    "Belarus": "Europe",
+    "Belgium": "Europe",
+    "Benin": "Africa",
+    "Bhutan": "Asia",
+    "Bolivia": "South America",
+    "Botswana": "Africa",
+    "Brazil": "South America",
+    "Bulgaria": "Europe",
+    "Cambodia": "Asia",
+    "Cameroon": "Africa",
+    "Canada": "North America",
+    "Chad": "Africa",
+    "Chile": "South America",
+    "China": "Asia",
+    "Colombia": "South America",
+    "Comoros": "Africa",
+    "Congo": "Africa",
+    "Croatia": "Europe",
+    "Cuba": "North America",
+    "Cyprus": "Asia",
+    "Denmark": "Europe",
+    "Djibouti": "Africa",
+    "Ecuador": "South America",
+    "Egypt": "Africa",
+    "Eritrea": "Africa",
+    "Estonia": "Europe",
+    "Ethiopia": "Africa",
+    "Fiji": "Oceania",
+    "Finland": "Europe",
+    "France": "Europe",
+    "Gabon": "Africa",
+    "Gambia": "Africa",
+    "Germany": "Europe",
+    "Ghana": "Africa",
+    "Greece": "Europe",
+    "Guadeloupe": "North America",
+    "Guatemala": "North America",
+    "Guernsey": "Europe",
+    "Guinea": "Africa",
+    "Guyana": "South America",
+    "Haiti": "North America",
+    "Honduras": "North America",
+    "Hungary": "Europe",
+    "Iceland": "Europe",
+    "India": "Asia",
+    "Indonesia": "Asia",
+    "Iran": "Asia",
+    "Iraq": "Asia",
+    "Ireland": "Europe",
+    "Italy": "Europe",
+    "Jamaica": "North America",
+    "Japan": "Asia",
+    "Jordan": "Asia",
+    "Kazakhstan": "Asia",
+    "Kenya": "Africa",
+    "Kuwait": "Asia",
+    "Kyrgyzstan": "Asia",
+    "Latvia": "Europe",
+    "Lebanon": "Asia",
+    "Lesotho": "Africa",
+    "Liberia": "Africa",
+    "Libya": "Africa",
+    "Luxembourg": "Europe",
+    "Madagascar": "Africa",
+    "Malawi": "Africa",
+    "Malaysia": "Asia",
+    "Mali": "Africa",
+    "Malta": "Europe",
+    "Mauritania": "Africa",
+    "Mexico": "North America",
+    "Moldova": "Europe",
+    "Mongolia": "Asia",
+    "Montserrat": "North America",
+    "Morocco": "Africa",
+    "Mozambique": "Africa",
+    "Myanmar": "Asia",
+    "Namibia": "Africa",
+    "Nepal": "Asia",
+    "Netherlands": "Europe",
+    "Nicaragua": "North America",
+    "Niger": "Africa",
+    "Nigeria": "Africa",
+    "Norway": "Europe",
+    "Oman": "Asia",
+    "Pakistan": "Asia",
+    "Panama": "North America",
+    "Papua New Guinea": "Oceania",
+    "Paraguay": "South America",
+    "Peru": "South America",
+    "Philippines": "Asia",
+    "Poland": "Europe",
+    "Portugal": "Europe",
+    "Puerto Rico": "North America",
+    "Qatar": "Asia",
+    "Romania": "Europe",
+    "Russia": "Europe",
+    "Rwanda": "Africa",
+    "Samoa": "Oceania",
+    "San Marino": "Europe",
+    "Saudi Arabia": "Asia",
+    "Senegal": "Africa",
+    "Serbia": "Europe",
+    "Singapore": "Asia",
+    "Slovakia": "Europe",
+    "Slovenia": "Europe",
+    "Somalia": "Africa",
+    "South Africa": "Africa",
+    "Spain": "Europe",
+    "Sri Lanka": "Asia",
+    "Sudan": "Africa",
+    "Suriname": "South America",
+    "Sweden": "Europe",
+    "Switzerland": "Europe",
+    "Taiwan": "Asia",
+    "Tajikistan": "Asia",
+    "Tanzania": "Africa",
+    "Thailand": "Asia",
+    "Tunisia": "Africa",
+    "Turkey": "Asia",
+    "Turkmenistan": "Asia",
+    "Uganda": "Africa",
+    "Ukraine": "Europe",
+    "United Kingdom": "Europe",
+    "United States": "North America",
+    "Uruguay": "South America",
+    "Uzbekistan": "Asia",
+    "Vanuatu": "Oceania",
+    "Venezuela": "South America",
+    "Yemen": "Asia",
+    "Zambia": "Africa",
+    "Zimbabwe": "Africa",
+}
+
+# Exact-match fixes for Aircraft Manufacturer
+MANUFACTURER_CORRECTIONS = {
+    "Doublas": "Douglas",
+    "Douglas DC3(C47)FAC": "Douglas",
+    "Mc Donnell Douglas": "McDonnell Douglas",
+    "McDonnel Douglas": "McDonnell Douglas",
+    "Mc Donnell Dougals": "McDonnell Douglas",
+    "de Havilland": "De Havilland",
+    "de Hav Can.": "De Havilland",
+    "de havilland Canada": "De Havilland",
+    "de havilland 89 Dragon": "De Havilland",
+    "de Hvilland 89A Dragon": "De Havilland",
+    "de Havilland 89A Dragon": "De Havilland",
+    "de Havilland DH.80 Puss": "De Havilland",
+    "de Havilland DH106 Comet": "De Havilland",
+    "de Havilland DH.89 Dragon": "De Havilland",
+    "de Havilland DH114 Heron": "De Havilland",
+    "de Havilland Dove": "De Havilland",
+    "de Havilland Comet": "De Havilland",
+    "de Havilland Canada": "De Havilland",
+    "deHavilland": "De Havilland",
+    "Curtis": "Curtiss",
+    "Curtiss C": "Curtiss",
+    "Curtiss Condor": "Curtiss",
+    "Ilushin": "Ilyushin",
+    "Ilysushin": "Ilyushin",
+    "Illyushin": "Ilyushin",
+    "Iluyshin": "Ilyushin",
+    "Sirkorsky": "Sikorsky",
+    "Sikorsly": "Sikorsky",
+    "Sikorsky S43 (flying": "Sikorsky",
+    "Sikorsky CH53D / Sikorsky CH53D357 /": "Sikorsky",
+    "Sikorsky 44A (flying": "Sikorsky",
+    "Sirkorsky 44A (flying": "Sikorsky",
+    "Sikorksky": "Sikorsky",
+    "Aerospatiale Caravelle": "Aerospatiale",
+    "Aerospatiale AS350BA": "Aerospatiale",
+    "Aerospatiale AS 350B2": "Aerospatiale",
+    "Aerospatiale AS332L2 Super Puma": "Aerospatiale",
+    "Aerospatiale AS 332L1 Super": "Aerospatiale",
+    "Aerospatiale 330G": "Aerospatiale",
+    "Aérospatiale": "Aerospatiale",
+    "Aérospatiale/Aeritalia": "Aerospatiale",
+    "Aerospeciale": "Aerospatiale",
+    "Avro 685 York": "Avro",
+    "Avro 688 Tudor": "Avro",
+    "Avro 691 Lancastrian": "Avro",
+    "Avro Shackleton": "Avro",
+    "Avro Lancaster": "Avro",
+    "Avro Ninteen": "Avro",
+    "Boeing 377 Stratocruiser": "Boeing",
+    "Boeing 307 Stratoliner": "Boeing",
+    "Boeing B52 Stratofortress/Boeing KC": "Boeing",
+    "Boeing 314A": "Boeing",
+    "Boeing 737 Max": "Boeing",
+    "Boeing 40": "Boeing",
+    "Boeing Vertol CH47C": "Boeing Vertol",
+    "Boeing Vertol CH47B": "Boeing Vertol",
+    "Boeing Vertol CH47A": "Boeing Vertol",
+    "Boeing Vertol 107 II": "Boeing Vertol",
+    "Boeing Vetrol 107 II": "Boeing Vertol",
+    "Consolidated 32 Liberator": "Consolidated",
+    "Consolidated Liberator B24": "Consolidated",
+    "Consolidated Catalina": "Consolidated",
+    "Consolidated Canso": "Consolidated",
+    "Bristol 170 Freighter": "Bristol",
+    "Bristol Britannia": "Bristol",
+    "Bristol 28": "Bristol",
+    "Bristol 175 Britannia": "Bristol",
+    "Bristol 170 Freighter 31 Mark": "Bristol",
+    "Britten": "Britten-Norman",
+    "Britten Norman": "Britten-Norman",
+    "Britten Norman BN": "Britten-Norman",
+    "Cessna 208B Caravan": "Cessna",
+    "Cessna 208 Grand": "Cessna",
+    "Cessna 208B Grand": "Cessna",
+    "Cessna 208A Caravan I": "Cessna",
+    "Cessna 208B Caravan I Super": "Cessna",
+    "Cessna 421 Golden": "Cessna",
+    "Cessna 421C Golden": "Cessna",
+    "Cessna 560 Citation": "Cessna",
+    "Cessna 501": "Cessna",
+    "Cessna 500 Citation": "Cessna",
+    "Cessna 550 Citation": "Cessna",
+    "Cessna 208 Caravan": "Cessna",
+    "Cessna 404": "Cessna",
+    "Cessna 404 Titan Courier": "Cessna",
+    "Cessna 404 Titan": "Cessna",
+    "Cessna 441 Conquest": "Cessna",
+    "Cessna 402C": "Cessna",
+    "Cessna 402 / Piper": "Cessna",
+    "Cessna 441": "Cessna",
+    "Cessna 206N11360 / Canadair": "Cessna",
+    "Cessna 207 / Cessna": "Cessna",
+    "Embraer 110C": "Embraer",
+    "Embraer 110P": "Embraer",
+    "Embraer 110P1": "Embraer",
+    "Embraer 110P1A": "Embraer",
+    "Embraer 110P2": "Embraer",
+    "Embraer 120RT": "Embraer",
+    "Embraer 120ER": "Embraer",
+    "Embraer 820C": "Embraer",
+    "Embraer 110EJ Band./Embraer 110P": "Embraer",
+    "EMB 721C": "Embraer",
+    "Embraer 110 P1": "Embraer",
+    "Fokker 27 Friendship": "Fokker",
+    "Fokker F27 Friendship": "Fokker",
+    "Fokker 28 Fellowship": "Fokker",
+    "Fokker FG": "Fokker",
+    "Fokker F10A": "Fokker",
+    "Fokker Universal": "Fokker",
+    "Fokker UniversalNC52 1": "Fokker",
+    "Fokker (KLM)": "Fokker",
+    "Fokker L": "Fokker",
+    "Handley Page Dart Herald": "Handley Page",
+    "Handley Page Hastings C Mark": "Handley Page",
+    "Handley Page Hastings": "Handley Page",
+    "Handley Page Halifax": "Handley Page",
+    "Handley Page Jetstream": "Handley Page",
+    "Hawker Siddeley HS": "Hawker Siddeley",
+    "Hawker Siddeley Trident": "Hawker Siddeley",
+    "Hawker Siddeley Trident 2E / Boeing": "Hawker Siddeley",
+    "Junkers 52/3m": "Junkers",
+    "Junkers JU86": "Junkers",
+    "Latecoere 631 (flying": "Latecoere",
+    "Latecoere 631 (sea": "Latecoere",
+    "Latecoere 301 (flying": "Latecoere",
+    "Latecoere 2": "Latecoere",
+    "Latecoere 23 (flying": "Latecoere",
+    "Latécoère 23 (flying": "Latecoere",
+    "Latécoère": "Latecoere",
+    "Latecoere 300 (float": "Latecoere",
+    "Latécoère 300 (float": "Latecoere",
+    "Learjet": "Gates Learjet",
+    "Lear Jet": "Gates Learjet",
+    "Lockheed 10": "Lockheed",
+    "Lockheed 10E": "Lockheed",
+    "Lockheed 14": "Lockheed",
+    "Lockheed 14 Super": "Lockheed",
+    "Lockheed 14H Super": "Lockheed",
+    "Lockheed 18": "Lockheed",
+    "Lockheed 049": "Lockheed",
+    "Lockheed 188A": "Lockheed",
+    "Lockheed 188C": "Lockheed",
+    "Lockheed 749A": "Lockheed",
+    "Lockheed 749": "Lockheed",
+    "Lockheed 1049G Super": "Lockheed",
+    "Lockheed 1049H Super": "Lockheed",
+    "Lockheed 1049E Super": "Lockheed",
+    "Lockheed 1049C Super": "Lockheed",
+    "Lockheed 1649A": "Lockheed",
+    "Lockheed Hudson": "Lockheed",
+    "Lockheed Hercules": "Lockheed",
+    "Lockheed Vega": "Lockheed",
+    "Lockheed Orion": "Lockheed",
+    "Lockheed P2V": "Lockheed",
+    "Lockheed 1329 Jetstar": "Lockheed",
+    "Lockheed 10A": "Lockheed",
+    "Lockheed 10B": "Lockheed",
+    "Lockheed 10C": "Lockheed",
+    "Lockheed 5": "Lockheed",
+    "Lockheed 9": "Lockheed",
+    "Lockheed B17G Flying": "Lockheed",
+    "Lockheed Orion 9E Explorer float": "Lockheed",
+    "Lockhed 10": "Lockheed",
+    "McDonnell Douglas MD": "McDonnell Douglas",
+    "Short Sandringham (flying": "Short",
+    "Short Sandringham 5 (flying": "Short",
+    "Short Sandringham 6 (flying": "Short",
+    "Short Sandringham 2 (flying": "Short",
+    "Short S23 'C' Class flying": "Short",
+    "Short S.23 Empire Flying": "Short",
+    "Short Empire flying": "Short",
+    "Short Calcutta (flying": "Short",
+    "Short Sunderland 9 (flying": "Short",
+    "Short Solent 3 (flying": "Short",
+    "Short Stirling": "Short",
+    "Short VC": "Short",
+    "Shorts": "Short",
+    "Shorts SC.7 Skyvan": "Short",
+    "Sud Aviation Caravelle": "Sud Aviation",
+    "Sud Aviation SE 210 Caravelle": "Sud Aviation",
+    "Swearingen SA.227AC Metro": "Swearingen",
+    "Swearingen SA227AC Metroliner": "Swearingen",
+    "Swearingen SA.227AT Merlin": "Swearingen",
+    "Swearingen SA.226TC Metro": "Swearingen",
+    "Swearingen 226TC Metro": "Swearingen",
+    "Swear.": "Swearingen",
+    "Vickers Viscount": "Vickers",
+    "Vickers 610 Viking": "Vickers",
+    "Vickers 634 Viking": "Vickers",
+    "Vickers 615 Viking": "Vickers",
+    "Vickers 621 Viking": "Vickers",
+    "Vickers 620 Viking": "Vickers",
+    "Vickers 628 Viking": "Vickers",
+    "Vickers 813": "Vickers",
+    "Vickers 815": "Vickers",
+    "Vickers Vanguard": "Vickers",
+    "Vickers 802": "Vickers",
+    "Vickers 785D": "Vickers",
+    "Vickers 757": "Vickers",
+    "Vickers 828": "Vickers",
+    "Vickers 837": "Vickers",
+    "Vickers Valetta": "Vickers",
+    "Vickers 604 Viking": "Vickers",
+    "Vickers 616 Viking": "Vickers",
+    "Vickers 639 Viking": "Vickers",
+    "Vickers 708": "Vickers",
+    "Vickers 720": "Vickers",
+    "Vickers 745D /": "Vickers",
+    "Vickers 754D /": "Vickers",
+    "Vickers 764": "Vickers",
+    "Vickers 798D": "Vickers",
+    "Vickers Viking": "Vickers",
+    "Vickers Viking 1B &": "Vickers",
+    "Wright Flyer": "Wright",
+    "Zeppelin Dixmunde": "Zeppelin",
+    "Bell 205": "Bell",
+    "Bell 212FAC": "Bell",
+    "Bell 206B": "Bell",
+    "Bell 204B": "Bell",
+    "Bell 214ST": "Bell",
+    "Bell 214": "Bell",
+    "Bell 206": "Bell",
+    "Bell 407 / Bell 407N407GA /": "Bell",
+    "Bell 412": "Bell",
+    "Bell 412SPN3645D /": "Bell",
+    "Beechcraft B200 Super King": "Beechcraft",
+    "Beechcraft Super King Air": "Beechcraft",
+    "Beechcraft B300 King": "Beechcraft",
+    "Beechcraft 1900D /": "Beechcraft",
+    "Beechcraft Bonanza": "Beechcraft",
+    "Beech King Air": "Beechcraft",
+    "Beech King Air 200": "Beechcraft",
+    "Beech Queen Air": "Beechcraft",
+    "Beech 200 Super King": "Beechcraft",
+    "Beechcraft 100 King": "Beechcraft",
+    "Beechcraft A100 King": "Beechcraft",
+    "Beech": "Beechcraft",
+    "Beechcraft C99 /": "Beechcraft",
+    "CASA 212 Aviocar": "CASA",
+    "Casa 212": "CASA",
+    "Casa 352": "CASA",
+    "Dornier DO.18 (float": "Dornier",
+    "Dormier": "Dornier",
+    "Domier Delphin III (flying": "Dornier",
+    "Ford model": "Ford",
+    "Mi": "Mil",
+    "Mi 172 V5": "Mil",
+    "Mi 8T": "Mil",
+    "Grummand": "Grumman",
+    "Grummand Gulfstream": "Grumman",
+    "Grumman TBM": "Grumman",
+    "Grumman G73T Turbo": "Grumman",
+    "Grumman Gulfstream": "Grumman",
+    "IAI 1124": "IAI",
+    "IAI 1124A Westwind": "IAI",
+    "IAI 1124A": "IAI",
+    "IAI Attava": "IAI",
+    "IAI Arava": "IAI",
+    "Let 410UVP": "Let",
+    "LET 410M": "Let",
+    "LET 410": "Let",
+    "LET 410MT": "Let",
+    "Let 410UVP Turbojet / Tupolev": "Let",
+    "LET  410M": "Let",
+    "Li": "Lisunov",
+    "Lisnov": "Lisunov",
+    "Martin 202A /": "Martin",
+    "Martin PBM": "Martin",
+    "Mil Mi 8T": "Mil",
+    "Mil Mi": "Mil",
+    "NAMC": "Kawasaki",
+    "Piper Aerostar 601 /": "Piper",
+    "Piper Navajo": "Piper",
+    "Piper C": "Piper",
+    "Stearman": "Boeing Stearman",
+    "Stinson Model": "Stinson",
+    "Stinson SM6000B": "Stinson",
+    "Stinson Reliant": "Stinson",
+    "Stinson SM": "Stinson",
+    "Travel Air B": "Travel Air",
+    "Travel Air 6000": "Travel Air",
+    "Tuolev": "Tupolev",
+    "Waco, model": "Waco",
+    "Yunshuji": "Harbin",
+    "British Aerospace 748": "British Aerospace",
+    "British Aerospace 3101 Jetstream": "British Aerospace",
+    "British Aerospace Jetstream": "British Aerospace",
+    "British Aerospace BAe": "British Aerospace",
+    "British Aerospace Nimrod": "British Aerospace",
+    "BAe": "British Aerospace",
+    "BAe 3101 Jetstream": "British Aerospace",
+    "BAe Jetstream": "British Aerospace",
+    "BAC": "BAC",
+    "BAC One": "BAC",
+    "BAC One Eleven": "BAC",
+    "BAC Super": "BAC",
+    "Canadair CRJ200LR": "Canadair",
+    "Eurocopter EC": "Eurocopter",
+    "Eurocopter AS 332L2 Super": "Eurocopter",
+    "Eurocopter Deutschland": "Eurocopter",
+    "Eurocopter AS350D": "Eurocopter",
+    "Eurocopter  AS332L2 Super": "Eurocopter",
+    "Eurocopter EC135": "Eurocopter",
+    "GAF Nomad": "GAF",
+    "GAF N22B": "GAF",
+    "Hadley Page 137Jetstream I /": "Handley Page",
+    "Hindustan Aeronautics 748": "Hindustan Aeronautics",
+    "HAL Hindustan Aeronautics": "Hindustan Aeronautics",
+    "Mitsubishi MU 2B": "Mitsubishi",
+    "Pilatus": "Pilatus",
+    "Rockwell International": "Rockwell",
+    "Rockwell Sabreliner": "Rockwell",
+    "Rockwell 500S Shrike": "Rockwell",
+    "Rockwell Gulfstream Jetprop 840": "Rockwell",
+    "Saab340BB": "Saab",
+    "Saab Scandia": "Saab",
+    "Sukhoi Superjet": "Sukhoi",
+    "Transall": "Transall",
+    "Westland Sea King": "Westland",
+    "??": "Unknown",
+    "?": "Unknown",
+    "?139": "Unknown",
+    "?42": "Unknown",
+    "?VH": "Unknown",
+    "?VP": "Unknown",
+    "?NC21V": "Unknown",
+    "1": "Unknown",
+    "2": "Unknown",
+    "3": "Unknown",
+    "4": "Unknown",
+    "An26SH76": "Unknown",
+    "AeroflotL5057": "Aeroflot",
+    "AeroflotCCCP": "Aeroflot",
+    "Avero LancasterVX562 / AirbusA310": "Airbus",
+    "C": "Unknown",
+    "CH": "Unknown",
+    "CH53E Sea": "Unknown",
+    "DC": "Unknown",
+    "F": "Unknown",
+    "GVF": "Unknown",
+    "H": "Unknown",
+    "Helicopter?": "Unknown",
+    "Helicopter, Hughes": "Unknown",
+    "IL": "Unknown",
+    "Ilyushin76TD4K": "Unknown",
+    "KB": "Unknown",
+    "L": "Unknown",
+    "M28": "Unknown",
+    "MH": "Unknown",
+    "Military": "Unknown",
+    "NC": "Unknown",
+    "PA": "Unknown",
+    "PBY": "Unknown",
+    "PBY4": "Unknown",
+    "R4D": "Unknown",
+    "R4Q / Dougas": "Douglas",
+    "SPCA Meteore": "Unknown",
+    "Tempest?": "British Aerospace",
+    "UC": "Unknown",
+    "UH": "Unknown",
+    "V6": "Unknown",
+    "VH": "Unknown",
+    "Wapiti?": "Westland",
+    "1 Boeing": "Boeing",
+    "Swallow": "Unknown",
+    "Black Hawk": "Sikorsky",
+    "Dirigible?": "Zeppelin",
+    "Dirigible Roma": "Zeppelin",
+    "Dirigible": "Zeppelin",
+    "Airship?": "Unknown",
+    "Kubicek BB85Z Hot Air": "Kubicek",
+    "Unknown / Tupolev": "Tupolev",
+    "CF": "Unknown",
+    "AAC": "Unknown",
+    "Cessna  208B Grand": "Cessna",
+    "HS": "Hawker Siddeley",
+    "Embraer/Piper": "Embraer",
+    "Hadley Page 137Jetstream I / Cessna 206N11360 /": "Handley Page",
+    "Aerocomp Comp Air": "Unknown",
+    "de Havilland  Canada": "De Havilland",
+    "Aviation Traders": "Aviation Traders",
+    "Vickers Viking 1B & Soviet": "Vickers",
+    "Pilatus Britten Norman": "Pilatus",
+    "Swallow/r/nSwallow?": "Swallow",
+    "Lockheed Super": "Lockheed",
+    "B17G Flying": "Boeing",
+    "OFM": "Unknown",
+    "Eurocopter EC225LP Super Puma M2+": "Eurocopter",
+    "Piper Aerostar 601 / Bell 412SPN3645D /": "Piper",
+    "Eurocopter AS 332L2 Super Puma": "Aerospatiale",
+    "Aerospatiale AS350 Eurocopter": "Aerospatiale",
+    "Vickers 804": "Vickers",
+    "Supermarine Stranraer (flying": "Supermarine",
+    "Beechcraft C99 / Rockwell": "Beechcraft",
+    "MD Douglas": "McDonnell Douglas",
+    "Catalina Flying": "Consolidated",
+    "Norman": "Britten-Norman",
+    "Pacific": "Unknown",
+    "Unknown /": "Unknown",
+    "Cessna  501": "Cessna",
+    "Avro 691 Lancastrian (flying": "Avro",
+    "Blériot Spad": "Bleriot",
+    "Bell Huey": "Bell",
+    "Farman F.60": "Farman",
+    "Embraer 110": "Embraer",
+    "Bristol 170": "Bristol",
+    "Fairchild C119G / Fairchild": "Fairchild",
+    "Avro  685 York": "Avro",
+    "Vickers Viscount 827 / Fokker": "Vickers",
+    "Vickers Viscount 764": "Vickers",
+    "VC": "Unknown",
+    "Embraer 120": "Embraer",
+    "HAL": "Hindustan Aeronautics",
+    "IPTN 332C Super": "IPTN",
+    "Avro 683": "Avro",
+    "Five Grumman TBM": "Grumman",
+    "MD": "McDonnell Douglas",
+    "McDonnell": "McDonnell Douglas",
+    "Fairchild Pilgrim": "Fairchild",
+    "Ilyushin 14M": "Ilyushin",
+    "Tupolev A.N.T.": "Tupolev",
+    "ATR42": "ATR",
+    "DHC": "De Havilland",
+    "Channel Air": "Unknown",
+    "Twin": "Unknown",
+    "de Havilland DH.104 Dove": "De Havilland",
+    "ConvairCV": "Convair",
+    "Bandeirante": "Embraer",
+    "Consolidated  32 Liberator": "Consolidated",
+    "Nord 2501": "Nord",
+    "Fairchild?": "Fairchild",
+    "Lioré": "Liore et Olivier",
+    "Vickers 952F": "Vickers",
+    "Airspeed Ambassador": "Airspeed",
+    "Vickers 614 Viking": "Vickers",
+    "Cant": "CRDA CANT",
+    "Lockheed  188A": "Lockheed",
+    "Curtiss Carrier": "Curtiss",
+    "de Havilland DHC": "De Havilland",
+    "Vickers Viscount 754D / Douglas": "Vickers",
+    "Breguet 14": "Breguet",
+    "Lockheed L 1049G Super": "Lockheed",
+    "Shaanxi Yunshuji": "Shaanxi",
+    "Swearingen SA.227AC": "Swearingen",
+    "DC3(C47)FAC": "Douglas",
+    "SNCASE SE.2010": "SNCASE",
+    "Vickers Valetta Mk1 / Avero LancasterVX562 /": "Vickers",
+    "AirbusA310": "Airbus",
+    "BAE Avro": "British Aerospace",
+    "Tupolev TU": "Tupolev",
+    "Lasco": "Unknown",
+    "Boeing 377": "Boeing",
+    "Airspeed AS.57 Ambassador": "Airspeed",
+    "Vickers 74": "Vickers",
+    "Aerospatiale BAe Concorde": "Aerospatiale",
+    "Beechcraft 1900D / Cessna": "Beechcraft",
+    "LVG C": "LVG",
+    "Volpar": "Volpar",
+    "FD Type": "Unknown",
+    "Avro 685": "Avro",
+    "EC": "Eurocopter",
+    "British Aerospace  BAe Jetstream": "British Aerospace",
+    "General": "Unknown",
+    "CMASA Wal (flying": "CMASA",
+    "Fairchild packet (C119 flying": "Fairchild",
+    "Sikorsky  S 76": "Sikorsky",
+    "Sikorsky S": "Sikorsky",
+    "Antonov An": "Antonov",
+    "Caravelle": "Sud Aviation",
+    "Fairchild Hiller": "Fairchild",
+    "de Havilland Can.": "De Havilland",
+    "Avro 691": "Avro",
+    "KJ": "Unknown",
+    "Zepplin": "Zeppelin",
+    "AEGKD": "Unknown",
+    "Bleriot Spad": "Bleriot",
+    "MI 172 V5": "Mil",
+    "B": "Unknown",
+    "Boeing Vertol Chinook": "Boeing Vertol",
+    "Pitcairns": "Pitcairn",
+    "Both Eurocopter": "Eurocopter",
+    "Armstrong Whitworth Argosy": "Armstrong Whitworth",
+    "Aerospatiale Nord": "Aerospatiale",
+    "Avro 689 Tudor": "Avro",
+    "Sepecat Jaguar": "SEPECAT",
+    "de Havilland Dragon": "De Havilland",
+    "Blackburn Beverley C Mark": "Blackburn",
+    "Rochrbach": "Rohrbach",
+    "Savoia Marchetti SM": "Savoia Marchetti",
+    "Mc Donnell Douglas 369FF": "McDonnell Douglas",
+    "Aeromarine Model 85 (flying": "Aeromarine",
+    "Eurocopter AS": "Eurocopter",
+    "Northrop Alpha": "Northrop",
+    "Fairchild R4Q / Dougas": "Fairchild",
+    "AT L98": "Unknown",
+    "Avro York": "Avro",
+    "Aerospatiale Caravelle Super": "Aerospatiale",
+    "Boeing 307": "Boeing",
+    "Urocopter AS350": "Eurocopter",
+    "Antonv": "Antonov",
+    "Swearingen SA227AC Metro": "Swearingen",
+    "Dassault Breguet": "Dassault",
+    "McDonnel": "McDonnell Douglas",
+    "Liore": "Liore et Olivier",
+    "Vickers Viscount 745D /": "Vickers",
+    "Beechcraft B300 King Air": "Beechcraft",
+    "Boeing CH47A": "Boeing Vertol",
+    "Lockheed L188A": "Lockheed",
+    "Robertson R44": "Robinson",
+    "Saab Scandia / Cessna": "Saab",
+    "Douglas DC": "Douglas",
+    "Stinson?": "Stinson",
+    "Super Zeppelin": "Zeppelin",
+    "Aerospatiale 330J": "Aerospatiale",
+    "Aerospatiale Alenia": "Aerospatiale",
+    "Short Sunderland": "Short",
+    "Hamilton": "Unknown",
+    "Grazhdansky Vozdushnyi Flot": "Unknown",
+    "Swearingen SA227AT Merlin": "Swearingen",
+    "Cessna 208": "Cessna",
+    "Vickers 610": "Vickers",
+    "Savbia": "Savoia",
+    "A": "Unknown",
+    "Boeing  377": "Boeing",
+    "Rutan Long EZ (experimental": "Rutan",
+    "Agusta A109A MK": "Agusta",
+    "Ilyushin IL": "Ilyushin",
+    "Aero Commander AC": "Aero Commander",
+    "Fairey Firefly": "Fairey",
+    "de Havilland Canada DHC 3T Turbine": "De Havilland",
+    "Beechcraft SKA": "Beechcraft",
+    "de havilland Canada Twin Otter": "De Havilland",
+    "Hawker Siddeley Trident 2E /": "Hawker Siddeley",
+    "Lockheed  5": "Lockheed",
+    "Fokker UniversalNC52": "Fokker",
+    "Transportes Aéreos": "Unknown",
+    "Douglas": "McDonnell Douglas",
+    "McDonnell Douglas": "McDonnell Douglas",
+    "Cams": "Unknown",
+    "Sud Aviation": "Aerospatiale",
+    "Boeing Stearman": "Boeing",
+    "Martin": "Lockheed",
+    "Harbin Yunshuji": "Harbin",
+    "Vickers Wellington": "Vickers",
+    "Caudron C.635": "Caudron",
+    "Eurocopter": "Airbus Helicopters",
+    "Dassault Falcon": "Dassault",
+    "Boeing Vertol": "Boeing",
+    "Avro 688 Super": "Avro",
+    "Lockheed Martin": "Lockheed",
+    "Lockheed 10 Electra": "Lockheed",
+    "Arava": "IAI",
+    "Sud": "Sud Aviation",
+    "Short S23 ‘C’ Class flying": "Short",
+    "IPTN": "Indonesian Aerospace",
+    "SNCASE": "Aerospatiale",
+    "SNIAS": "Aerospatiale",
+    "Piaggio": "Piaggio Aero",
+    "Boulton and Paul": "Boulton Paul",
+    "Fiat": "Fiat Aviazione",
+    "Xian Yunshuji": "Xian",
+    "Vickers 634": "Vickers",
+    "Fokker Super": "Fokker",
+    "Let Aero": "Let",
+    "Antonov An26SH76": "Antonov",
+}
+
+# Exact-match fixes for Aircraft
+AIRCRAFT_CORRECTIONS = {
+    "Douglas C 47AN75142": "Douglas DC-3",
+    "Lockheed 10 ElectraNC14935": "Lockheed 10 Electra",
+    "Boeing B 737": "Boeing 737",
+    "Cessna 208B Caravan I Super CargomasterN277PM": "Cessna 208B Caravan I",
+    "Convair CV 580N2045": "Convair CV-580",
+    "Convair CV 880 / McDonnell DC": "Convair CV-880",
+    "Douglas C 47ANC58024": "Douglas DC-3",
+    "Douglas DC 3ANC25678": "Douglas DC-3",
+    "Lockheed Vega 5NC433E": "Lockheed Vega 5",
+    "Airbus A300B2 101VT": "Airbus A300",
+    "Douglas C 47AVT": "Douglas DC-3",
+    "Douglas DC 3 (C": "Douglas DC-3",
+    "Douglas DC 3VT": "Douglas DC-3",
+    "HAL  748 Hindustan Aeronautics 748 2H1032": "HAL 748",
+    "De Havilland DH 4311": "De Havilland DH 4",
+    "Douglas DC 3N51071": "Douglas DC-3",
+    "CASA 212 Aviocar 100PK VSO": "CASA C-212 Aviocar",
+    "Douglas C 47APK": "Douglas DC-3",
+    "Douglas DC 3PK": "Douglas DC-3",
+    "IPTN 332C Super PumaPK PUI": "IPTN 332C Super Puma",
+    "M28 SkytruckP 4201": "PZL M28 Skytruck",
+    "Short S 23 Empire Flying Boat G": "Short S.23 Empire",
+    "Antonov AN 140UR": "Antonov An-140",
+    "Douglas DC 3EP": "Douglas DC-3",
+    "Lisunov Li 2?": "Lisunov Li-2",
+    "Lockheed C 130B Hercules5": "Lockheed C-130 Hercules",
+    "SNCASE LanguedocSU AHH": "SNCASE Languedoc",
+    "Lockheed 049 ConsellationNC86505": "Lockheed 049 Constellation",
+    "Antonov AN 24BYR": "Antonov An-24",
+    "Boeing B 707": "Boeing 707",
+    "Cessna 421 Golden EagleI ASON": "Cessna 421 Golden Eagle",
+    "Douglas C 47I": "Douglas DC-3",
+    "Douglas DC 3I": "Douglas DC-3",
+    "Savoia  Marchetti SM.75 I": "Savoia-Marchetti SM.75",
+    "Short S 23 (flying boat)G": "Short S.23 Empire",
+    "Short Empire Flying BoatG ADUZ": "Short S.23 Empire",
+    "Vickers 785D ViscountI LIZT": "Vickers 785D Viscount",
+    "Curtiss  Wright C Curtiss C 47?": "Curtiss-Wright C-46",
+    "Antonov AN 72": "Antonov An-72",
+    "Fokker 100UP F100": "Fokker 100",
+    "Tupolev ANT 6CCCP": "Tupolev ANT-6",
+    "Grumman G 21A GooseN1503V": "Grumman G-21A Goose",
+    "Lockheed C 130H63": "Lockheed C-130 Hercules",
+    "Douglas C 54D": "Douglas DC-4",
+    "Douglas DC 4?": "Douglas DC-4",
+    "Douglas C 47A": "Douglas DC-3",
+    "Douglas DC 3F": "Douglas DC-3",
+    "Yunshuji Y 12": "Harbin Y-12",
+    "Antonov AN 24BCCCP": "Antonov An-24",
+    "Tupolev TU 154BLZ": "Tupolev Tu-154",
+    "Boeing B 727": "Boeing 727",
+    "SNIAS SA330JN4730S": "Aérospatiale SA 330J Puma",
+    "Boeing B 2944": "Boeing B-29 Superfortress",
+    "CASA 212 Aviocar 200N296CA": "CASA C-212 Aviocar",
+    "Douglas DC 7CFN284": "Douglas DC-7C",
+    "Britten  Norman BN Douglas DC 2": "Britten-Norman BN-2A",
+    "Douglas DC 3?": "Douglas DC-3",
+    "Douglas DC 3XA": "Douglas DC-3",
+    "Learjet 25N345MC": "Learjet 25",
+    "Lockheed 10E ElectraX ABAU": "Lockheed 10 Electra",
+    "Curtis C 46AN608Z": "Curtiss C-46",
+    "British Aerospace Jetstream BA 3100N334PX": "British Aerospace Jetstream",
+    "Lockheed Vega 5CNC106W": "Lockheed Vega 5C",
+    "Douglas C 4745": "Douglas DC-3",
+    "Breguet 14F ALNA": "Breguet 14",
+    "Savoia  Marchetti SM83I": "Savoia-Marchetti SM.83",
+    "Sud  Aviation Caravelle VI": "Sud Aviation Caravelle",
+    "Fokker 100XY AGC": "Fokker 100",
+    "Aerospatiale SA 330JN3596N": "Aérospatiale SA 330J Puma",
+    "Airbus A 320": "Airbus A320",
+    "Antonov AN 32?": "Antonov An-32",
+    "Avro 683 LancasterCF CMU": "Avro Lancaster",
+    "Boeing B 747": "Boeing 747",
+    "Britten Norman BN 2A Trislander Mk3N650LP": "Britten-Norman BN-2A Trislander",
+    "CAMS 56F AIOX": "CAMS 56",
+    "Cessna 207 / Cessna 207ZK DAX / ZK": "Cessna 207",
+    "de Havilland Canada DHC 6 Twin Otter 300PK Five": "De Havilland Canada DHC-6 Twin Otter",
+    "Grumman TBM Avengers?": "Grumman TBM Avenger",
+    "Junkers JU 52M": "Junkers Ju 52",
+    "Lockheed 14 Super ElectraG AFYU": "Lockheed 14 Super Electra",
+    "Tupolev ANT 9?": "Tupolev ANT-9",
+    "UC  64A Noorduyn Norseman44": "Noorduyn Norseman",
+    "Zeppelin Dixmunde (airship)L 72": "Zeppelin Dixmunde",
+    "McDonnell Douglas MD 81YU": "McDonnell Douglas MD-81",
+    "de Havilland Canada DHC 6 Twin Otter 3009N": "De Havilland Canada DHC-6 Twin Otter",
+    "Short SC7  SkyvanRAN": "Shorts SC.7 Skyvan",
+    "Lockheed 14 WF62 Super ElectraPH": "Lockheed 14 Super Electra",
+    "Aerospatiale AS 350 B2 EcureuilN37SH": "Aérospatiale AS 350 Ecureuil",
+    "Curtiss C 46A": "Curtiss C-46",
+    "Curtiss Wright C 46FN1678M": "Curtiss-Wright C-46",
+    "De Havilland DH 497": "De Havilland DH 4",
+    "de Havilland Canada DHC 6 Twin Otter 200P2": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas DC 3NC18l23": "Douglas DC-3",
+    "Douglas DC 6BI": "Douglas DC-6",
+    "Learjet 35AN388LS": "Learjet 35A",
+    "Lockheed 18 08 Lodestar MD": "Lockheed 18 Lodestar",
+    "DC 8 McDonnell Douglas DC 8 Super 63PFN950JW": "McDonnell Douglas DC-8",
+    "Mil Mi 8 (helicopter)265": "Mil Mi-8",
+    "McDonnell DC 9": "McDonnell Douglas DC-9",
+    "British Aerospace Jetstream 3201N918AE": "British Aerospace Jetstream",
+    "Douglas DC 9": "McDonnell Douglas DC-9",
+    "de Havilland Canada DHC 6 Twin Otter 200C": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas C 47BKN413": "Douglas DC-3",
+    "Fokker F 28 Fellowship 1000LN": "Fokker F-28 Fellowship",
+    "Britten Norman BN 2A Trislander7C": "Britten-Norman BN-2A Trislander",
+    "Antonov An 72ER": "Antonov An-72",
+    "Cessna 208B Caravan I Super CargomasterN28MG": "Cessna 208B Caravan I",
+    "De Havilland DH 4318": "De Havilland DH 4",
+    "Douglas M 3NC789": "Douglas M-3",
+    "Douglas M 4NC790": "Douglas M-4",
+    "Fairchild Pilgrim 100A?": "Fairchild Pilgrim 100A",
+    "KB  50?": "Boeing KB-50",
+    "Nakajima A T2J": "Nakajima A-T2J",
+    "de Havilland DHC 3 OtterC": "De Havilland Canada DHC-3 Otter",
+    "McDonnell Douglas DC 8": "McDonnell Douglas DC-8",
+    "Ryan M 12": "Ryan M-12",
+    "ATR  42": "ATR 42",
+    "Douglas C 54A": "Douglas DC-4",
+    "Douglas DC 3AP": "Douglas DC-3",
+    "Fokker F 27 Friendship 400AP": "Fokker F-27 Friendship",
+    "Britten Norman BN 2A TrislanderHP": "Britten-Norman BN-2A Trislander",
+    "Britten  Norman BN Britten Norman BN 2A": "Britten-Norman BN-2A",
+    "de Havilland DH 84 DragonVH": "De Havilland DH.84 Dragon",
+    "GAF Nomad 22BP2": "GAF Nomad",
+    "DNL Lockheed C 130H Hercules": "Lockheed C-130 Hercules",
+    "Convair CV 580N5802": "Convair CV-580",
+    "Douglas DC 2": "Douglas DC-2",
+    "Douglas DC 3N24320": "Douglas DC-3",
+    "Martin 202N174A": "Martin 202",
+    "de Havilland Canada DHC 5 BuffaloFAP": "De Havilland Canada DHC-5 Buffalo",
+    "de Havilland Canada DHC 6 Twin Otter 300FAP": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas DC 54A": "Douglas DC-4",
+    "Douglas DC 3OB": "Douglas DC-3",
+    "Douglas DC C": "Douglas DC-3",
+    "Fokker F 27 Friendship 400MAE": "Fokker F-27 Friendship",
+    "de Havilland Canada DHC 3 OtterPI": "De Havilland Canada DHC-3 Otter",
+    "Douglas C54E DO (DC": "Douglas DC-4",
+    "Douglas DC 3API": "Douglas DC-3",
+    "Douglas DC 3PI": "Douglas DC-3",
+    "Let 410UVPRP C": "Let L-410 Turbolet",
+    "Lockheed C 130H4761": "Lockheed C-130 Hercules",
+    "Shorts 360 300EI": "Shorts 360",
+    "Heinkel He 70D": "Heinkel He 70",
+    "Vickers Viscount 804SP LVB": "Vickers 804 Viscount",
+    "Aerospatiale Caravelle 10RHB ICK": "Sud Aviation Caravelle",
+    "Britten  Norman BN Douglas DC 3DSTN16002": "Britten-Norman BN-2",
+    "Douglas DC 7CFN500AE": "Douglas DC-7C",
+    "Rockwell International 690BN318WA": "Rockwell 690",
+    "Lockheed L 1011": "Lockheed L-1011 TriStar",
+    "Douglas C 47ACF": "Douglas DC-3",
+    "Antonov AN 24RVYR": "Antonov An-24",
+    "BAC One Eleven  424EUYR": "BAC One-Eleven",
+    "Antonov 1212162": "Antonov An-12",
+    "Antonov AN 12?": "Antonov An-12",
+    "Antonov AN 124": "Antonov An-124",
+    "Antonov An 12PLCCCP": "Antonov An-12",
+    "Antonov An 2 / Antonov An": "Antonov An-2",
+    "Antonov AN 24CCCP": "Antonov An-24",
+    "Antonov AN 26CCCP": "Antonov An-26",
+    "Antonov AN 9CCCP": "Antonov An-9",
+    "Ilyushin 114TUK 91004": "Ilyushin Il-114",
+    "Ilyushin 14PCCCP 52010": "Ilyushin Il-14",
+    "Ilyushin II 14?": "Ilyushin Il-14",
+    "Ilyushin IL  76TDRA": "Ilyushin Il-76",
+    "Ilyushin IL 12CCCP": "Ilyushin Il-12",
+    "Ilyushin IL 14MCCCP": "Ilyushin Il-14",
+    "Ilyushin IL 18ACCCP": "Ilyushin Il-18",
+    "Ilyushin IL 18BCCCP": "Ilyushin Il-18",
+    "Ilyushin 14M": "Ilyushin Il-14",
+    "Let 410UVPCCCP 67127": "Let L-410 Turbolet",
+    "Li  2CCCP": "Lisunov Li-2",
+    "Lisunov LI 2L4228": "Lisunov Li-2",
+    "Tupolev 154B 2RA": "Tupolev Tu-154",
+    "Tupolev TU 114BCCCP": "Tupolev Tu-114",
+    "Tupolev TU 154B": "Tupolev Tu-154",
+    "Tupolev TU 154BRA": "Tupolev Tu-154",
+    "Tupolev TU 154MRA": "Tupolev Tu-154",
+    "Tupolev TU 204": "Tupolev Tu-204",
+    "Tupolev A.N.T. 20bisSSSR L": "Tupolev ANT-20",
+    "Yakovlev 40CCCP 88208": "Yakovlev Yak-40",
+    "Cessna 404 Titan5Y EJS": "Cessna 404 Titan",
+    "ATR42  320C": "ATR 42",
+    "Ilyushin II 76TDER": "Ilyushin Il-76",
+    "Lockheed C 121C Super Constellation54": "Lockheed C-121 Constellation",
+    "Lockheed 18 56 LodestarG": "Lockheed 18 Lodestar",
+    "DHC  6 Twin Otter 300 / NAMC YS": "De Havilland Canada DHC-6 Twin Otter",
+    "McDonnell Douglas DC 9": "McDonnell Douglas DC-9",
+    "Douglas C 47AOK": "Douglas DC-3",
+    "Boeing Vertol CH 47 (helicopter)?": "Boeing Vertol CH-47 Chinook",
+    "Curtiss C 46AN9904F": "Curtiss C-46",
+    "Douglas C47 TP6840": "Douglas DC-3",
+    "Douglas DC 3ZS": "Douglas DC-3",
+    "Fairchild C 123?": "Fairchild C-123 Provider",
+    "Fairchild C 123C56": "Fairchild C-123 Provider",
+    "Junkers W 34ZS": "Junkers W 34",
+    "Breguet 14F AFGS": "Breguet 14",
+    "Breguet 14F ALBO": "Breguet 14",
+    "Bristol 170 Freighter 21EC AEG": "Bristol 170 Freighter",
+    "SNCASE LanguedocEC ANR": "SNCASE Languedoc",
+    "Fokker F 27 Friendship 200ST": "Fokker F-27 Friendship",
+    "De Havilland DH 4G": "De Havilland DH 4",
+    "Mc Donnell Douglas MD 81OY": "McDonnell Douglas MD-81",
+    "Convair CV 240OO": "Convair CV-240",
+    "Douglas DC 3YK": "Douglas DC-3",
+    "Aérospatiale/Aeritalia ATR 72": "ATR 72",
+    "Piper PA 42 Cheyenne5H": "Piper PA-42 Cheyenne",
+    "Douglas C 47": "Douglas DC-3",
+    "Fairchild FC 2?": "Fairchild FC-2",
+    "Lockheed Orion 9DNC12286": "Lockheed Orion 9",
+    "Bell 206 L4 Jet Ranger IIIN180AL": "Bell 206 Jet Ranger",
+    "Douglas DC 3N711Y": "Douglas DC-3",
+    "Ford 4 AT": "Ford Tri-motor",
+    "Ford 5NC9650": "Ford Tri-motor",
+    "Lockheed 10 ElectraNC14905": "Lockheed 10 Electra",
+    "Travel Air B6000?": "Travel Air B-6000",
+    "Airbus A 310": "Airbus A310",
+    "Fokker F VIIb Channel Air BridgeG ARSF": "Fokker F.VII",
+    "Antonov 283C JJI": "Antonov An-28",
+    "de Havilland Comet 4BG ARJM": "De Havilland Comet",
+    "Fokker F 28 Fellowship 1000TC": "Fokker F-28 Fellowship",
+    "Lisunov LI 2CCCP": "Lisunov Li-2",
+    "Tupolev Tu 124CCCP": "Tupolev Tu-124",
+    "Boeing 747 2B5FHL": "Boeing 747",
+    "Tupolev TU 154EY": "Tupolev Tu-154",
+    "Antonov AN 24RVCCCP": "Antonov An-24",
+    "LET 410 MCCCP 67225": "Let L-410 Turbolet",
+    "Tupolev TU 104BCCCP": "Tupolev Tu-104",
+    "Boeing 247DNC13370": "Boeing 247D",
+    "Consolidated B 24 / Consolidated B": "Consolidated B-24 Liberator",
+    "Douglas DC 3ANC16060": "Douglas DC-3",
+    "Douglas DC 8": "McDonnell Douglas DC-8",
+    "Ilyushin IL 18CCCP": "Ilyushin Il-18",
+    "Yakovlev 40CCCP 87630": "Yakovlev Yak-40",
+    "Ilyushin IL 14CCCP": "Ilyushin Il-14",
+    "Boeing B 757": "Boeing 757",
+    "Douglas C 47AYV": "Douglas DC-3",
+    "Douglas DC 3YV": "Douglas DC-3",
+    "PZL  Mielec M28GN": "PZL M-28 Skytruck",
+    "Yakovlev YAK 42DCU": "Yakovlev Yak-42",
+    "Douglas DC 6BB": "Douglas DC-6",
+    "British Aerospace 3101 Jetstream 31N410UE": "British Aerospace Jetstream",
+    "Curtiss  Wright R5C": "Curtiss-Wright R5C",
+    "Douglas C 124A Globemaster50": "Douglas C-124 Globemaster II",
+    "Ford Tri motor 4NC7687": "Ford Tri-motor",
+    "Convair C 131D (CV": "Convair C-131 Samaritan",
+    "Beechcraft 18HN390R": "Beechcraft 18",
+    "De Havilland DH 4315": "De Havilland DH 4",
+    "Douglas DC 6BF": "Douglas DC-6",
+    "Antonov 10ACCCP 11180": "Antonov An-10",
+    "Douglas DC 3APP": "Douglas DC-3",
+    "Douglas DC 3VP": "Douglas DC-3",
+    "Lockheed L 188A Electra9Q ??": "Lockheed L-188 Electra",
+    "Antonov AN 26?": "Antonov An-26",
+    "Mil Mi 8?": "Mil Mi-8",
+    "Douglas DC 6N90893": "Douglas DC-6",
+    "Beech Queen Air 65 A80N50NP": "Beechcraft Queen Air",
+    "Boeing RC 135T55": "Boeing RC-135",
+    "Douglas C 475895": "Douglas DC-3",
+    "Douglas DC 6BFN77DG": "Douglas DC-6",
+    "Fairchild 71(amphibious)NC9777": "Fairchild 71",
+    "Twin Apache?": "Piper Twin Apache",
+    "Lockheed C 130H": "Lockheed C-130 Hercules",
+    "Antonov 12BPER ACE": "Antonov An-12",
+    "Antonov AN 12EL": "Antonov An-12",
+    "CASA 212 Aviocar 200T 400": "CASA C-212 Aviocar",
+    "Hawker Siddeley HS 748 1LV": "Hawker Siddeley HS 748",
+    "de Havilland DH.104 Dove LQ XWW": "De Havilland DH.104 Dove",
+    "ConvairCV  440N131T": "Convair CV-440",
+    "Eurocopter EC 130B4N155GC": "Eurocopter EC 130",
+    "Bristol Britannia 312G AOVO": "Bristol Britannia",
+    "Ilyushin IL 14PCCCP": "Ilyushin Il-14",
+    "Lockheed WV 2BU": "Lockheed WV-2",
+    "Tupolev TU 134ACCCP": "Tupolev Tu-134",
+    "Douglas DC 3OO": "Douglas DC-3",
+    "Douglas DC 3CP": "Douglas DC-3",
+    "Douglas DC 4CP": "Douglas DC-4",
+    "Beechcraft Super King Air 200Z3 BAB": "Beechcraft Super King Air",
+    "Bandeirante EMB 110P1PT": "Embraer EMB 110 Bandeirante",
+    "Douglas C 472040": "Douglas DC-3",
+    "Douglas DC 3 / USN R4": "Douglas DC-3",
+    "Douglas DC 4PP": "Douglas DC-4",
+    "Embraer 110C BandeirantePP SBB": "Embraer EMB 110 Bandeirante",
+    "Embraer 110C BandeirantePP SBE": "Embraer EMB 110 Bandeirante",
+    "Embraer 110P BandeirantePT TBB": "Embraer EMB 110 Bandeirante",
+    "Fokker 27 Friendship 200PT LCG": "Fokker F-27 Friendship",
+    "Latecoere 28F AJOX": "Latécoère 28",
+    "Lockheed 18 LoadstarPP NAE": "Lockheed 18 Lodestar",
+    "deHavilland DH 86VH": "De Havilland DH.86",
+    "Douglas DC 4F": "Douglas DC-4",
+    "Aero Commander 500AN6143X": "Aero Commander 500",
+    "Boeing 40 NC291": "Boeing 40",
+    "Consolidated PBY 2 / Consolidated PBY": "Consolidated PBY",
+    "Douglas C 118A / Lockheed P2V": "Douglas C-118A",
+    "Douglas DC 3ANC16073": "Douglas DC-3",
+    "Douglas DC 3N15570": "Douglas DC-3",
+    "Douglas DC 6N901MA": "Douglas DC-6",
+    "Douglas R4D 650765": "Douglas DC-3",
+    "Douglas R5D239116": "Douglas DC-4",
+    "Lockheed 1049H Super ConstellationN9740Z": "Lockheed 1049 Super Constellation",
+    "Sikorsky S 62AN324Y": "Sikorsky S-62",
+    "Goodyear  Zeppelin U.S.S. Macon (airship)ZRS": "Goodyear-Zeppelin Macon",
+    "Consolidated  32 Liberator IIF BEFX": "Consolidated Liberator",
+    "Avro 685 York 1G AHFA": "Avro York",
+    "Bristol 170 Freighter 31CF FZU": "Bristol 170 Freighter",
+    "Douglas DC 3C": "Douglas DC-3",
+    "Bell UH 1HCC": "Bell UH-1",
+    "British Aerospace BAe 146": "British Aerospace 146",
+    "Curtiss C 46AN68823": "Curtiss C-46",
+    "Douglas DC 6BCC": "Douglas DC-6",
+    "Douglas DC 245": "Douglas DC-2",
+    "Canadair CL 44HK": "Canadair CL-44",
+    "Consolidated PBY 5A CatalinaHK": "Consolidated PBY-5A Catalina",
+    "Convair CV 440HP": "Convair CV-440",
+    "Curtiss C 46AHK": "Curtiss C-46",
+    "Douglas C 47AHK": "Douglas DC-3",
+    "Douglas DC 4C": "Douglas DC-4",
+    "Douglas DC 6AHK": "Douglas DC-6",
+    "Douglas DC 6BFHK": "Douglas DC-6",
+    "Fairchild F 27HK": "Fairchild F-27",
+    "Grumman G 159 Gulfstream IHK": "Grumman G-159 Gulfstream I",
+    "Cessna 208A Caravan I CargomasterN820FE": "Cessna 208A Caravan I",
+    "Cessna 560 Citation VN500AT": "Cessna 560 Citation V",
+    "Curtiss C 46ENC59486": "Curtiss C-46",
+    "Boeing 247DC 79": "Boeing 247",
+    "de Havilland Canada DHC 6 Twin Otter 100N124PM": "De Havilland Canada DHC-6 Twin Otter",
+    "Pitcairn PA 6 MailwingNC801H": "Pitcairn PA-6 Mailwing",
+    "Transall C 1605063": "Transall C-160",
+    "Transall C 160D50": "Transall C-160",
+    "Yakovlev YAK 40CU": "Yakovlev Yak-40",
+    "Tupolev TU 154CCCP": "Tupolev Tu-154",
+    "Douglas DC 3NC54451": "Douglas DC-3",
+    "Vickers 628 Viking 1BOY DLU": "Vickers 628 Viking",
+    "Nord 2501 Noratlas140/88JA": "Nord 2501 Noratlas",
+    "Sikorsky S 61NAP": "Sikorsky S-61",
+    "Curtiss C 46TAM": "Curtiss C-46",
+    "de Havilland Canada DHC 6 Twin Otter 300FAE447": "De Havilland Canada DHC-6 Twin Otter",
+    "Antonov 12VS9 SVN": "Antonov An-12",
+    "Curtiss  Wright C": "Curtiss-Wright C-46",
+    "Douglas DC 6BPH": "Douglas DC-6",
+    "Bell UH 1H / Bell UH": "Bell UH-1H",
+    "Douglas C 47 DakotaKG630": "Douglas DC-3",
+    "Farman F 63F": "Farman F.63",
+    "Vickers 813 ViscountG OHOT": "Vickers 813 Viscount",
+    "Antonov AN 28ES": "Antonov An-28",
+    "Antonov AN 121506": "Antonov An-12",
+    "Douglas DC 3ET": "Douglas DC-3",
+    "Beech D18SN2999": "Beechcraft D18S",
+    "Boeing B 720": "Boeing 720",
+    "Curtiss C 46AYS": "Curtiss C-46",
+    "Fairchild?": "Fairchild",
+    "Lockheed L 649 ConstellationNC112A": "Lockheed L-649 Constellation",
+    "Junkers JU 52/3mD": "Junkers Ju 52",
+    "Junkers JU.52D APAR": "Junkers Ju 52",
+    "Latecoere 631 (flying boat)F BDRD": "Latécoère 631",
+    "Lioré  et": "Lioré et Olivier",
+    "Vickers 952F VanguardF GEJE": "Vickers 952 Vanguard",
+    "Consolidated PBY 5A  CatalinaF": "Consolidated PBY-5A Catalina",
+    "Douglas DC 3NC28394": "Douglas DC-3",
+    "Airspeed Ambassador AS 57G": "Airspeed Ambassador",
+    "Douglas DC 3OY": "Douglas DC-3",
+    "Learjet 35AI MOCO": "Learjet 35",
+    "Swearingen SA.227AC Metro IIID CABB": "Swearingen SA227 Metro III",
+    "Lockheed C 130H748": "Lockheed C-130 Hercules",
+    "IAI 1124 WestwindYV 160CP": "IAI 1124 Westwind",
+    "GAF Nomad N 24AN224E": "GAF Nomad",
+    "Douglas DC 6HR": "Douglas DC-6",
+    "Let L 410 UVPE": "Let L-410 Turbolet",
+    "Douglas DC 3VR": "Douglas DC-3",
+    "Airbus A320 231VT": "Airbus A320",
+    "Fairchild C 119G?": "Fairchild C-119 Flying Boxcar",
+    "Fokker F 27 Friendship 200PH": "Fokker F-27 Friendship",
+    "Ilyushin IL 14?": "Ilyushin Il-14",
+    "Sud Aviation SE 210 Caravelle VINVT": "Sud Aviation Caravelle",
+    "Lockheed C 130B Hercules58": "Lockheed C-130 Hercules",
+    "de Havilland Canada DHC 6 Twin Otter 100PK": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas DC 6XW": "Douglas DC-6",
+    "Lockheed L 188C ElectraPK": "Lockheed L-188 Electra",
+    "Beechcraft Bonanza 35N3794N": "Beechcraft Bonanza",
+    "ATR 72 212EP": "ATR 72",
+    "Ilyushin Il 76MD15": "Ilyushin Il-76",
+    "Lockheed C 130 Hercules?": "Lockheed C-130 Hercules",
+    "Tupolev TU 154EP": "Tupolev Tu-154",
+    "Tupolev TU 154M / Sukhoi Su": "Tupolev Tu-154M",
+    "Douglas DC 7CI": "Douglas DC-7C",
+    "Swearingen SA 227BC Metro IIIEC": "Swearingen SA227 Metro III",
+    "Dornier 328 110D": "Dornier 328",
+    "Douglas DC 6BOO": "Douglas DC-6",
+    "Douglas DC 6OO": "Douglas DC-6",
+    "Douglas VC 47A42": "Douglas C-47",
+    "Savoia  Marchetti SM": "Savoia-Marchetti",
+    "Vickers 614 Viking 1G AHPI": "Vickers 614 Viking",
+    "Boeing B 29?": "Boeing B-29",
+    "Convair CV 240": "Convair CV-240",
+    "Curtiss  Wright C46D": "Curtiss-Wright C-46",
+    "Yakovlev YAK 40CCCP": "Yakovlev Yak-40",
+    "Cessna 421N421TJ": "Cessna 421 Golden Eagle",
+    "Bristol 170 Freighter 21G AICS": "Bristol 170 Freighter",
+    "de Havilland Canada C 7A Caribou393": "De Havilland Canada C-7 Caribou",
+    "Douglas DC 3XW": "Douglas DC-3",
+    "Douglas DC 4XW": "Douglas DC-4",
+    "Antonov 12BPER ADL": "Antonov An-12",
+    "Bell 206BN14831": "Bell 206",
+    "Sikorsky S 62AN442Y": "Sikorsky S-62",
+    "Boeing 747 249FN807FT": "Boeing 747",
+    "Antonov AN 24VTZ": "Antonov An-24",
+    "Avro 685 York C 1G": "Avro York",
+    "Avro Shackleton MR 2WL794": "Avro Shackleton",
+    "Fokker Universal F 14?": "Fokker Universal",
+    "Douglas DC 7N842D": "Douglas DC-7",
+    "Antonov AN 12CU": "Antonov An-12",
+    "Lockheed 10 ElectraXA BAS": "Lockheed 10 Electra",
+    "Stearman C 3MBNC6411": "Stearman C-3M",
+    "Swearingen SA.227AT Merlin IVCN318DH": "Swearingen SA227 Merlin",
+    "De Havilland DH 4130": "De Havilland DH 4",
+    "Antonov 12BPUR LIP": "Antonov An-12",
+    "Curtiss C 46A42": "Curtiss C-46",
+    "Latécoère 28F AJPA": "Latécoère 28",
+    "Lockheed 14 H2 Super ElectraCR": "Lockheed 14 Super Electra",
+    "Fokker F 27 Friendship 600XY": "Fokker F-27 Friendship",
+    "Antonov AN 10ACCCP": "Antonov An-10",
+    "Cant Z 506I": "CANT Z.506",
+    "CASA 212 Aviocar 200FAP215": "CASA C-212 Aviocar",
+    "Dormier Do J": "Dornier Do J Wal",
+    "Douglas C 4775": "Douglas DC-3",
+    "Douglas DC 39Q": "Douglas DC-3",
+    "Douglas DC 3PH": "Douglas DC-3",
+    "Latecoere 32F AITX": "Latécoère 32",
+    "Latecoere 301 (flying boat)F ANLE": "Latécoère 301",
+    "Lockheed MC 130E": "Lockheed C-130 Hercules",
+    "Sikorsky CH53D / Sikorsky CH53D357 / 903": "Sikorsky CH-53",
+    "Consolidated LiberatorG AGDR": "Consolidated Liberator",
+    "Boeing 40NC280": "Boeing 40",
+    "de Havilland DHC 6 Twin Otter 4009N": "De Havilland Canada DHC-6 Twin Otter",
+    "PAC 750XL9N AJB": "Pacific Aerospace PAC 750XL",
+    "Boeing 737 8F2TC": "Boeing 737",
+    "De Havilland DH 467": "De Havilland DH 4",
+    "Bombardier DHC 8": "De Havilland Canada DHC-8 Dash 8",
+    "Desoutter IIZK ACA": "Desoutter II",
+    "Douglas DC 6AN34954": "Douglas DC-6",
+    "Douglas DC 6N90891": "Douglas DC-6",
+    "Embraer 110P2 BandeiranteP2 RDM": "Embraer EMB 110 Bandeirante",
+    "Fokker F 27 Friendship 500ZK": "Fokker F-27 Friendship",
+    "Lockheed 1339N520S": "Lockheed 1339 JetStar",
+    "Lockheed  188A ElectraN6101A": "Lockheed L-188 Electra",
+    "Martin 404N40416": "Martin 404",
+    "McDonnell Douglas DC 10": "McDonnell Douglas DC-10",
+    "Avro AnsonCF FEO": "Avro Anson",
+    "Consolidated 32 3 Liberator IIAL": "Consolidated Liberator",
+    "Bristol 170 Freighter 21EVR NAD": "Bristol 170 Freighter",
+    "Lockheed C 130H Hercules74": "Lockheed C-130 Hercules",
+    "Swearingen SA227 ACN622AV": "Swearingen SA227 Merlin",
+    "Antonov AN 12BPBL534": "Antonov An-12",
+    "Beechcraft Super King Air 200VH AAV": "Beechcraft Super King Air",
+    "Curtiss Carrier Pigeon602": "Curtiss Carrier Pigeon",
+    "Douglas C 47ANC36498": "Douglas DC-3",
+    "Lockheed 14 H2 Super ElectraCF": "Lockheed 14 Super Electra",
+    "Douglas C 47BKK120": "Douglas DC-3",
+    "Douglas C 47BAP": "Douglas DC-3",
+    "Fokker F 27 Friendship 20010254": "Fokker F-27 Friendship",
+    "Douglas DC 3HP": "Douglas DC-3",
+    "Britten Norman BN 2A TrislanderP2": "Britten-Norman BN-2A Trislander",
+    "de Havilland DHC 6 Twin Otter 300P2": "De Havilland Canada DHC-6 Twin Otter",
+    "Consolidated 32 2 Liberator IIG": "Consolidated Liberator",
+    "De Havilland DH 4291": "De Havilland DH 4",
+    "Yakovlev YAK 40OB": "Yakovlev Yak-40",
+    "Fokker F 27 Friendship 100PI": "Fokker F-27 Friendship",
+    "Hawker Siddeley HS 748 2RP": "Hawker Siddeley HS 748",
+    "MH  47 Chinook helicopter92": "Boeing CH-47 Chinook",
+    "Junkers 52/3m 4V+DR": "Junkers Ju 52",
+    "Antonov 12BPLZ SFG": "Antonov An-12",
+    "Boeing B 314 (flying boat)NC18603": "Boeing B-314 Clipper",
+    "Douglas C 54282": "Douglas DC-4",
+    "Douglas DC 3CF": "Douglas DC-3",
+    "Stinson Model AVH UHH": "Stinson Model A",
+    "de Havilland DHC  6": "De Havilland Canada DHC-6 Twin Otter",
+    "Vickers Viscount 748DVP YND": "Vickers 748D Viscount",
+    "Eurocopter  AS332L2 Super PumaPP MUM": "Eurocopter AS332 Super Puma",
+    "Antonov AN 24VYR": "Antonov An-24",
+    "Antonov AN 12VRA": "Antonov An-12",
+    "Antonov AN 148": "Antonov An-148",
+    "Antonov AN 2607RED": "Antonov An-26",
+    "Ilyushin II 14CCCP": "Ilyushin Il-14",
+    "Ilyushin IL 18DCCCP": "Ilyushin Il-18",
+    "Ilyushin IL 18VCCCP": "Ilyushin Il-18",
+    "Tupolev TU 104ACCCP": "Tupolev Tu-104",
+    "Tupolev Tu 114CCCP": "Tupolev Tu-114",
+    "V6 (airship)CCCP": "V-6 Airship",
+    "Shorts 360 100G": "Shorts 360",
+    "Convair CV  640N862FW": "Convair CV-640",
+    "Hawker Siddeley HS 748": "Hawker Siddeley HS 748",
+    "Avia 14TOK OCA": "Avia 14",
+    "Airbus A321 111SX": "Airbus A321",
+    "Douglas C 124C51": "Douglas C-124 Globemaster II",
+    "Pilatus PC 12/47ZS": "Pilatus PC-12",
+    "CASA 212 S1 Aviocar 100D": "CASA C-212 Aviocar",
+    "Douglas C 54B": "Douglas DC-4",
+    "Ilyushin 76TDST EWB": "Ilyushin Il-76",
+    "Lockheed C 130H?": "Lockheed C-130 Hercules",
+    "GAF Nomad N24APZ TBP": "GAF Nomad",
+    "Vickers Viscount 794DTC SEV": "Vickers 794D Viscount",
+    "Convair CV 990": "Convair CV-990",
+    "Airbus A300 622RB": "Airbus A300",
+    "ATR 72 600B": "ATR 72",
+    "Dornier 228 201B": "Dornier 228",
+    "Handley Page Dart Herald 201B 2009": "Handley Page Dart Herald",
+    "Douglas DC 3NC21767": "Douglas DC-3",
+    "Swearingen SA.226TC Metro IIN629EK": "Swearingen SA226 Metro II",
+    "Boeing 767 375ERN1217A": "Boeing 767",
+    "Douglas DC 3CN15HC": "Douglas DC-3",
+    "Douglas DC 3N17314": "Douglas DC-3",
+    "Grummand EA 6B163045/CY": "Grumman EA-6B Prowler",
+    "Antonov 265A DOW": "Antonov An-26",
+    "Boeing 737 86JTC": "Boeing 737",
+    "Douglas C 47ATC": "Douglas DC-3",
+    "Vickers Viscount 754D / Douglas C 47OD": "Vickers 754D Viscount",
+    "Antonov AN 24?": "Antonov An-24",
+    "Antonov AN 24RVUR": "Antonov An-24",
+    "Fokker F 50EP": "Fokker 50",
+    "Boeing 247NC13357": "Boeing 247",
+    "Beechcraft B200 Super King AirVH ZCR": "Beechcraft Super King Air",
+    "Douglas C 47B": "Douglas DC-3",
+    "Grumman G 21A seaplaneN4772C": "Grumman G-21 Goose",
+    "Dirigible Roma (airship)?": "Dirigible Roma",
+    "Douglas DC 3NC18142": "Douglas DC-3",
+    "Douglas DC 7BN849D": "Douglas DC-7B",
+    "Douglas DC 3 / Avro AnsonG": "Douglas DC-3",
+    "Beechcraft 99N199EA": "Beechcraft 99",
+    "Boeing XB 2941": "Boeing XB-29",
+    "Nord 262N29824": "Nord 262",
+    "Junkers F 13301": "Junkers F 13",
+    "Shorts 360 100 /Shorts 360": "Shorts 360",
+    "Convair CV 240N8407H": "Convair CV-240",
+    "Helicopter?": "Helicopter",
+    "Lockheed L 188AF Electra9Q": "Lockheed L-188 Electra",
+    "DHC  5 BuffaloAF316": "De Havilland Canada DHC-5 Buffalo",
+    "CASA 212 Aviocar 100PK PCX": "CASA C-212 Aviocar",
+    "Consolidated C 8741": "Consolidated C-87 Liberator Express",
+    "Douglas C 47VH": "Douglas DC-3",
+    "Airbus A350-941/de Havilla DHC": "Airbus A350-941",
+    "BAe 3212 Jetstream": "British Aerospace Jetstream",
+    "Fokker 505YJWG": "Fokker 50",
+    "Mil Mi 17?": "Mil Mi-17",
+    "Douglas DC 3N21786": "Douglas DC-3",
+    "Beechcraft 1900C 1N112AX": "Beechcraft 1900C",
+    "Beechcraft AT 11 KansanN65458": "Beechcraft AT-11 Kansan",
+    "Bell 205AN4048G": "Bell 205",
+    "Cessna 185AN1690Z": "Cessna 185",
+    "Curtiss C 46FN67933": "Curtiss C-46",
+    "de Havilland Canada DHC 4A CaribouN702SC": "De Havilland Canada DHC-4 Caribou",
+    "Douglas C47?": "Douglas DC-3",
+    "Douglas DC 3CN91006": "Douglas DC-3",
+    "Douglas DC 8JA8054": "McDonnell Douglas DC-8",
+    "Lear Jet 24AN651LJ": "Learjet 24",
+    "Boeing 707 321CCF": "Boeing 707",
+    "Douglas DC 3 Dakota?": "Douglas DC-3",
+    "Nord 262A 447T": "Nord 262",
+    "Sabca S 73OO": "Sabca S-73",
+    "Douglas DC 3LV": "Douglas DC-3",
+    "Vickers 615 Viking 1BT 11": "Vickers 615 Viking",
+    "de Havilland DH 114 Heron 2DCR": "De Havilland DH.114 Heron",
+    "Lockheed 14 ElectraVH ABI": "Lockheed 14 Super Electra",
+    "Stinson Model AVH UYY": "Stinson Model A",
+    "Mil Mi 8 (helicopter)?": "Mil Mi-8",
+    "Britten  Norman BN": "Britten-Norman",
+    "de Havilland Canada DHC 6 Twin Otter 300C": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas DC 4N45342": "Douglas DC-4",
+    "Fokker F VIIOO": "Fokker F.VII",
+    "Junkers JU 52?": "Junkers Ju 52",
+    "Curtiss C 46FCP": "Curtiss C-46",
+    "Douglas C 47CP": "Douglas DC-3",
+    "Douglas C 47TAM": "Douglas DC-3",
+    "Douglas C 54TAM": "Douglas DC-4",
+    "Douglas DC 3TAM": "Douglas DC-3",
+    "Douglas EC 54UCP": "Douglas DC-4",
+    "Curtiss C 46DCP": "Curtiss C-46",
+    "Avro 685 York 1G AHEX": "Avro York",
+    "Embraer EMB 110C BandeirantePT": "Embraer EMB 110 Bandeirante",
+    "Embraer 110C BandeirantePT TBD": "Embraer EMB 110 Bandeirante",
+    "Embraer 110P BandeirantePT GKW": "Embraer EMB 110 Bandeirante",
+    "Fairchild C 82APP": "Fairchild C-82 Packet",
+    "Junkers JU 52/3mPP": "Junkers Ju 52",
+    "Lockheed 18 LodestarPP SAC": "Lockheed 18 Lodestar",
+    "Lockheed L 1049G Super ConstillationD ALAK": "Lockheed 1049 Super Constellation",
+    "Sikorsky S 43B (flying boat)PP": "Sikorsky S-43",
+    "Douglas C 47AC": "Douglas DC-3",
+    "Douglas DC 3CC": "Douglas DC-3",
+    "Tupolev TU 134ALZ": "Tupolev Tu-134",
+    "Fairchild FH 227H5003": "Fairchild Hiller FH-227",
+    "Bell 206BN2209P": "Bell 206",
+    "Boeing 247DNC13315": "Boeing 247D",
+    "Curtiss C 46FN1240N": "Curtiss C-46",
+    "de Hav Can. DHC 6 Tw Otter 100/ CessnaN6383": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas DC 3NC25684": "Douglas DC-3",
+    "Douglas DC 7B / U.S. Air Force F": "Douglas DC-7B",
+    "F  88 Sabre Jet?": "North American F-86 Sabre",
+    "Ford 5 AT": "Ford Tri-motor",
+    "Gates Learjet 24BN12MK": "Learjet 24",
+    "Martin M 130 (flying boat)NC14715": "Martin M-130",
+    "McDonnell Douglas MD 83N963AS": "McDonnell Douglas MD-83",
+    "Stinson SM 6000BNC10813": "Stinson SM-6000B",
+    "??": "Unknown",
+    "Fokker F 27 Friendship 600G": "Fokker F-27 Friendship",
+    "Antonov AN 24B": "Antonov An-24",
+    "Antonov AN 24BB": "Antonov An-24",
+    "Curtis C 46XT": "Curtiss C-46",
+    "Curtiss C 46?": "Curtiss C-46",
+    "Douglas C 47?": "Douglas DC-3",
+    "Douglas DC 4 (C": "Douglas DC-4",
+    "Ford 5 AT Tri": "Ford Tri-motor",
+    "Shaanxi Yunshuji Y 8/Yunshuji Y": "Shaanxi Y-8",
+    "Black Hawk helicopter?": "Sikorsky UH-60 Black Hawk",
+    "Consolidated PBY 5 CatalinaHK": "Consolidated PBY-5 Catalina",
+    "de Havilland Canada DHC 6 Twin Otter 300HK": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas C 47FAC": "Douglas DC-3",
+    "Douglas DC 3 ( C": "Douglas DC-3",
+    "Douglas DC 3AHK": "Douglas DC-3",
+    "Douglas DC 3FAC": "Douglas DC-3",
+    "Douglas DC 3HK": "Douglas DC-3",
+    "Douglas DC 6": "Douglas DC-6",
+    "Embraer 110P1 BandeiranteHK 2638": "Embraer EMB 110 Bandeirante",
+    "Hawker Siddeley HS 748 260FAC": "Hawker Siddeley HS 748",
+    "Junkers JU 52624": "Junkers Ju 52",
+    "Sud Aviation SE 210 Caravelle 10RHK": "Sud Aviation Caravelle",
+    "Vickers Viscount 837HK 1347": "Vickers 837 Viscount",
+    "Beech King Air 200 CatpassN81PF": "Beechcraft King Air 200",
+    "Cessna 208A Caravan I CargomasterN835FE": "Cessna 208A Caravan I",
+    "Swearingen SA.227AC MetroN68TC": "Swearingen SA227 Metro",
+    "de Havilland DH 114 Heron 1BF": "De Havilland DH.114 Heron",
+    "Antonov AN 289Q": "Antonov An-28",
+    "Nord 262C 66TN": "Nord 262",
+    "Douglas DC 3": "Douglas DC-3",
+    "Fairchild FC 2NC5650": "Fairchild FC-2",
+    "CAMS 53F AJIR": "CAMS 53",
+    "CASA 212 Aviocar 200TI SAB": "CASA C-212 Aviocar",
+    "Let 410UVP EYS": "Let L-410 Turbolet",
+    "Martin 202A / DC 3N93211/N999B": "Martin 202A",
+    "Ilyushin IL 18DCU": "Ilyushin Il-18",
+    "DC3(C47)FAC  675": "Douglas DC-3",
+    "Ilyushin IL 18DSU": "Ilyushin Il-18",
+    "Douglas C 47 Skytrain (DC": "Douglas DC-3",
+    "Let 410UVPYV 928CP": "Let L-410 Turbolet",
+    "Avia 14OK MCZ": "Avia 14",
+    "Douglas DC 3OK": "Douglas DC-3",
+    "Nord 262A 449Q": "Nord 262",
+    "Douglas C  C47A": "Douglas DC-3",
+    "Douglas DC 3HI": "Douglas DC-3",
+    "Douglas C 54A42": "Douglas DC-4",
+    "Ilyushin II 76TDRDPL": "Ilyushin Il-76",
+    "Fairchild FH 227EHC": "Fairchild Hiller FH-227",
+    "Douglas C 54 SkymasterZS": "Douglas DC-4",
+    "Douglas DC 3SU": "Douglas DC-3",
+    "Boeing 777 236ERG": "Boeing 777",
+    "Canadair CL 604 N90AG": "Canadair CL-604 Challenger",
+    "Embraer 110P1 BandeiranteG ZAPE": "Embraer EMB 110 Bandeirante",
+    "Vickers ValettaWJ474": "Vickers Valetta",
+    "Vickers 610 Viking 1BG AHPK": "Vickers 610 Viking",
+    "CASA 212 100T": "CASA C-212 Aviocar",
+    "Antonov AN 2671383": "Antonov An-26",
+    "Douglas DC 3OH": "Douglas DC-3",
+    "Breguet 280TF AJKX": "Breguet 280",
+    "Dassault Falcon 20EF GHLN": "Dassault Falcon 20",
+    "de Havilland Canada DHC 8": "De Havilland Canada DHC-8 Dash 8",
+    "Dewoitine D 332F": "Dewoitine D.332",
+    "Douglas C 47 DakotaKN557": "Douglas DC-3",
+    "Douglas C 47BKN500": "Douglas DC-3",
+    "Douglas C 47F": "Douglas DC-3",
+    "Douglas DC 3DF": "Douglas DC-3",
+    "Fokker 100F GMPG": "Fokker 100",
+    "Fokker F 27 Friendship 500F": "Fokker F-27 Friendship",
+    "Fokker F VIIG": "Fokker F.VII",
+    "Handley Page O/10G EATN": "Handley Page O/10",
+    "Nord 262A 34F": "Nord 262",
+    "SNCASE SE.2010 ArmagnacF BAVG": "SNCASE SE.2010 Armagnac",
+    "Antonov 24BER AFT": "Antonov An-24",
+    "Douglas DC 3N60331": "Douglas DC-3",
+    "Stearman 4N490W": "Stearman 4",
+    "Boeing KC 135E59": "Boeing KC-135",
+    "Convair CV 440": "Convair CV-440",
+    "Junkers JU 38D": "Junkers Ju 38",
+    "CMASA WalI AZDA": "CMASA Wal",
+    "Lockheed P2V Neptune131521": "Lockheed P2V Neptune",
+    "Douglas DC 3XH": "Douglas DC-3",
+    "Sud  Aviation  Caravelle VI": "Sud Aviation Caravelle",
+    "Douglas DC 3N4662": "Douglas DC-3",
+    "Douglas DC 6AHR": "Douglas DC-6",
+    "Lockheed C 130A56": "Lockheed C-130 Hercules",
+    "Ilyushin IL 18VHA": "Ilyushin Il-18",
+    "Antonov AN 24V5605": "Antonov An-24",
+    "Junkers JU 52/3mHA": "Junkers Ju 52",
+    "Let 410UVP E4HA": "Let L-410 Turbolet",
+    "Douglas DC 3TF": "Douglas DC-3",
+    "Curtiss C 46N1648M": "Curtiss C-46",
+    "Stinson SM 2ANC443H": "Stinson SM-2",
+    "Douglas C 4777": "Douglas DC-3",
+    "Fokker F 27 Friendship 2009N": "Fokker F-27 Friendship",
+    "Swearingen SA.226TC Metro IIN63Z": "Swearingen SA226 Metro II",
+    "Boeing 737 524PK": "Boeing 737",
+    "CASA 212 MP Aviocar 200U": "CASA C-212 Aviocar",
+    "CASA NC 212": "CASA C-212 Aviocar",
+    "CASA 212 Aviocar 200PK NCY": "CASA C-212 Aviocar",
+    "CASA 212 Aviocar 200PK PCM": "CASA C-212 Aviocar",
+    "Consolidated LiberatorA72 70": "Consolidated Liberator",
+    "Lockheed HudsonA16 79": "Lockheed Hudson",
+    "Lockheed 14 Super ElectraPK AFO": "Lockheed 14 Super Electra",
+    "Shorts SC 7 Skyvan 3": "Shorts SC.7 Skyvan",
+    "de Havilland Canada DHC 6 Twin Otter 300PK": "De Havilland Canada DHC-6 Twin Otter",
+    "Bell 407N445MT": "Bell 407",
+    "Convair CV 340N73154": "Convair CV-340",
+    "Boeing 707 3J9CEP": "Boeing 707",
+    "Boeing 737 8KV WLUR": "Boeing 737",
+    "Dassault Falcon 2015 2233": "Dassault Falcon 20",
+    "Lockheed 1329 Jetstar 81003": "Lockheed JetStar",
+    "Antonov 26B 100ER": "Antonov An-26",
+    "CH53E Sea Stallion164536": "Sikorsky CH-53E Sea Stallion",
+    "Lockheed Hercules C.1XV179": "Lockheed C-130 Hercules",
+    "Sikorsky UH 60L Black Hawk?": "Sikorsky UH-60 Black Hawk",
+    "UH  60L Black Hawk91": "Sikorsky UH-60 Black Hawk",
+    "Avro Shackleton M 2 / Avro Shakleton M": "Avro Shackleton",
+    "Douglas DC 3EI": "Douglas DC-3",
+    "Avro 688G AGRG": "Avro Tudor",
+    "de Havilland DH106 Comet 1G ALYP": "De Havilland Comet",
+    "Douglas DC 6PI": "Douglas DC-6",
+    "Fokker F 28 Fellowship 1000I": "Fokker F-28 Fellowship",
+    "Savoia Marchetti SM 95I": "Savoia-Marchetti SM.95",
+    "Vickers Valetta Mk1 / Avero LancasterVX562 / TX270": "Vickers Valetta",
+    "AirbusA310  3045Y": "Airbus A310",
+    "Lockheed 1049E Super ConstellationHK 177": "Lockheed 1049 Super Constellation",
+    "CASA 212 A3 Aviocar 100324": "CASA C-212 Aviocar",
+    "Boeing KC 135A57": "Boeing KC-135",
+    "Lockheed L 188AF ElectraN357Q": "Lockheed L-188 Electra",
+    "Canadair CRJ 200ERUP": "Bombardier CRJ200",
+    "Grumman G 159 Gulfstream I5Y": "Grumman G-159 Gulfstream I",
+    "Boeing 747 412FTC": "Boeing 747",
+    "Antonov AN 12 CCCP": "Antonov An-12",
+    "Boeing 737 8ASET": "Boeing 737",
+    "de Havilland Comet 4CSU ALC": "De Havilland Comet",
+    "Shorts 360 300HB": "Shorts 360",
+    "Boeing B 29A Superfortress44": "Boeing B-29 Superfortress",
+    "Mi  17 HelicopterVAM": "Mil Mi-17",
+    "Farman 190F AJJK": "Farman 190",
+    "Junkers Ju 52/3mF": "Junkers Ju 52",
+    "Short S 26 (flying boat)G": "Short S.26",
+    "Douglas C 47ANC53210": "Douglas DC-3",
+    "Lockheed P 3A Orion149672": "Lockheed P-3 Orion",
+    "Curtiss C 46XA": "Curtiss C-46",
+    "de Havilland DHC 6 Twin Otter 300XC": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas DC 3A": "Douglas DC-3",
+    "Lockheed C 60 Lodestar60": "Lockheed C-60 Lodestar",
+    "Embraer 120RT BrasiliaN265CA": "Embraer EMB 120 Brasilia",
+    "Bell 296BN1498W": "Bell 206",
+    "Convair 580 11AN844H": "Convair CV-580",
+    "Douglas DC 3AN49551": "Douglas DC-3",
+    "Travel Air A6000A?": "Travel Air A-6000A",
+    "Vickers Viscount 812N242V": "Vickers 812 Viscount",
+    "Antonov AN 26V": "Antonov An-26",
+    "Lockheed 14 H Super ElectraNC17389": "Lockheed 14 Super Electra",
+    "Lockheed 14H Super ElectraNC 17388": "Lockheed 14 Super Electra",
+    "Antonov AN 2RA": "Antonov An-2",
+    "Bristol 170 Freighter 31MC FWAD": "Bristol 170 Freighter",
+    "British Aerospace BAe 125": "British Aerospace 125",
+    "Britten Norman BN 2A": "Britten-Norman BN-2",
+    "Britten Norman BN IslanderHH CNC": "Britten-Norman Islander",
+    "CAMS 53F AISV": "CAMS 53",
+    "Cessna 441 ConquestN442NC": "Cessna 441 Conquest",
+    "de Havilland Canada U 1A Otter55": "De Havilland Canada DHC-3 Otter",
+    "Douglas C 124C52": "Douglas C-124 Globemaster II",
+    "Douglas C 4770": "Douglas DC-3",
+    "Douglas C 47API": "Douglas DC-3",
+    "Latecoere 26F AIMU": "Latécoère 26",
+    "Lockheed WV 2 Super ConstellationBU143193": "Lockheed WV-2 Super Constellation",
+    "Sikorsky S 76C++N748P": "Sikorsky S-76",
+    "Avro 688 Tudor IG AHNP": "Avro Tudor",
+    "Airbus A320 111F": "Airbus A320",
+    "Boeing 95NC184E": "Boeing 95",
+    "ATR 72 500": "ATR 72",
+    "Douglas C 54P50850": "Douglas DC-4",
+    "Douglas DC 3NC1946": "Douglas DC-3",
+    "Lockheed L 188A ElectraN5532": "Lockheed L-188 Electra",
+    "Airbus A320 214N106US": "Airbus A320",
+    "Bell 206 L 1N40TE": "Bell 206 Jet Ranger",
+    "Boeing 707 123N7502A": "Boeing 707",
+    "Cessna 208B Caravan I Super CargomasterN854FE": "Cessna 208B Caravan I",
+    "Curtiss Condor 18NC185H": "Curtiss AT-32 Condor",
+    "Douglas DC 3N50046": "Douglas DC-3",
+    "Embraer EMB 110 BandeiranteN49BA": "Embraer EMB 110 Bandeirante",
+    "Fairchild FC 2NC3780": "Fairchild FC-2",
+    "Lockheed L 749 / Cessna 140NC86530/NC76981": "Lockheed L-749 Constellation",
+    "Farman F 224F": "Farman F.224",
+    "Junkers F 13D": "Junkers F 13",
+    "Junkers F 13K": "Junkers F 13",
+    "Latecoere 32F AISN": "Latécoère 32",
+    "Lockheed L 749A ConstellationHH": "Lockheed L-749A Constellation",
+    "Martin MarinerCS THB": "Martin PBM Mariner",
+    "Mil Mi 4 / Mil Mi": "Mil Mi-4",
+    "Short Sunderland 3G AGIB": "Short Sunderland",
+    "Embraer ERJ 190ARC9": "Embraer E190",
+    "Douglas C 47A9N": "Douglas DC-3",
+    "Pilatus PC 6/B2": "Pilatus PC-6 Porter",
+    "Aerospatiale AS350N5793P": "Aérospatiale AS350 Ecureuil",
+    "Douglas MC 54M44": "Douglas DC-4",
+    "Fairchild F 27AN745L": "Fairchild F-27",
+    "Bristol 170 Freighter 31ZK AYH": "Bristol 170 Freighter",
+    "Budd RB 1 Conestoga?": "Budd C-93 Conestoga",
+    "Douglas DC 3N17891": "Douglas DC-3",
+    "Douglas DC 6NC90741": "Douglas DC-6",
+    "Douglas DC 7BN815D": "Douglas DC-7B",
+    "IAI 1124A WestwindN61RS": "IAI 1124 Westwind",
+    "Lockheed L 18": "Lockheed 18 Lodestar",
+    "Lockheed Orion 9NC12221": "Lockheed Orion 9",
+    "Martin 202N93039": "Martin 202",
+    "Northrop DeltaNC12292": "Northrop Delta",
+    "Lockheed P 3A151362": "Lockheed P-3 Orion",
+    "BAC VC 10": "Vickers VC10",
+    "Boeing 747 246F9G": "Boeing 747",
+    "Fokker F 28 Fellowship 20005N": "Fokker F-28 Fellowship",
+    "Aero Commander 680FZK BWA": "Aero Commander 680",
+    "Martin 404N40406": "Martin 404",
+    "?42  52196": "Unknown",
+    "de Havilland DH 114 Heron 2BLN": "De Havilland DH.114 Heron",
+    "Douglas C 47APH": "Douglas DC-3",
+    "Vickers Viscount 720VH TVC": "Vickers 720 Viscount",
+    "Douglas DC 3NC29086": "Douglas DC-3",
+    "Douglas M 4NC792": "Douglas M-4",
+    "Hamilton H 47NC7521": "Hamilton H-47",
+    "Travel Air 4000NC5436": "Travel Air 4000",
+    "Douglas C 47BCF": "Douglas DC-3",
+    "Swearingen SA227 AC Metro IIC": "Swearingen SA227 Metro II",
+    "Boeing 247NC13345": "Boeing 247",
+    "Beechcraft 1900C 1AP": "Beechcraft 1900C",
+    "Ilyushin Il 76TD4L": "Ilyushin Il-76",
+    "Learjet 25BN5UJ": "Learjet 25B",
+    "Airbus 320 271NCC": "Airbus A320",
+    "de Havilland Canada DHC 6 Twin Otter 300FAE": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas C 48VH": "Douglas C-48",
+    "Fokker F27 Friendship 100RP C6888": "Fokker F-27 Friendship",
+    "Antonov AN 24BSP": "Antonov An-24",
+    "Lisunov Li 2PSP": "Lisunov Li-2",
+    "Lockhed 10 ElectraSP AYD": "Lockheed 10 Electra",
+    "Airbus A 300": "Airbus A300",
+    "Lisunov Li 2YR": "Lisunov Li-2",
+    "Antonov AN 12RA": "Antonov An-12",
+    "Antonov An 12TBCCCP": "Antonov An-12",
+    "Antonov AN 12V?": "Antonov An-12",
+    "Antonov An 2 / Mil Mi": "Antonov An-2",
+    "Antonov AN 22ACCCP": "Antonov An-22",
+    "Boeing 737 53AVQ": "Boeing 737",
+    "Grazhdansky Vozdushnyi Flot PS 84CCCP": "Lisunov Li-2",
+    "Ilushin Il 14YR": "Ilyushin Il-14",
+    "Ilyushin 18VRA 75840": "Ilyushin Il-18",
+    "Ilyushin Il 76RF": "Ilyushin Il-76",
+    "Lisunov Li 2CCCP L": "Lisunov Li-2",
+    "Mil Mi 8TRA": "Mil Mi-8",
+    "Tupolev Tu 142M3RF": "Tupolev Tu-142",
+    "Canadair CRJ 100ER5Y": "Bombardier CRJ100",
+    "Douglas DC 6AN3486F": "Douglas DC-6",
+    "Lockheed 14 ElectraCF TCL": "Lockheed 14 Super Electra",
+    "Avro Shackleton MR 2WL746": "Avro Shackleton",
+    "Boeing  Vertol ChinookG": "Boeing CH-47 Chinook",
+    "Ilyushin IL 76MDRA": "Ilyushin Il-76",
+    "Aerospatiale AS 350B2 EcureuilZK HKU": "Aérospatiale AS350 Ecureuil",
+    "Antonov 12BKEY 406": "Antonov An-12",
+    "Boeing Vertol CH 47C68": "Boeing CH-47 Chinook",
+    "De Havilland DH.80ZS ACD": "de Havilland DH.80 Puss Moth",
+    "de Havilland Canada C 7A Caribou62": "De Havilland Canada C-7 Caribou",
+    "Douglas C 47D4476574": "Douglas DC-3",
+    "Douglas DC 3XV": "Douglas DC-3",
+    "Fairchild C 119C51": "Fairchild C-119",
+    "Fairchild C 123K54": "Fairchild C-123 Provider",
+    "Fairchild C 123K55": "Fairchild C-123 Provider",
+    "Fokker F 28 Fellowship 4000HL": "Fokker F-28 Fellowship",
+    "Cessna 500 Citation IEC CGG": "Cessna 500 Citation",
+    "de Havilland DH 114 Heron 2DEC": "De Havilland DH.114 Heron",
+    "Antonov AN 32CR862": "Antonov An-32",
+    "Antonov 12ST JUA": "Antonov An-12",
+    "Junkers G 24D": "Junkers G 24",
+    "Sud Aviation Caravelle 10REC BDD": "Sud Aviation Caravelle",
+    "Convair CV 440SE": "Convair CV-440",
+    "Focke  Wulf FW 200D BAE": "Focke-Wulf Fw 200",
+    "Avro RJ100HB IXM": "British Aerospace Avro RJ100",
+    "Douglas DC 44X": "Douglas DC-4",
+    "Ilyushin IL 12BOK": "Ilyushin Il-12",
+    "Sud Aviation SE 210 Caravelle IIIB": "Sud Aviation Caravelle",
+    "ATR 42 5005H": "ATR 42",
+    "Cessna 208B Grand Caravan5H EGG": "Cessna 208B Grand Caravan",
+    "Douglas DC 6N90728": "Douglas DC-6",
+    "Douglas DC 7BN816D": "Douglas DC-7B",
+    "Grumman Gulfstream G3N85VT": "Grumman Gulfstream GIII",
+    "Lockheed VegaNC980Y": "Lockheed Vega",
+    "Martin PBM 3S  / Martin PBM": "Martin PBM Mariner",
+    "McDonnell Douglas MD 83TC": "McDonnell Douglas MD-83",
+    "Mil Mi 8TCCCP": "Mil Mi-8",
+    "Tupolev ANT 6CP": "Tupolev ANT-6",
+    "Kalinin K 7?": "Kalinin K-7",
+    "Boeing 40NC7465": "Boeing 40",
+    "Douglas C 53": "Douglas DC-3",
+    "Douglas DC 3NC16086": "Douglas DC-3",
+    "Lockheed L 188CF ElectraN859U": "Lockheed L-188 Electra",
+    "BAe 3101 Jetstream 31YV 1083C": "British Aerospace Jetstream",
+    "Cessna 402YV 478C": "Cessna 402",
+    "Lockheed 749 79": "Lockheed L-749 Constellation",
+    "Yakovlev YAK 40VN": "Yakovlev Yak-40",
+    "Douglas C 54B / P": "Douglas DC-4",
+    "Lockheed C 69 ConstellationN2737A": "Lockheed C-69 Constellation",
+    "Douglas C 54N88852": "Douglas DC-4",
+    "Douglas C 54ANC": "Douglas DC-4",
+    "Douglas C 54G (DC": "Douglas DC-4",
+    "Stearman M 2 SpeedmailNC8199": "Stearman M-2 Speedmail",
+    "Swearingen SA227AT Merlin IVCN439AF": "Swearingen SA227 Merlin",
+    "Douglas DC 4D": "Douglas DC-4",
+    "De Havilland DH 4?": "De Havilland DH 4",
+    "Douglas DC 3N74586": "Douglas DC-3",
+    "Antonov An 26420": "Antonov An-26",
+    "Lisunov LI 2YU": "Lisunov Li-2",
+    "Lockheed Hudson? ?VP  YRX": "Lockheed Hudson",
+    "Lockheed OrionXA BDH": "Lockheed Orion",
+    "Boeing 314A NC18612": "Boeing 314 Clipper",
+    "Ilyushin IL 76MCCCP": "Ilyushin Il-76",
+    "Lockheed C 130J Hercules08": "Lockheed C-130 Hercules",
+    "Lockheed L 100 Hercules5X": "Lockheed L-100 Hercules",
+    "Yakovlev YAK 40YA": "Yakovlev Yak-40",
+    "Bell 205 1N2215W": "Bell 205",
+    "Bell 206LN400EH": "Bell 206",
+    "Cessna 208 CaravanN9530F": "Cessna 208 Caravan",
+    "Douglas DC 4ANC88920": "Douglas DC-4",
+    "Lockheed L 100 HerculesN102AK": "Lockheed L-100 Hercules",
+    "Stinson AT 19N 79069": "Stinson AT-19",
+    "Douglas C 54ANC88785": "Douglas DC-4",
+    "Antonov 12BRA 11101": "Antonov An-12",
+    "Antonov AN 26D2": "Antonov An-26",
+    "Embraer EMB 120ERD2": "Embraer EMB 120 Brasilia",
+    "Mil Mi 8MTV (helicopter)H534": "Mil Mi-8",
+    "Fairchild Hiller FH 227BLV": "Fairchild Hiller FH-227",
+    "Boeing KC 97G Stratofreighter52": "Boeing KC-97 Stratofreighter",
+    "Cessna 402N3250Q": "Cessna 402",
+    "Yakovlev YAK 40EK": "Yakovlev Yak-40",
+    "Douglas C 47BA65": "Douglas DC-3",
+    "de Havilland DH 50AVH": "De Havilland DH.50",
+    "de Havilland DH 86VH": "De Havilland DH.86",
+    "de Havilland DH.80 Puss MothVH UPC": "De Havilland DH.80 Puss Moth",
+    "IAI 1124 WestwindVH IWJ": "IAI 1124 Westwind",
+    "Short S 23 (flying boat)VH": "Short S.23 Empire",
+    "Short S.23 Empire Flying BoatVH ABB": "Short S.23 Empire",
+    "Vickers 720 ViscountVH TVA": "Vickers 720 Viscount",
+    "Cessna 404 TitanOE FCT": "Cessna 404 Titan",
+    "Convair CV 340": "Convair CV-340",
+    "Ilyushin Il12CCCP L1450": "Ilyushin Il-12",
+    "Beechcraft 100 King AirC GXRX": "Beechcraft 100 King Air",
+    "Consolidated PBY 5A CatalinaCF": "Consolidated PBY-5A Catalina",
+    "Lockheed VegaNC103W": "Lockheed Vega",
+    "Consolidated LB 30": "Consolidated LB-30 Liberator",
+    "Douglas C 47ATAM": "Douglas DC-3",
+    "Ford Tri motor 5?": "Ford Tri-motor",
+    "Beech King Air F90PT LJR": "Beechcraft King Air F90",
+    "Douglas C 47APP": "Douglas DC-3",
+    "Douglas DC 3PP": "Douglas DC-3",
+    "Embraer 110C BandeirantePT": "Embraer EMB 110 Bandeirante",
+    "Embraer 110C BandeirantePT SBH": "Embraer EMB 110 Bandeirante",
+    "Embraer 110C BandeirantePT GKA": "Embraer EMB 110 Bandeirante",
+    "Embraer 110P BandeirantePT TBA": "Embraer EMB 110 Bandeirante",
+    "Fokker 100PT MRK": "Fokker 100",
+    "Lockheed C 130EC": "Lockheed C-130 Hercules",
+    "NAMC YS 11A": "NAMC YS-11A",
+    "Junkers JU 53/3mD": "Junkers Ju 52",
+    "Bell 206B helicopterN3456M": "Bell 206",
+    "Douglas A 3D Skywarrior?": "Douglas A-3 Skywarrior",
+    "Douglas DC 3 / Lockheed B": "Douglas DC-3",
+    "Douglas DC 6VH": "Douglas DC-6",
+    "Learjet 35AN30DK": "Learjet 35A",
+    "de Havilland Canada DHC 6 Twin Otter 300TJ": "De Havilland Canada DHC-6 Twin Otter",
+    "de Havilland Canada DHC 6 Twin Otter 100C": "De Havilland Canada DHC-6 Twin Otter",
+    "Heinkel HE 2D": "Heinkel He 2",
+    "Swearingen SA.226TC Metro IC GYPA": "Swearingen SA226 Metro II",
+    "Douglas R6D 1 (DC": "Douglas DC-6",
+    "Fairchild  Hiller FH": "Fairchild Hiller",
+    "Avia 14M 40B": "Avia 14",
+    "Douglas C 4769": "Douglas DC-3",
+    "Douglas DC 2NC14297": "Douglas DC-2",
+    "Ilyushin IL 14PB": "Ilyushin Il-14",
+    "McDonnell Douglas MD 82B": "McDonnell Douglas MD-82",
+    "Antonov AN 32BHK3929X": "Antonov An-32",
+    "Boeing 247C 144": "Boeing 247",
+    "de Havilland Canada DHC 6 Twin Otter 310HK": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas DC 3 / Piper PA": "Douglas DC-3",
+    "Douglas DC 3CHK": "Douglas DC-3",
+    "Junkers W 34C": "Junkers W 34",
+    "Let 410 UVP E10AHK": "Let L-410 Turbolet",
+    "Beechcraft 95 B55N414K": "Beechcraft 95",
+    "Cessna 208B Caravan IN12022": "Cessna 208B Caravan I",
+    "de Havilland Canada DHC 6 Twin Otter 2009Q": "De Havilland Canada DHC-6 Twin Otter",
+    "Let 410UVP9Q CUA": "Let L-410 Turbolet",
+    "Convair CV 340/440N8415N": "Convair CV-340/440",
+    "Lockheed 10 ElectraYU SBE": "Lockheed 10 Electra",
+    "Avia 14 40OK": "Avia 14",
+    "Avia 14OK MCT": "Avia 14",
+    "Antonov 12V9Q CWC": "Antonov An-12",
+    "Antonov AN 269Q": "Antonov An-26",
+    "Airbus A321 231EI": "Airbus A321",
+    "Lockheed CC 130E130322": "Lockheed C-130 Hercules",
+    "BAC One Eleven 200ABG": "BAC One-Eleven",
+    "Consolidated B24H42 50347": "Consolidated B-24 Liberator",
+    "Consolidated LB 40": "Consolidated LB-30 Liberator",
+    "Douglas C 47AG": "Douglas DC-3",
+    "Douglas C188 B1311588": "Douglas C-118",
+    "Junkers W 33 D": "Junkers W 33",
+    "Vickers 610 Viking 1BG": "Vickers 610 Viking",
+    "Vickers Vanguard 951G APEE": "Vickers Vanguard",
+    "Zeppelin L 31 (airship)?": "Zeppelin L 31",
+    "Lockheed L 749A": "Lockheed L-749A Constellation",
+    "Lockheed 18 LodestarNC18199": "Lockheed 18 Lodestar",
+    "Bleriot Spad 56F AIMN": "Bleriot-Spad S.56",
+    "Douglas C 74HP": "Douglas C-74 Globemaster",
+    "Douglas DC 3G": "Douglas DC-3",
+    "Farman F 301F": "Farman F.301",
+    "Handley Page W 8G": "Handley Page W.8",
+    "Royal Airship Works R 101G": "Royal Airship Works R.101",
+    "Salmson 2 A": "Salmson 2A2",
+    "Short Stirling IVLJ668": "Short Stirling",
+    "Zeppelin L 44 (airship)?": "Zeppelin L 44",
+    "Dornier DO.18 (float plane)D AROZ": "Dornier Do 18",
+    "Messerschmitt M 20BD": "Messerschmitt M 20",
+    "Savbia  Marchetti  S": "Savoia-Marchetti",
+    "Zeppelin L 2 (airship)?": "Zeppelin L 2",
+    "de Havilland Comet 4BG ARCO": "De Havilland Comet",
+    "Douglas DC 3SX": "Douglas DC-3",
+    "Douglas DC 4": "Douglas DC-4",
+    "Short Empire flying boatG ADVC": "Short S.23 Empire",
+    "Curtiss C 46DHK": "Curtiss C-46",
+    "Douglas C 47FAGO961": "Douglas DC-3",
+    "Fairchild C 123 Provider55": "Fairchild C-123 Provider",
+    "Beech E18SN51CS": "Beechcraft 18",
+    "Bell 222N992AA": "Bell 222",
+    "De Havilland DH 476": "De Havilland DH 4",
+    "Douglas C 47101": "Douglas DC-3",
+    "Douglas C 47BKJ957": "Douglas DC-3",
+    "Douglas C 47BKN236": "Douglas DC-3",
+    "Douglas C 47BM965": "Douglas DC-3",
+    "Fokker F 27 Friendship 100VT": "Fokker F-27 Friendship",
+    "Ilyushin IL 38 / Ilyushin IL": "Ilyushin Il-38",
+    "Sud  Aviation Caravelle VI A": "Sud Aviation Caravelle",
+    "7D Corsair?": "Vought F4U Corsair",
+    "ATR  72": "ATR 72",
+    "Boeing 247NC13304": "Boeing 247",
+    "Pitcairn PA 6 Mailwing?": "Pitcairn PA-6 Mailwing",
+    "Boeing 737 MAX 8PK": "Boeing 737 MAX",
+    "Britten  Norman BN2A": "Britten-Norman BN-2",
+    "CASA 212PK ZAG": "CASA C-212 Aviocar",
+    "de Havilland DCH 4T CaribouPK": "De Havilland Canada DHC-4 Caribou",
+    "de Havilland DHC 6 Twin Otter/u00a0PK": "De Havilland Canada DHC-6 Twin Otter",
+    "Boeing 737 286EP": "Boeing 737",
+    "Vickers 802 ViscountG AOJA": "Vickers 802 Viscount",
+    "Aerospatiale Alenia ATR 42": "ATR 42",
+    "Antonov AN 124RA": "Antonov An-124",
+    "de Havilland DH 114 Heron 2I": "De Havilland DH.114 Heron",
+    "Fokker F 27 Friendship 200I": "Fokker F-27 Friendship",
+    "MD  87 / Cessna 525A Citation IISE": "McDonnell Douglas MD-87",
+    "Short Calcutta (flying boat)G AADN": "Short Calcutta",
+    "Vickers Viscount 701CG ANHC": "Vickers 701 Viscount",
+    "de Havilland DH 9G": "De Havilland DH 9",
+    "CASA 235 10PK": "CASA C-235",
+    "Canadair CL 600": "Canadair CL-600 Challenger",
+    "Bleriot 155F  AICQ": "Bleriot 155",
+    "Piper PA 31N6642L": "Piper PA-31 Navajo",
+    "Douglas DC 7CFTZ": "Douglas DC-7C",
+    "Mil Mi 8MTV": "Mil Mi-8",
+    "Harbin Yunshuji Y 12": "Harbin Y-12",
+    "Handley Page Hastings C 2WD498": "Handley Page Hastings",
+    "Vickers Viscount 724F BMCH": "Vickers 724 Viscount",
+    "Bell 204B helicopterN1187W": "Bell 204",
+    "Avro 685 York 1MW125": "Avro York",
+    "de Havilland Canada DHC 6 Twin Otter 3109M": "De Havilland Canada DHC-6 Twin Otter",
+    "Curtiss R 4LM32": "Curtiss R4D",
+    "Lockheed R7V 1128441": "Lockheed R7V Constellation",
+    "Boeing B 767": "Boeing 767",
+    "Lockheed 188A ElectraN5533": "Lockheed L-188 Electra",
+    "Breguet 14F AGBN": "Breguet 14",
+    "Latecoere 28F AJIP": "Latécoère 28",
+    "Douglas C 46A": "Douglas C-46",
+    "Fairchild C 82AXA": "Fairchild C-82 Packet",
+    "Hawker 800AXA ISH": "Hawker 800",
+    "Boeing KC 135A60": "Boeing KC-135",
+    "Douglas DC 3NC21712": "Douglas DC-3",
+    "Martin 202NC93037": "Martin 202",
+    "Convair CV 300N55VM": "Convair CV-300",
+    "Bae Jetstream 3201N875JX": "British Aerospace Jetstream",
+    "Canadair CRJ200LR RegionalJetN8396A": "Bombardier CRJ200",
+    "Cessna 335N8354N": "Cessna 335",
+    "de Havilland DHC 6 Twin Otter 300N707PV": "De Havilland Canada DHC-6 Twin Otter",
+    "Breguet 14?": "Breguet 14",
+    "Latecoere 28F AJUU": "Latécoère 28",
+    "de Havilland Canada DHC 6 Twin Otter 300XY": "De Havilland Canada DHC-6 Twin Otter",
+    "Fokker F 27 Friendship 500XY": "Fokker F-27 Friendship",
+    "BAC One Eleven?": "BAC One-Eleven",
+    "Boeing C 97A Stratofreighter49": "Boeing C-97 Stratofreighter",
+    "Boeing  377 StratocruiserN90943": "Boeing 377 Stratocruiser",
+    "Cessna 310CN1812H": "Cessna 310",
+    "Curtiss C 46SU": "Curtiss C-46",
+    "de havilland 89 Dragon RapideG ACPM": "De Havilland DH.89 Dragon Rapide",
+    "Dewoitine D 333F": "Dewoitine D.333",
+    "Dornier WalP BALSA": "Dornier Wal",
+    "Douglas DC 3B": "Douglas DC-3",
+    "EMB 721C SertanejoPT EBK": "Embraer EMB 721 Sertanejo",
+    "Grumman C 2A152796": "Grumman C-2 Greyhound",
+    "Handley Page HP 57 HalifaxW7773": "Handley Page Halifax",
+    "Handley Page W 10G": "Handley Page W.10",
+    "Junkers F 13OH": "Junkers F 13",
+    "Swearingen SA277 AT ExpditerN577MX": "Swearingen SA227 Expediter",
+    "Fokker F 28 Fellowship 1000EP": "Fokker F-28 Fellowship",
+    "Martin 404N464M": "Martin 404",
+    "Rutan Long EZ (experimental aircraft)N555JD": "Rutan Long EZ",
+    "Fokker F 28 Fellowship 4000PH": "Fokker F-28 Fellowship",
+    "Agusta A109A MK IIN21FL": "Agusta A109",
+    "Boeing Vetrol 107 II helicopterN6673D": "Boeing Vertol 107",
+    "Convair CV 580FZK": "Convair CV-580",
+    "Curtiss AT 32C CondorNC725K": "Curtiss AT-32 Condor",
+    "De Havilland DH.477": "De Havilland DH.4",
+    "Enstrom F 28FN8617B": "Enstrom F-28",
+    "Fairchild  Hiller FH227CN380NE": "Fairchild Hiller FH-227",
+    "GAF Nomad N 22ZK": "GAF Nomad",
+    "Lockheed L 100": "Lockheed L-100 Hercules",
+    "Lockheed 10A ElectraZK AGK": "Lockheed 10 Electra",
+    "Lockheed 749A ConstellationN119A": "Lockheed L-749A Constellation",
+    "Douglas C 54E": "Douglas DC-4",
+    "Sirkorsky 44A (flying boat)NC41880": "Sikorsky S-44",
+    "Mil Mi 17 (helicopter)294": "Mil Mi-17",
+    "Boeing 737 2B75N": "Boeing 737",
+    "Blackburn B 2G": "Blackburn B.2",
+    "Short SC 7 Skyvan VariantPK": "Shorts SC.7 Skyvan",
+    "Shorts SC.7 Skyvan 3 100C": "Shorts SC.7 Skyvan",
+    "BAe 146 200OY": "British Aerospace 146",
+    "de Havilland Canada DHC 6 Twin Otter 300LN": "De Havilland Canada DHC-6 Twin Otter",
+    "Short Sandringham 6 (flying boat)LN IWA": "Short Sandringham",
+    "Boeing 747 244B": "Boeing 747",
+    "Curtiss C 46F": "Curtiss C-46",
+    "De Havilland DH 4385": "De Havilland DH 4",
+    "Stearman C 38?": "Stearman C-3B",
+    "Boeing KC 135A56": "Boeing KC-135",
+    "Douglas DC 3NC25663": "Douglas DC-3",
+    "Fokker F 27 Friendship 200AP": "Fokker F-27 Friendship",
+    "Fokker F 27 Friendship 600AP": "Fokker F-27 Friendship",
+    "Aero Commander 500 BN701X": "Aero Commander 500",
+    "Beechcraft B99N986MA": "Beechcraft 99",
+    "de Havilland Canada DHC 6 Twin Otter 200N3257": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas M 4NC1064": "Douglas M-4",
+    "Shorts 330 200N26288": "Shorts 330",
+    "Cessna 402C UtililinerOB T": "Cessna 402",
+    "de Havilland Canada DHC 6 Twin Otter 300FAP306": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas C54AOB PAZ": "Douglas DC-4",
+    "Faucett F 19OB": "Faucett F 19",
+    "Fokker F 28 Fellowship 1000OB": "Fokker F-28 Fellowship",
+    "Douglas C 47BRP": "Douglas DC-3",
+    "Douglas DC 3CRPC550": "Douglas DC-3",
+    "Douglas DC 3RP": "Douglas DC-3",
+    "Pilatus Britten Norman BN": "Pilatus",
+    "Sikorksky CH 53 (helicopter)157139": "Sikorsky CH-53",
+    "Lockheed WV 2 Super Constellation141294": "Lockheed WV-2 Super Constellation",
+    "Douglas C 39": "Douglas DC-2",
+    "Sikorsky S 42B (flying boat)NC15376": "Sikorsky S-42",
+    "Consolidated B 243701": "Consolidated B-24 Liberator",
+    "de Havilland DHC 2 Mk 1 BeaverC": "De Havilland Canada DHC-2 Beaver",
+    "Vickers 757 ViscountCF THA": "Vickers 757 Viscount",
+    "de Havilland DH114 Heron 2EVH CLS": "De Havilland DH.114 Heron",
+    "Ilyushin IL 18DRA": "Ilyushin Il-18",
+    "Ilyushin IL 14YR": "Ilyushin Il-14",
+    "Antonov 12BPCCCP 11418": "Antonov An-12",
+    "Antonov AN 12ARA": "Antonov An-12",
+    "Antonov An 12BCCCP": "Antonov An-12",
+    "Antonov AN 12VCCCP": "Antonov An-12",
+    "Antonov AN 28CCCP": "Antonov An-28",
+    "Antonov An 2TPCCCP": "Antonov An-2",
+    "Antonov An 2UK": "Antonov An-2",
+    "Antonov AN 8CCCP": "Antonov An-8",
+    "GVF PS 84CCCP": "Lisunov Li-2",
+    "Ilyushin IL 12 CCCP": "Ilyushin Il-12",
+    "Ilyushin IL 12L1328": "Ilyushin Il-12",
+    "Ilyushin IL 12L1765": "Ilyushin Il-12",
+    "Ilyushin IL 76MDCCCP": "Ilyushin Il-76",
+    "Ilyushin IL 76TDCCCP": "Ilyushin Il-76",
+    "Ilyushin IL  12 CCCP": "Ilyushin Il-12",
+    "Li  2L4732": "Lisunov Li-2",
+    "Tupolev TU 154BCCCP": "Tupolev Tu-154",
+    "Yakovlev YAK 40RA": "Yakovlev Yak-40",
+    "Bell 214ST helicopterN704H": "Bell 214",
+    "Avro Shackleton MR 1VP286": "Avro Shackleton",
+    "Lockheed 049 46": "Lockheed Constellation",
+    "Britten Norman BN 2A TrislanderH4": "Britten-Norman BN-2A Trislander",
+    "Antonov 32CCCP 48088": "Antonov An-32",
+    "Douglas C 47D450934": "Douglas DC-3",
+    "Gates Learjet 35N47BA": "Learjet 35",
+    "Lockheed C130B61 2649": "Lockheed C-130 Hercules",
+    "Tupolev TU 134AC9": "Tupolev Tu-134",
+    "Breguet 14F AEEJ": "Breguet 14",
+    "Breguet 14F ALTA": "Breguet 14",
+    "Bristol 170 Freighter IF BCJN": "Bristol 170 Freighter",
+    "Douglas DC 3EC": "Douglas DC-3",
+    "Swearingen SA 226AT Merlin IVEC": "Swearingen SA226 Merlin",
+    "Antonov An 12BPST": "Antonov An-12",
+    "Antonov AN 12ST": "Antonov An-12",
+    "Aero Commander AC 520?": "Aero Commander 520",
+    "Douglas DC 3SE": "Douglas DC-3",
+    "Lockheed C 130E64": "Lockheed C-130 Hercules",
+    "Lockheed C 130H Hercules1310 Mi": "Lockheed C-130 Hercules",
+    "Douglas DC3 G102NC16088": "Douglas DC-3",
+    "Bell 206L?": "Bell 206",
+    "Cessna 208 Caravan IN208W": "Cessna 208 Caravan I",
+    "Douglas DC 4NC90432": "Douglas DC-4",
+    "Fairey Firefly MK1PP526": "Fairey Firefly",
+    "Lockheed L 749A ConstellationHI": "Lockheed L-749A Constellation",
+    "Antonov An 12BKUR": "Antonov An-12",
+    "Boeing 707 330CST": "Boeing 707",
+    "Ilyushin IL 62CCCP": "Ilyushin Il-62",
+    "LET 410MT TurbojetCCCP 67264": "Let L-410 Turbolet",
+    "Antonov AN 2609": "Antonov An-26",
+    "Curtiss C 46FN1300N": "Curtiss C-46",
+    "Douglas DC 6NC37510": "Douglas DC-6",
+    "Antonov AN 2TPYV": "Antonov An-2",
+    "Arava 201EV 8012": "Arava 201",
+    "Bell 214 STYV O": "Bell 214ST",
+    "Douglas DC 3CYV": "Douglas DC-3",
+    "Lockheed 1049E Super ConstellationYV C": "Lockheed 1049 Super Constellation",
+    "Boeing 307 Stratoliner B 1F": "Boeing 307 Stratoliner",
+    "de Havilland Canada CV 2B Caribou63": "De Havilland Canada C-7 Caribou",
+    "Douglas C 47BF": "Douglas DC-3",
+    "Beech 200 Super King AirN501RH": "Beechcraft Super King Air",
+    "Douglas DC 3N55V": "Douglas DC-3",
+    "Loening C 2CNC9158": "Loening C-2C",
+    "Lockheed C 130E Hercules63": "Lockheed C-130 Hercules",
+    "Vickers Vanguard 951G APEC": "Vickers Vanguard",
+    "Boeing 247DNC13317": "Boeing 247D",
+    "Boeing B 247": "Boeing 247",
+    "Cessna 208B Caravan I Super CargomasterN791FE": "Cessna 208B Caravan I",
+    "Curtiss C 46E": "Curtiss C-46",
+    "Douglas DC 3NC16074": "Douglas DC-3",
+    "Douglas DC 3NC38942": "Douglas DC-3",
+    "Douglas DC 4N30051": "Douglas DC-4",
+    "Douglas DC 4N30062": "Douglas DC-4",
+    "Learjet 24N44CJ": "Learjet 24",
+    "Douglas DC 3YU": "Douglas DC-3",
+    "Douglas C 47 SkytrainUN": "Douglas DC-3",
+    "Fokker 509M MGH": "Fokker 50",
+    "Swearingen SA.227AC Metro IIIC GSLB": "Swearingen SA227 Metro III",
+    "Sud  Aviation Caravelle IIIHG": "Sud Aviation Caravelle",
+    "Antonov AN 26BYA": "Antonov An-26",
+    "Antonov AN 26YA": "Antonov An-26",
+    "British Aerospace Nimrod MR 2XV": "British Aerospace Nimrod",
+    "Mil Mi 17 ( helicopter)?": "Mil Mi-17",
+    "Tupolev TU 154M / C": "Tupolev Tu-154M",
+    "de Havilland DHC 2N37741": "De Havilland Canada DHC-2 Beaver",
+    "Aero Commander 680N6305U": "Aero Commander 680",
+    "Boeing B 707 (E": "Boeing 707",
+    "de Havilland Dash 2 float planeN1433Z": "De Havilland Canada DHC-2 Beaver",
+    "de Havilland Canada DHC 6 Twin Otter 200N563MA": "De Havilland Canada DHC-6 Twin Otter",
+    "de Havilland Canada DHC 3T Turbine OtterN928PK": "De Havilland Canada DHC-3 Otter",
+    "Douglas C 47A?": "Douglas DC-3",
+    "Douglas C 54BN63396": "Douglas DC-4",
+    "Douglas DC 7BFN6314J": "Douglas DC-7B",
+    "Hughes 369HSN9172F": "Hughes 369",
+    "Military   U.S. Air Force57": "Military Aircraft (USAF)",
+    "Piper PA 31": "Piper PA-31 Navajo",
+    "Shorts SC 7 SkyvanN30GA": "Shorts SC.7 Skyvan",
+    "Soloy 12EJ3N5384V": "Soloy",
+    "Boeing 40CF AIN": "Boeing 40",
+    "Bristol 170 Freighter 31CF GBT": "Bristol 170 Freighter",
+    "BAC One Eleven 515FB5N": "BAC One-Eleven",
+    "Dewoitine D 342F": "Dewoitine D.342",
+    "Embraer 120ER BrasiliaT 500": "Embraer EMB 120 Brasilia",
+    "Consolidated 32 2 Liberator IAM": "Consolidated Liberator",
+    "Aerospatiale AS350BAN270SH": "Aérospatiale AS350 Ecureuil",
+    "Cessna 421C Golden EagleN6234G": "Cessna 421 Golden Eagle",
+    "Convair 600N94230": "Convair CV-600",
+    "Beechcraft SKA 200VH SKC": "Beechcraft Super King Air",
+    "De Havilland DH 80VH": "De Havilland DH.80 Puss Moth",
+    "de Havilland DH.50JG AUHI": "De Havilland DH.50",
+    "Douglas DC 3VH": "Douglas DC-3",
+    "Vickers Viscount 832VH RMI": "Vickers 832 Viscount",
+    "Lockheed C 130H7772": "Lockheed C-130 Hercules",
+    "Douglas DC 3N75KW": "Douglas DC-3",
+    "de havilland Canada Twin Otter 200C FAIV": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas C 54BN90427": "Douglas DC-4",
+    "Curtiss C 46D": "Curtiss C-46",
+    "Douglas C 47ACP": "Douglas DC-3",
+    "Douglas DC 6BCP": "Douglas DC-6",
+    "Swearingen SA 227BC Metroliner IIICP": "Swearingen SA227 Metroliner",
+    "Douglas DC 3APT": "Douglas DC-3",
+    "Embraer EMB 110P1 BandeirantePT": "Embraer EMB 110 Bandeirante",
+    "Embraer 110 BandeirantePT ODK": "Embraer EMB 110 Bandeirante",
+    "Embraer 110P1 BandeirantePT FAW": "Embraer EMB 110 Bandeirante",
+    "Embraer 120RT BrasiliaN219AS": "Embraer EMB 120 Brasilia",
+    "Fokker 100PT MRN": "Fokker 100",
+    "Gates Learjet 25BPT JBQ": "Learjet 25",
+    "Hawker Siddeley HS 125": "Hawker Siddeley HS 125",
+    "Lockheed 18 LoadstarPP PBG": "Lockheed 18 Lodestar",
+    "Lockheed 18 LodestarPP PBH": "Lockheed 18 Lodestar",
+    "Saab Scandia 90A 1PP": "Saab Scandia",
+    "Vickers Viscount 710CPP SRR": "Vickers 710 Viscount",
+    "De Havilland Dash 3C": "De Havilland Canada DHC-3 Otter",
+    "de Havilland DH 34G": "De Havilland DH.34",
+    "Antonov An 14LZ": "Antonov An-14",
+    "Ilyushin IL 18LZ": "Ilyushin Il-18",
+    "Douglas DC 3XY": "Douglas DC-3",
+    "Boeing 247NC13314": "Boeing 247",
+    "Boeing 40NC10347": "Boeing 40",
+    "Boeing KC 135A58": "Boeing KC-135",
+    "Boeing 377 Stratocruiser 10 34N31230": "Boeing 377 Stratocruiser",
+    "Cessna 501 CitationN79DD": "Cessna 501 Citation",
+    "Douglas DC 3N74663": "Douglas DC-3",
+    "F  86 SabrejetN275X": "North American F-86 Sabre",
+    "Fairchild 71?": "Fairchild 71",
+    "Lockheed VegaNR859E": "Lockheed Vega",
+    "Tupolev TU 134VN": "Tupolev Tu-134",
+    "Latecoere 631 (flying boat)F BDRE": "Latécoère 631",
+    "Britten Norman BN 7A lslanderC": "Britten-Norman BN-2 Islander",
+    "Cessna 208B Grand CaravanC FKAB": "Cessna 208B Grand Caravan",
+    "Convair CV 640CF": "Convair CV-640",
+    "de Havilland Canada DHC 6 Twin Otter 300D4": "De Havilland Canada DHC-6 Twin Otter",
+    "CASA C 212 Aviocar 300DF966": "CASA C-212 Aviocar",
+    "Curtiss C 46D42": "Curtiss C-46",
+    "Curtiss Wright C 46?": "Curtiss-Wright C-46",
+    "Hawker Siddeley Trident 2E /  II 28B": "Hawker Siddeley Trident",
+    "Boeing 727 24CHK": "Boeing 727",
+    "CASA 212 Aviocar 200FAC1152": "CASA C-212 Aviocar",
+    "Douglas C 47FAC1659": "Douglas DC-3",
+    "Douglas C 47HK": "Douglas DC-3",
+    "Douglas DC 4HK": "Douglas DC-4",
+    "Embraer 110P1 BandeiranteHK 2651": "Embraer EMB 110 Bandeirante",
+    "Lockheed  5 VegaNC176W": "Lockheed Vega 5",
+    "Antonov An 12BEX": "Antonov An-12",
+    "Antonov AN 26A9Q": "Antonov An-26",
+    "Fokker UniversalNC52": "Fokker Universal",
+    "Douglas DC 3TI": "Douglas DC-3",
+    "Ilyushin IL 62MCU": "Ilyushin Il-62",
+    "Douglas C 133A56": "Douglas C-133 Cargomaster",
+    "Antonov AN 12BP4L": "Antonov An-12",
+    "Antonov 26BER AZT": "Antonov An-26",
+    "Convair CV 580LN": "Convair CV-580",
+    "Let 4109Q CVL": "Let L-410 Turbolet",
+    "Tupolev TU 134DM": "Tupolev Tu-134",
+    "de Havilland Canada DHC 4A CaribouHC": "De Havilland Canada DHC-4 Caribou",
+    "Lockheed L 188A ElectraHC": "Lockheed L-188 Electra",
+    "McDonnell Douglas DC 8F": "McDonnell Douglas DC-8",
+    "Transportes Aéreos OrientalesHC": "Transportes Aéreos Orientales",
+    "AFQ": "Aircraft",
+    "Vickers Viscount 764DHC BCL": "Vickers 764 Viscount",
+    "Airbus A.300B4 203SU": "Airbus A300",
+    "Vickers 634 VikingSU AFO": "Vickers 634 Viking",
+    "de Havilland 110WG235": "De Havilland DH.110 Sea Vixen",
+    "Liore  et": "Lioré et Olivier",
+    "Sabca F VIIOO": "Sabca S.II",
+    "Vickers 621 Viking 1G AIJE": "Vickers 621 Viking",
+    "Zeppelin L 32 (airship)?": "Zeppelin L 32",
+    "Fokker F 27 Friendship 300TF": "Fokker F-27 Friendship",
+    "Cessna 402CN89PB": "Cessna 402",
+    "Bleriot Spad 33F AIEP": "Bleriot-Spad S.33",
+    "Bloch 220F AQNL": "Bloch 220",
+    "Douglas DC 7CF": "Douglas DC-7C",
+    "Focke  Wulf FW 200D": "Focke-Wulf Fw 200",
+    "Lockheed C 130A Hercules56": "Lockheed C-130 Hercules",
+    "Lockheed 749A ConstellationF BAZZ": "Lockheed L-749A Constellation",
+    "Potez IXF ADCD": "Potez IX",
+    "Spad 33?": "SPAD S.33",
+    "Sud  Aviation Caravelle 3F": "Sud Aviation Caravelle",
+    "Vickers Viking 1BF BJER": "Vickers Viking",
+    "Wright ByplaneSC1": "Wright Byplane",
+    "Avro 685 York IG AHEW": "Avro York",
+    "Cessna 208 Caravan IN551CC": "Cessna 208 Caravan I",
+    "Dornier MerkurD 585": "Dornier Merkur",
+    "Fokker FG IIID 180": "Fokker F.G. III",
+    "Zeppelin L 10 (airship)?": "Zeppelin L 10",
+    "CH  47D Chinook?": "Boeing CH-47 Chinook",
+    "Cessna 441 Conquest IIOY CGM": "Cessna 441 Conquest II",
+    "Douglas DC 6ABN90779": "Douglas DC-6",
+    "LET 410UVP ETG": "Let L-410 Turbolet",
+    "Ilyushin IL 183X": "Ilyushin Il-18",
+    "Aerospatiale AS 350BN350SM": "Aérospatiale AS350 Ecureuil",
+    "Douglas C 47AXH": "Douglas DC-3",
+    "Douglas DC 4N88900": "Douglas DC-4",
+    "Fokker Super UniversalNC7242": "Fokker Super Universal",
+    "Lockheed VegaNC606": "Lockheed Vega",
+    "Lockheed 049 ConstellationN86511": "Lockheed 049 Constellation",
+    "Lockheed 188C  ElectraN137US": "Lockheed L-188 Electra",
+    "Lockheed Vega 5CNC959Y": "Lockheed Vega 5C",
+    "Dornier Do 288": "Dornier Do 28",
+    "Douglas C 5342": "Douglas C-53 Skytrooper",
+    "Vickers Viscount 768DVT DIO": "Vickers 768D Viscount",
+    "Sud Aviation SE 210 CaravelleVT": "Sud Aviation Caravelle",
+    "De Havilland DH 4227": "De Havilland DH 4",
+    "MD Douglas DC 9": "McDonnell Douglas DC-9",
+    "Airbus A300 B4": "Airbus A300",
+    "Boeing 737 230PK": "Boeing 737",
+    "CASA NC 212 Aviocar 200PK": "CASA C-212 Aviocar",
+    "Fokker F 27 Friendship 600PK": "Fokker F-27 Friendship",
+    "Fokker F 28 Fellowship 1000PK": "Fokker F-28 Fellowship",
+    "de Havilland DH 66 HerculesG": "De Havilland DH.66 Hercules",
+    "Ilyushin Il 20MRF": "Ilyushin Il-20",
+    "Tupolev Tu 154MEP": "Tupolev Tu-154M",
+    "Douglas DC 6BN90773": "Douglas DC-6",
+    "Lockheed 1049C 55": "Lockheed 1049 Constellation",
+    "Vickers Viscount 739BSU AKW": "Vickers 739 Viscount",
+    "Lockheed L 1049H Super ConstellationN6920C": "Lockheed 1049 Super Constellation",
+    "Lockheed P2V 7KA": "Lockheed P2V Neptune",
+    "Consolidated B 24 Liberator?": "Consolidated B-24 Liberator",
+    "Beech King Air B100N887PE": "Beechcraft King Air B100",
+    "Douglas C 47248": "Douglas DC-3",
+    "Tupolev TU 154BHA": "Tupolev Tu-154",
+    "Avro LancasterNX690": "Avro Lancaster",
+    "Canadair C 4 ArgonautG CRDA": "Canadair C-4 Argonaut",
+    "CANT Z 506I": "CANT Z.506",
+    "Beechcraft E18SN50JR": "Beechcraft 18",
+    "Ilyushin IL 62MCCCP": "Ilyushin Il-62",
+    "Let Aero 45SVT DHO": "Let Aero 45S",
+    "Dornier 228 2129M": "Dornier 228",
+    "Douglas R5D 356496": "Douglas DC-4",
+    "Aerospatiale SA365N 1 Dauphin IIN92MD": "Aérospatiale SA 365 Dauphin",
+    "Douglas DC 3N33417": "Douglas DC-3",
+    "de Havilland Canada DHC 6 Twin Otter 100XA": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas C 47AXA": "Douglas DC-3",
+    "LET 410UVPXA ACM": "Let L-410 Turbolet",
+    "Lockheed C 130A Hercules3603": "Lockheed C-130 Hercules",
+    "Lockheed C 130A Hercules3610": "Lockheed C-130 Hercules",
+    "Rockwell CT 39A SabrelinerXA": "Rockwell CT-39 Sabreliner",
+    "Boeing KC 135A61": "Boeing KC-135",
+    "Boeing 737 8BKP2": "Boeing 737",
+    "Douglas C 54AN90433": "Douglas DC-4",
+    "Antonov AN 24RVBNMAU": "Antonov An-24",
+    "Latecoere 25 3": "Latécoère 25",
+    "Sud  Aviation Caravelle IIIF": "Sud Aviation Caravelle",
+    "Antonov AN 26RA": "Antonov An-26",
+    "Antonov An 32CCCP": "Antonov An-32",
+    "Avro 685 York IOD ADB": "Avro York",
+    "Boulton and Paul P 71G": "Boulton Paul P.71",
+    "Canadair CL 44D4": "Canadair CL-44",
+    "Curtiss C 46 Commando?": "Curtiss C-46 Commando",
+    "Douglas C 124C Globemaster52": "Douglas C-124 Globemaster II",
+    "Fairchild C 119C": "Fairchild C-119",
+    "Fletcher FU 24": "Fletcher FU-24",
+    "Fokker F7NX703": "Fokker F.VII",
+    "Latecoere 25F AIUJ": "Latécoère 25",
+    "Lockheed 1049H 82 Super ConstellationN6923C": "Lockheed 1049 Super Constellation",
+    "Short S 30 (flying boat)G": "Short S.30 Empire",
+    "Zeppelin L 1 (airship)?": "Zeppelin L 1",
+    "Hawker Siddeley HS 1256V": "Hawker Siddeley HS 125",
+    "Airbus A300B4 203AP": "Airbus A300",
+    "Beechcraft 1900D9N AEK": "Beechcraft 1900",
+    "Dornier 228 2029N": "Dornier 228",
+    "Douglas C 479N": "Douglas DC-3",
+    "Douglas C 118AYV": "Douglas C-118",
+    "Douglas DC 3CPH": "Douglas DC-3",
+    "North American P 51D": "North American P-51 Mustang",
+    "Boeing   EC": "Boeing",
+    "Boeing 767 223ERN334AA": "Boeing 767",
+    "Cessna 402 / Piper PA 28N8283F / N8828W": "Cessna 402",
+    "Douglas C 47AA6556": "Douglas DC-3",
+    "Douglas DC 3N18936": "Douglas DC-3",
+    "Fokker F VIINC776": "Fokker F.VII",
+    "Junkers JL 6305": "Junkers JL 6",
+    "Sikorsky S 25?": "Sikorsky S-25",
+    "Ilyushin IL 18OK": "Ilyushin Il-18",
+    "de Havilland Canada DHC 6 Twin Otter 3005N": "De Havilland Canada DHC-6 Twin Otter",
+    "Dornier 228NAF033": "Dornier 228",
+    "Lockheed C 130HNAF911": "Lockheed C-130 Hercules",
+    "Douglas C 53D": "Douglas C-53 Skytrooper",
+    "Avro 685 York C 1CF": "Avro York",
+    "de Havilland Canada DHC 6": "De Havilland Canada DHC-6 Twin Otter",
+    "McDonnell Douglas MD 11HB": "McDonnell Douglas MD-11",
+    "Convair CV 440FN24DR": "Convair CV-440",
+    "Convair CV 580N587X": "Convair CV-580",
+    "De Havilland DH 4283": "De Havilland DH 4",
+    "Dirigible ZR 1 Shenandoah (airship)ZR": "Dirigible ZR-1 Shenandoah",
+    "Junkers F 13308": "Junkers F 13",
+    "Lockheed 18 LodestarN1000F": "Lockheed 18 Lodestar",
+    "Douglas R5D 356541": "Douglas DC-4",
+    "Douglas DC 3 / Cessna 170BN33315 / N8143A": "Douglas DC-3",
+    "Fokker F VIIb": "Fokker F.VII",
+    "British Aerospace Nimrod MR 2PXV239": "British Aerospace Nimrod",
+    "Travel Air 6000CF ABE": "Travel Air 6000",
+    "Douglas DC 7N455SW": "Douglas DC-7",
+    "Lockheed C 130B Hercules24143": "Lockheed C-130 Hercules",
+    "Ford Tri Motor?": "Ford Tri-motor",
+    "de Havilland Canada DHC 6 Twin Otter 300P2": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas C 47DFAP2009": "Douglas DC-3",
+    "Fokker F 27 Friendship 500OB": "Fokker F-27 Friendship",
+    "BAC One Eleven 402APPI": "BAC One-Eleven",
+    "Airbus A320 211D": "Airbus A320",
+    "Antonov An 2TSP": "Antonov An-2",
+    "Pilatus  Britten Norman BN": "Pilatus",
+    "Piper PA31 310C C  47 Dakota DT": "Piper PA-31 Navajo",
+    "Vickers Viscount 782DVP WAS": "Vickers 782D Viscount",
+    "Dassault Falcon 900BSX ECH": "Dassault Falcon 900",
+    "Tupolev TU 134HA": "Tupolev Tu-134",
+    "AeroflotCCCP  61628": "Ilyushin Il-18",
+    "AeroflotCCCP  L1692": "Ilyushin Il-12",
+    "Antonov 12BPCCCP 13320": "Antonov An-12",
+    "Antonov AN 24 / Yakovlev Yak": "Antonov An-24",
+    "Antonov AN 28RA": "Antonov An-28",
+    "Antonov AN 8RA": "Antonov An-8",
+    "Douglas DC 34W": "Douglas DC-3",
+    "Let L 410UVP": "Let L-410 Turbolet",
+    "Lockheed C 130A": "Lockheed C-130 Hercules",
+    "Mi  8 helicopter?": "Mil Mi-8",
+    "Mil Mi 8 (helicopter)RA": "Mil Mi-8",
+    "Vickers Viscount 837OE LAF": "Vickers 837 Viscount",
+    "Yakovlev 42DRA 42434": "Yakovlev Yak-42",
+    "Yakovlev YAK 42CCCP": "Yakovlev Yak-42",
+    "Yakovlev YAK 40 / Mil Mi": "Yakovlev Yak-40",
+    "ATR 42 300PT": "ATR 42",
+    "Douglas C 47A Dakota962": "Douglas DC-3",
+    "Lockheed C 130E453": "Lockheed C-130 Hercules",
+    "Douglas C 47A (DC": "Douglas DC-3",
+    "de Havilland DH 114 HeronG": "De Havilland DH.114 Heron",
+    "Bristol Britannia 102G ANBB": "Bristol Britannia",
+    "de Havilland Canada DHC 6 Twin Otter 300H4": "De Havilland Canada DHC-6 Twin Otter",
+    "British Aerospace Jetstream 41ZS NRM": "British Aerospace Jetstream",
+    "Douglas DC 3NC33631": "Douglas DC-3",
+    "Eurocopter AS350 B2N417AE": "Eurocopter AS350",
+    "Learjet 60N999LJ": "Learjet 60",
+    "Boeing 757 204G": "Boeing 757",
+    "Antonov AN 24RVEW": "Antonov An-24",
+    "Antonov AN 32CR861": "Antonov An-32",
+    "de Havilland 89A Dragon RapideG AFFF": "De Havilland DH.89 Dragon Rapide",
+    "Avro Ninteen ISE BRS": "Avro Nineteen",
+    "Boeing 707 324CB": "Boeing 707",
+    "Boeing B 17F / Boeing B": "Boeing B-17 Flying Fortress",
+    "Curtiss C 46AN5140B": "Curtiss C-46",
+    "Embraer 120RT BrasiliaN33701": "Embraer EMB 120 Brasilia",
+    "Fokker F 10NC9716": "Fokker F.10",
+    "Learjet 25BN666TW": "Learjet 25B",
+    "Lockheed 188A ElectraN9705C": "Lockheed L-188 Electra",
+    "McDonnell Douglas MD 82HS": "McDonnell Douglas MD-82",
+    "Tupolev TU 134AVN": "Tupolev Tu-134",
+    "Douglas DC 3TC": "Douglas DC-3",
+    "Fokker F 27 Friendship 100TC": "Fokker F-27 Friendship",
+    "Northrop F 5A?": "Northrop F-5",
+    "de Havilland Canada DHC 6 Twin Otter 300N75GC": "De Havilland Canada DHC-6 Twin Otter",
+    "Antonov AN 12CCCP": "Antonov An-12",
+    "Antonov An26SH76 yellow": "Antonov An-26",
+    "Tupolev TU 134AHA": "Tupolev Tu-134",
+    "Bell 212A6 AVL": "Bell 212",
+    "Boeing B747 44AFN571UP": "Boeing 747",
+    "Douglas DC 6LV": "Douglas DC-6",
+    "Antonov An 26?": "Antonov An-26",
+    "Antonov AN 72CCCP": "Antonov An-72",
+    "ATR 42 320YV": "ATR 42",
+    "Convair CV 580C": "Convair CV-580",
+    "Beechcraft C 45HN9574Z": "Beechcraft C-45 Expeditor",
+    "Douglas DC 7 / F": "Douglas DC-7",
+    "Douglas DC 4 / USAF F": "Douglas DC-4",
+    "Wright Flyer III?": "Wright Flyer III",
+    "Boeing B 52 / Boeing B": "Boeing B-52 Stratofortress",
+    "?": "Unknown",
+    "???": "Unknown",
+    "?139": "Unknown",
+    "Curtis JN-4 Jenny": "Curtis JN-4",
+    "Wright Flyer": "Flyer 1",
+    "?NC21V": "Unknown",
+    "?VH  TAT": "Unknown",
+    "?VP  YRX": "Unknown",
+    "A  7D Corsair?": "Unknown",
+    "AAC  1 ToucanF": "Unknown",
+    "AEGKD  74": "Unknown",
+    "de Havilland Canada DHC 6 Twin Otter 100YA": "De Havilland Canada DHC-6 Twin Otter",
+    "de Havilland Canada DHC 6 Twin Otter 100VH": "De Havilland Canada DHC-6 Twin Otter",
+    "Douglas DC 3N19941": "Douglas DC-3",
+    "Boeing Vertol CH 47C (helicopter)74": "Boeing CH-47 Chinook",
+    "Aerospatiale Caravelle 6NYU AHD": "Sud Aviation Caravelle",
+    "Farman F 306YU": "Farman F.306",
+    "Junkers JU52/3mD AUAW": "Junkers Ju 52",
+    "Sikorsky UH 60 Black Hawk": "Sikorsky UH-60 Black Hawk",
+    "de Havilland DHC 5 Buffalo9T": "De Havilland Canada DHC-5 Buffalo",
+    "de Havilland Canada DHC 6 Twin Otter 3009Q": "De Havilland Canada DHC-6 Twin Otter",
+    "Handley Page Dart Herald 2029Q CAH": "Handley Page Dart Herald",
+    "Lockheed Hercules C 1309T": "Lockheed C-130 Hercules",
+    "Douglas DC 6BSE": "Douglas DC-6",
+}
+
+
+# ISO 3166-1 alpha-3 code for every name in VALID_COUNTRIES
+ISO_CODES = {
+    "Afghanistan": "AFG",
+    "Albania": "ALB",
+    "Algeria": "DZA",
+    "American Samoa": "ASM",
+    "Andorra": "AND",
+    "Angola": "AGO",
+    "Anguilla": "AIA",
+    "Antarctica": "ATA",
+    "Antigua And Barbuda": "ATG",
+    "Argentina": "ARG",
+    "Armenia": "ARM",
+    "Aruba": "ABW",
+    "Australia": "AUS",
+    "Austria": "AUT",
+    "Azerbaijan": "AZE",
+    "Bahamas": "BHS",
+    "Bahrain": "BHR",
+    "Bangladesh": "BGD",
+    "Barbados": "BRB",
+    "Belarus": "BLR",
+    "Belgium": "BEL",
+    "Belize": "BLZ",
+    "Benin": "BEN",
+    "Bermuda": "BMU",
+    "Bhutan": "BTN",
+    "Bolivia": "BOL",
+    "Bonaire, Sint Eustatius And Saba": "BES",
+    "Bosnia And Herzegovina": "BIH",
+    "Botswana": "BWA",
+    "Bouvet Island": "BVT",
+    "Brazil": "BRA",
+    "British Indian Ocean Territory": "IOT",
+    "Brunei Darussalam": "BRN",
+    "Bulgaria": "BGR",
+    "Burkina Faso": "BFA",
+    "Burundi": "BDI",
+    "Cabo Verde": "CPV",
+    "Cambodia": "KHM",
+    "Cameroon": "CMR",
+    "Canada": "CAN",
+    "Cayman Islands": "CYM",
+    "Central African Republic": "CAF",
+    "Chad": "TCD",
+    "Chile": "CHL",
+    "China": "CHN",
+    "Christmas Island": "CXR",
+    "Cocos (Keeling) Islands": "CCK",
+    "Colombia": "COL",
+    "Comoros": "COM",
+    "Congo": "COG",
+    "Congo, Democratic Republic Of The": "COD",
+    "Cook Islands": "COK",
+    "Costa Rica": "CRI",
+    "Croatia": "HRV",
+    "Cuba": "CUB",
+    "Curaçao": "CUW",
+    "Cyprus": "CYP",
+    "Czechia": "CZE",
+    "Denmark": "DNK",
+    "Djibouti": "DJI",
+    "Dominica": "DMA",
+    "Dominican Republic": "DOM",
+    "Ecuador": "ECU",
+    "Egypt": "EGY",
+    "El Salvador": "SLV",
+    "Equatorial Guinea": "GNQ",
+    "Eritrea": "ERI",
+    "Estonia": "EST",
+    "Eswatini": "SWZ",
+    "Ethiopia": "ETH",
+    "Falkland Islands": "FLK",
+    "Faroe Islands": "FRO",
+    "Fiji": "FJI",
+    "Finland": "FIN",
+    "France": "FRA",
+    "French Guiana": "GUF",
+    "French Polynesia": "PYF",
+    "French Southern Territories": "ATF",
+    "Gabon": "GAB",
+    "Gambia": "GMB",
+    "Georgia": "GEO",
+    "Germany": "DEU",
+    "Ghana": "GHA",
+    "Gibraltar": "GIB",
+    "Greece": "GRC",
+    "Greenland": "GRL",
+    "Grenada": "GRD",
+    "Guadeloupe": "GLP",
+    "Guam": "GUM",
+    "Guatemala": "GTM",
+    "Guernsey": "GGY",
+    "Guinea": "GIN",
+    "Guinea-Bissau": "GNB",
+    "Guyana": "GUY",
+    "Haiti": "HTI",
+    "Heard Island And Mcdonald Islands": "HMD",
+    "Holy See": "VAT",
+    "Honduras": "HND",
+    "Hong Kong": "HKG",
+    "Hungary": "HUN",
+    "Iceland": "ISL",
+    "India": "IND",
+    "Indonesia": "IDN",
+    "Iran": "IRN",
+    "Iraq": "IRQ",
+    "Ireland": "IRL",
+    "Isle Of Man": "IMN",
+    "Israel": "ISR",
+    "Italy": "ITA",
+    "Jamaica": "JAM",
+    "Japan": "JPN",
+    "Jersey": "JEY",
+    "Jordan": "JOR",
+    "Kazakhstan": "KAZ",
+    "Kenya": "KEN",
+    "Kiribati": "KIR",
+    "Korea (Democratic People's Republic Of)": "PRK",
+    "Korea (Republic Of)": "KOR",
+    "Kuwait": "KWT",
+    "Kyrgyzstan": "KGZ",
+    "Lao People's Democratic Republic": "LAO",
+    "Latvia": "LVA",
+    "Lebanon": "LBN",
+    "Lesotho": "LSO",
+    "Liberia": "LBR",
+    "Libya": "LBY",
+    "Liechtenstein": "LIE",
+    "Lithuania": "LTU",
+    "Luxembourg": "LUX",
+    "Macao": "MAC",
+    "Madagascar": "MDG",
+    "Malawi": "MWI",
+    "Malaysia": "MYS",
+    "Maldives": "MDV",
+    "Mali": "MLI",
+    "Malta": "MLT",
+    "Marshall Islands": "MHL",
+    "Martinique": "MTQ",
+    "Mauritania": "MRT",
+    "Mauritius": "MUS",
+    "Mayotte": "MYT",
+    "Mexico": "MEX",
+    "Micronesia (Federated States Of)": "FSM",
+    "Moldova": "MDA",
+    "Monaco": "MCO",
+    "Mongolia": "MNG",
+    "Montenegro": "MNE",
+    "Montserrat": "MSR",
+    "Morocco": "MAR",
+    "Mozambique": "MOZ",
+    "Myanmar": "MMR",
+    "Namibia": "NAM",
+    "Nauru": "NRU",
+    "Nepal": "NPL",
+    "Netherlands": "NLD",
+    "New Caledonia": "NCL",
+    "New Zealand": "NZL",
+    "Nicaragua": "NIC",
+    "Niger": "NER",
+    "Nigeria": "NGA",
+    "Niue": "NIU",
+    "Norfolk Island": "NFK",
+    "Northern Mariana Islands": "MNP",
+    "Norway": "NOR",
+    "Oman": "OMN",
+    "Pakistan": "PAK",
+    "Palau": "PLW",
+    "Palestine, State Of": "PSE",
+    "Panama": "PAN",
+    "Papua New Guinea": "PNG",
+    "Paraguay": "PRY",
+    "Peru": "PER",
+    "Philippines": "PHL",
+    "Pitcairn": "PCN",
+    "Poland": "POL",
+    "Portugal": "PRT",
+    "Puerto Rico": "PRI",
+    "Qatar": "QAT",
+    "Romania": "ROU",
+    "Russia": "RUS",
+    "Rwanda": "RWA",
+    "Réunion": "REU",
+    "Saint Barthélemy": "BLM",
+    "Saint Helena, Ascension And Tristan Da Cunha": "SHN",
+    "Saint Kitts And Nevis": "KNA",
+    "Saint Lucia": "LCA",
+    "Saint Martin (French Part)": "MAF",
+    "Saint Pierre And Miquelon": "SPM",
+    "Saint Vincent And The Grenadines": "VCT",
+    "Samoa": "WSM",
+    "San Marino": "SMR",
+    "Sao Tome And Principe": "STP",
+    "Saudi Arabia": "SAU",
+    "Senegal": "SEN",
+    "Serbia": "SRB",
+    "Seychelles": "SYC",
+    "Sierra Leone": "SLE",
+    "Singapore": "SGP",
+    "Sint Maarten (Dutch Part)": "SXM",
+    "Slovakia": "SVK",
+    "Slovenia": "SVN",
+    "Solomon Islands": "SLB",
+    "Somalia": "SOM",
+    "South Africa": "ZAF",
+    "South Georgia And The South Sandwich Islands": "SGS",
+    "South Sudan": "SSD",
+    "Spain": "ESP",
+    "Sri Lanka": "LKA",
+    "Sudan": "SDN",
+    "Suriname": "SUR",
+    "Svalbard And Jan Mayen": "SJM",
+    "Sweden": "SWE",
+    "Switzerland": "CHE",
+    "Syrian Arab Republic": "SYR",
+    "Taiwan": "TWN",
+    "Tajikistan": "TJK",
+    "Tanzania": "TZA",
+    "Thailand": "THA",
+    "Timor-Leste": "TLS",
+    "Togo": "TGO",
+    "Tokelau": "TKL",
+    "Tonga": "TON",
+    "Trinidad And Tobago": "TTO",
+    "Tunisia": "TUN",
+    "Turkey": "TUR",
+    "Turkmenistan": "TKM",
+    "Tuvalu": "TUV",
+    "Uganda": "UGA",
+    "Ukraine": "UKR",
+    "United Arab Emirates": "ARE",
+    "United Kingdom": "GBR",
+    "United States": "USA",
+    "Uruguay": "URY",
+    "Uzbekistan": "UZB",
+    "Vanuatu": "VUT",
+    "Venezuela": "VEN",
+    "Viet Nam": "VNM",
+    "Western Sahara": "ESH",
+    "Yemen": "YEM",
+    "Zambia": "ZMB",
+    "Zimbabwe": "ZWE",
+    "Åland Islands": "ALA",
+}
@@ -0,0 +1,166 @@
+"""Typed loading of the cleaned crash CSV, with a fingerprinted Parquet sidecar."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from .corrections import ISO_CODES
+
+# The dashboard reads the bundled CSV unless AIRCRASH_DATA points elsewhere
+DATA_PATH = Path(os.environ.get("AIRCRASH_DATA", Path(__file__).resolve().parent.parent / "cleaned_aircrashes_2024.csv"))
+
+QUARTER_ORDER = ["Qtr 1", "Qtr 2", "Qtr 3", "Qtr 4"]
+MONTH_ORDER = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+]
+
+# Explicit dtypes: low-cardinality text as categoricals, counts as small ints
+COLUMN_DTYPES = {
+    "Year": "int16",
+    "Quarter": pd.CategoricalDtype(QUARTER_ORDER, ordered=True),
+    "Month": pd.CategoricalDtype(MONTH_ORDER, ordered=True),
+    "Day": "int8",
+    "Country/Region": "category",
+    "Aircraft Manufacturer": "category",
+    "Aircraft": "category",
+    "Ground": "int16",
+    "Fatalities (air)": "int16",
+    "Aboard": "int16",
+    "Survivors": "int16",
+    "Continent": "category",
+    "ISO-3": "category",
+}
+
+ISO_COLUMN = "ISO-3"
+# Placeholder country left by the cleaning step; never expected to resolve
+UNKNOWN = "Unknown"
+
+
+def read_csv_typed(path, **kwargs):
+    df = pd.read_csv(path, dtype=COLUMN_DTYPES, parse_dates=["Date"], **kwargs)
+    if ISO_COLUMN not in df and "Country/Region" in df:
+        df[ISO_COLUMN] = iso_codes(df["Country/Region"])
+    return df
+
+
+def iso_lookup(countries):
+    # ISO-3 code per country name (NaN where unknown), resolved once per name
+    names = pd.Index(countries)
+    return pd.Series(names.map(ISO_CODES), index=names, dtype="category")
+
+
+def iso_codes(countries):
+    # ISO-3 column for a categorical country column, mapped per category
+    return countries.astype("category").map(ISO_CODES).astype("category")
+
+
+def unresolved_countries(countries):
+    # Country names with no ISO-3 code, which the choropleth cannot place
+    names = pd.Index(pd.Series(countries).dropna().unique())
+    return sorted(name for name in names if name not in ISO_CODES and name != UNKNOWN)
+
+
+def file_fingerprint(path, stat=None):
+    # Size and mtime are cheap to check; the content hash settles the
+    # cases where the file was touched or copied without changing
+    stat = stat or path.stat()
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest.hexdigest()}
+
+
+def cache_paths(path):
+    # Parquet sidecar and its JSON manifest for the CSV at `path`
+    cache_dir = Path(path).parent / ".cache"
+    return cache_dir / (Path(path).stem + ".parquet"), cache_dir / (Path(path).stem + ".json")
+
+
+def read_manifest(path=DATA_PATH):
+    try:
+        return json.loads(cache_paths(path)[1].read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def write_sidecar(df, fingerprint, path=DATA_PATH):
+    sidecar_path, manifest_path = cache_paths(path)
+    try:
+        sidecar_path.parent.mkdir(exist_ok=True)
+        tmp_path = sidecar_path.with_suffix(".parquet.tmp")
+        df.to_parquet(tmp_path, index=False)
+        tmp_path.replace(sidecar_path)
+        manifest_path.write_text(json.dumps(fingerprint))
+    except (OSError, ImportError, ValueError):
+        # A read-only checkout still works, it just parses the CSV each start
+        pass
+
+
+def read_sidecar(path=DATA_PATH):
+    try:
+        df = pd.read_parquet(cache_paths(path)[0])
+    except (OSError, ImportError, ValueError):
+        return None
+    # Sidecars written before the ISO-3 column existed
+    if ISO_COLUMN not in df:
+        df[ISO_COLUMN] = iso_codes(df["Country/Region"])
+    return df
+
+
+def current_fingerprint(path=DATA_PATH):
+    # Fingerprint of the CSV, hashing the content only when the manifest's
+    # size and mtime no longer match
+    stat = Path(path).stat()
+    manifest = read_manifest(path)
+    if manifest and (manifest.get("size"), manifest.get("mtime_ns")) == (stat.st_size, stat.st_mtime_ns):
+        return manifest
+    return file_fingerprint(path, stat)
+
+
+def load_dataset(path=DATA_PATH):
+    # The whole CSV as a typed frame, read from the sidecar whenever its key
+    # still matches; df.attrs["sha256"] identifies the data version
+    stat = Path(path).stat()
+    manifest = read_manifest(path)
+
+    if manifest and (manifest.get("size"), manifest.get("mtime_ns")) == (stat.st_size, stat.st_mtime_ns):
+        df = read_sidecar(path)
+        if df is not None:
+            df.attrs["sha256"] = manifest["sha256"]
+            return df
+
+    fingerprint = file_fingerprint(path, stat)
+    if manifest and manifest.get("sha256") == fingerprint["sha256"]:
+        df = read_sidecar(path)
+        if df is not None:
+            # Content unchanged, only the metadata moved: refresh the key
+            write_sidecar(df, fingerprint, path)
+            df.attrs["sha256"] = fingerprint["sha256"]
+            return df
+
+    df = read_csv_typed(path)
+    write_sidecar(df, fingerprint, path)
+    df.attrs["sha256"] = fingerprint["sha256"]
+    return df
+
+
+def align_categories(frame, rows):
+    # Shallow copies of `frame` and `rows` whose categorical columns share one
+    # dtype, widening unordered categories with any values only `rows` has
+    frame = frame.copy(deep=False)
+    rows = rows.copy(deep=False)
+    for column in frame.columns:
+        dtype = frame[column].dtype
+        if not isinstance(dtype, pd.CategoricalDtype) or column not in rows:
+            continue
+        new_values = pd.Index(rows[column].dropna().astype(object).unique()).difference(dtype.categories)
+        if len(new_values) and not dtype.ordered:
+            dtype = pd.CategoricalDtype(dtype.categories.append(new_values).sort_values())
+            frame[column] = frame[column].astype(dtype)
+        rows[column] = rows[column].astype(dtype)
+    return frame, rows
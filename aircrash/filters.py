@@ -0,0 +1,226 @@
+"""Inverted index from sidebar filter values to row positions.
+
+A filter state holds one entry per filter column, one per search column and
+one for the date range. Each is "All" (or empty) when the filter is off; a
+column entry is otherwise a value or a tuple of values, and the date entry a
+(start, end) pair of ISO dates, either end None when open. The positions of
+the most selective filter are materialized first and every other filter is
+then tested on those positions only: a lookup table over category codes for
+the columns, a range check for the dates.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Sidebar filters as (widget key, column, label)
+FILTERS = [
+    ("year", "Year", "Select Years:"),
+    ("country", "Country/Region", "Select Countries:"),
+    ("continent", "Continent", "Select Continents:"),
+    ("quarter", "Quarter", "Select Quarters:"),
+]
+FILTER_COLUMNS = [column for _, column, _ in FILTERS]
+
+# Columns the sidebar search (aircrash.search) narrows to the value picked,
+# as (query parameter, column)
+SEARCH_FILTERS = [
+    ("aircraft", "Aircraft"),
+    ("manufacturer", "Aircraft Manufacturer"),
+]
+SEARCH_COLUMNS = [column for _, column in SEARCH_FILTERS]
+
+# Columns with a value index
+INDEXED_COLUMNS = FILTER_COLUMNS + SEARCH_COLUMNS
+
+# The date range is filtered on the sorted Date column with a binary search
+DATE_FILTER = ("dates", "Date", "Select Date Range:")
+DATE_COLUMN = DATE_FILTER[1]
+
+# Column order of a filter state tuple
+STATE_COLUMNS = INDEXED_COLUMNS + [DATE_COLUMN]
+ALL_STATE = ("All",) * len(STATE_COLUMNS)
+
+EMPTY_POSITIONS = np.empty(0, dtype=np.int32)
+DAY_NS = 86_400 * 10**9
+OPEN_START = np.iinfo(np.int64).min + 1  # above NaT, so missing dates never match
+OPEN_END = np.iinfo(np.int64).max
+
+
+def is_all(value):
+    return value is None or (isinstance(value, str) and value == "All") or (
+        isinstance(value, (tuple, list, set, frozenset)) and not len(value)
+    )
+
+
+def as_values(value):
+    return list(value) if isinstance(value, (tuple, list, set, frozenset)) else [value]
+
+
+def make_state(selections):
+    # Filter state tuple from {column: entry}, missing columns being "All"
+    return tuple(selections.get(column, "All") for column in STATE_COLUMNS)
+
+
+def date_bounds(value):
+    # Inclusive (start, end) ISO dates as [start, end + 1 day) in datetime64[ns] integers
+    start, end = value
+    start = OPEN_START if start is None else pd.Timestamp(start).value
+    end = OPEN_END if end is None else pd.Timestamp(end).value + DAY_NS
+    return start, end
+
+
+def date_keys(dates):
+    return dates.to_numpy("datetime64[ns]").view("int64")
+
+
+def build_date_index(keys):
+    # Row positions in date order and the dates in that order; when the rows
+    # are already in date order (the cubes are built that way) a range is a
+    # plain slice of positions
+    order = np.argsort(keys, kind="stable").astype(np.int32)
+    return {
+        "keys": keys,
+        "order": order,
+        "sorted": keys[order],
+        "monotonic": bool(np.all(keys[1:] >= keys[:-1])),
+    }
+
+
+def build_filter_index(df):
+    # For every filter and search column: the distinct values, their codes,
+    # the per-row value codes and a posting list (sorted row positions) for
+    # each value; for the Date column, the date order used for range searches.
+    # Columns `df` does not have are left out.
+    index = {}
+    for column in INDEXED_COLUMNS:
+        if column not in df:
+            continue
+        codes, values = pd.factorize(df[column], sort=True)
+        rows = np.flatnonzero(codes >= 0)  # missing values never match a filter
+        order = rows[np.argsort(codes[rows], kind="stable")].astype(np.int32)
+        counts = np.bincount(codes[rows], minlength=len(values))
+        postings = np.split(order, np.cumsum(counts)[:-1])
+        values = values.tolist()
+        index[column] = {
+            "values": values,
+            "code_of": {value: code for code, value in enumerate(values)},
+            "codes": codes,
+            "postings": dict(zip(values, postings)),
+        }
+    if DATE_COLUMN in df:
+        index[DATE_COLUMN] = build_date_index(date_keys(df[DATE_COLUMN]))
+    return index
+
+
+def extend_filter_index(index, df, positions):
+    # A new index that also covers the rows of `df` at `positions`, which must
+    # come after every row already indexed; `index` itself is left untouched
+    positions = np.asarray(positions, dtype=np.int32)
+    extended = {}
+    for column, entry in index.items():
+        if column == DATE_COLUMN:
+            keys = np.concatenate((entry["keys"], date_keys(df[column].take(positions))))
+            extended[column] = build_date_index(keys)
+            continue
+        values = list(entry["values"])
+        code_of = dict(entry["code_of"])
+        postings = dict(entry["postings"])
+
+        new_codes, uniques = pd.factorize(df[column].take(positions))
+        mapping = np.empty(len(uniques) + 1, dtype=np.int64)
+        mapping[-1] = -1  # factorize marks missing values with -1
+        for i, value in enumerate(uniques.tolist()):
+            if value not in code_of:
+                code_of[value] = len(values)
+                values.append(value)
+            mapping[i] = code_of[value]
+            postings[value] = np.concatenate((postings.get(value, EMPTY_POSITIONS), positions[new_codes == i]))
+
+        extended[column] = {
+            "values": values,
+            "code_of": code_of,
+            "codes": np.concatenate((entry["codes"], mapping[new_codes])),
+            "postings": postings,
+        }
+    return extended
+
+
+def column_filter(entry, value):
+    # (matching row count, positions, test) for one column selection
+    selected = [v for v in as_values(value) if v in entry["code_of"]]
+    postings = [entry["postings"][v] for v in selected]
+    member = np.zeros(len(entry["values"]) + 1, dtype=bool)  # the extra slot catches code -1
+    member[[entry["code_of"][v] for v in selected]] = True
+
+    def positions():
+        if len(postings) == 1:
+            return postings[0]
+        # Posting lists are disjoint, so their sorted concatenation is the union
+        return np.sort(np.concatenate(postings)) if postings else EMPTY_POSITIONS
+
+    return sum(map(len, postings)), positions, lambda rows: member[entry["codes"][rows]]
+
+
+def date_filter(entry, value):
+    # (matching row count, positions, test) for a date range, by binary search
+    start, end = date_bounds(value)
+    lo, hi = np.searchsorted(entry["sorted"], [start, end], side="left")
+
+    def positions():
+        if entry["monotonic"]:
+            return np.arange(lo, hi, dtype=np.int32)
+        return np.sort(entry["order"][lo:hi])
+
+    def test(rows):
+        keys = entry["keys"][rows]
+        return (keys >= start) & (keys < end)
+
+    return max(int(hi - lo), 0), positions, test
+
+
+def filter_positions(index, selections):
+    # Sorted positions of the rows every active filter keeps; None means no
+    # filter is active and every row matches. The most selective filter
+    # supplies the candidates, the others are membership tests on them.
+    filters = [
+        date_filter(index[column], value) if column == DATE_COLUMN else column_filter(index[column], value)
+        for column, value in selections.items()
+        if not is_all(value)
+    ]
+    if not filters:
+        return None
+    filters.sort(key=lambda item: item[0])
+    positions = filters[0][1]()
+    for _, _, test in filters[1:]:
+        if not len(positions):
+            break
+        positions = positions[test(positions)]
+    return positions
+
+
+def filter_options(index, selections, column):
+    # Sorted values of `column` that still have rows under the other active filters
+    entry = index[column]
+    others = {c: v for c, v in selections.items() if c != column}
+    positions = filter_positions(index, others)
+    if positions is None:
+        return sorted(entry["values"])
+    codes = entry["codes"][positions]
+    present = np.flatnonzero(np.bincount(codes[codes >= 0], minlength=len(entry["values"])))
+    return sorted(entry["values"][code] for code in present)
+
+
+def selection_mask(frame, selections):
+    # Boolean mask of the rows of `frame` (with the filter columns) that a
+    # selection keeps, for small frames that have no index
+    mask = np.ones(len(frame), dtype=bool)
+    for column, value in selections.items():
+        if is_all(value):
+            continue
+        if column == DATE_COLUMN:
+            start, end = date_bounds(value)
+            keys = date_keys(frame[column])
+            mask &= (keys >= start) & (keys < end)
+        else:
+            mask &= frame[column].isin(as_values(value)).to_numpy()
+    return mask
@@ -0,0 +1,249 @@
+"""Written findings shown under the charts, as markdown blocks in page order.
+
+The numbers come from the data: aircrash.prerender reduces the cached
+aggregates of the unfiltered view to plain tables (lists of tuples) and
+findings_blocks() writes the text around them, so the findings follow the
+data instead of going stale. Only the recommendations are fixed text.
+"""
+
+import datetime
+import math
+
+# Years counted as "recent" in the trend findings
+RECENT_YEARS = 10
+# Countries with fewer people aboard stay out of the survival-rate ranking
+SURVIVAL_MIN_ABOARD = 100
+
+
+def share(part, whole):
+    return part / whole * 100 if whole else 0.0
+
+
+def ratio(part, whole):
+    return part / whole if whole else 0.0
+
+
+def listing(names):
+    # "**A**", "**A** and **B**", "**A**, **B** and **C**"
+    names = [f"**{name}**" for name in names]
+    return " and ".join(names) if len(names) < 3 else ", ".join(names[:-1]) + " and " + names[-1]
+
+
+def trend_findings(yearly):
+    # yearly: (year, crashes, fatalities) in year order
+    decades = {}
+    for year, crashes, _ in yearly:
+        decades[year // 10 * 10] = decades.get(year // 10 * 10, 0) + crashes
+    peak = max(decades, key=decades.get)
+    busiest, busiest_crashes, _ = max(yearly, key=lambda row: row[1])
+    last, last_crashes, _ = yearly[-1]
+    recent = sum(crashes for year, crashes, _ in yearly if year > last - RECENT_YEARS) / RECENT_YEARS
+    peak_rate = decades[peak] / 10
+    change = share(recent, peak_rate) - 100
+    direction = f"**{-change:.0f}% below**" if change < 0 else f"**{change:.0f}% above**"
+    return f"""### 1. ✈️ Global Air Crash Trends
+- **Busiest decade:** the **{peak}s**, with **{decades[peak]:,} crashes** (about **{peak_rate:.0f} a year**).  
+- **Busiest year:** **{busiest}**, with **{busiest_crashes:,} crashes**.  
+- **Last {RECENT_YEARS} years ({last - RECENT_YEARS + 1}–{last}):** about **{recent:.0f} crashes a year**, {direction} the rate of the {peak}s.  
+- **Latest year ({last}):** **{last_crashes:,} crashes**.
+"""
+
+
+def yearly_fatality_findings(yearly):
+    deadliest = sorted(yearly, key=lambda row: row[2], reverse=True)[:3]
+    crashes = sum(row[1] for row in yearly)
+    fatalities = sum(row[2] for row in yearly)
+    first, last = yearly[0][0], yearly[-1][0]
+    recent = sum(row[2] for row in yearly if row[0] > last - RECENT_YEARS) / RECENT_YEARS
+    worst, worst_crashes, worst_fatalities = deadliest[0]
+    years = ", ".join(f"**{year}** ({dead:,} fatalities in {count:,} crashes)" for year, count, dead in deadliest)
+    return f"""### 2. Total Crashes and Fatalities Per Year
+- **Deadliest years:** {years}.
+- **Fatalities per crash:** **{ratio(fatalities, crashes):.1f}** over the whole record, against **{ratio(worst_fatalities, worst_crashes):.1f}** in {worst}: a few large accidents make a deadly year.
+- **Recent years:** about **{recent:,.0f} fatalities a year** over the last {RECENT_YEARS} years, against **{fatalities / (last - first + 1):,.0f}** a year since {first}.
+"""
+
+
+def manufacturer_findings(manufacturers, total_fatalities):
+    # manufacturers: (manufacturer, fatalities), most fatalities first
+    leaders = manufacturers[:2]
+    counts = " and ".join(f"**{dead:,}**" for _, dead in leaders)
+    top = sum(dead for _, dead in manufacturers)
+    lines = [
+        f"- **Highest Fatalities:** {listing(name for name, _ in leaders)} account for the most air fatalities ({counts}).  ",
+        f"- **Top {len(manufacturers)} share:** together they account for **{share(top, total_fatalities):.1f}%** of all **{total_fatalities:,}** air fatalities.  ",
+    ]
+    if len(manufacturers) > 2:
+        lines.append(f"- **Rest of the top {len(manufacturers)}:** {listing(name for name, _ in manufacturers[2:])}.")
+    return f"### 3. Top {len(manufacturers)} Aircraft Manufacturers by Air Fatalities\n" + "\n".join(lines) + "\n"
+
+
+def continent_findings(continents):
+    # continents: (continent, crashes, fatalities)
+    by_fatalities = sorted(continents, key=lambda row: row[2], reverse=True)
+    by_rate = sorted(continents, key=lambda row: ratio(row[2], row[1]), reverse=True)
+    leaders = by_fatalities[:2]
+    lowest, lowest_crashes, lowest_fatalities = by_fatalities[-1]
+    return f"""### 4. ✈️ Air Crash Patterns by Continent
+- **Highest Fatalities:** {listing(name for name, _, _ in leaders)} lead with {" and ".join(f"**{dead:,}**" for _, _, dead in leaders)} fatalities.  
+- **Fatalities per crash:** **{by_rate[0][0]}** averages **{ratio(by_rate[0][2], by_rate[0][1]):.1f}**, the most of any continent, and **{by_rate[-1][0]}** the fewest (**{ratio(by_rate[-1][2], by_rate[-1][1]):.1f}**).  
+- **Lowest Counts:** **{lowest}** has the fewest fatalities (**{lowest_fatalities:,}** in {lowest_crashes:,} crashes).
+"""
+
+
+def country_findings(countries, total_crashes):
+    # countries: (country, crashes), most crashes first
+    (leader, most), rest = countries[0], countries[1:]
+    lines = [f"- **Leader:** **{leader}** recorded **{most:,} crashes**, the most of any country.  "]
+    if rest:
+        second, count = rest[0]
+        lines.append(f"- **Second Place:** **{second}** with **{count:,} crashes**, {share(count, most):.0f}% of the leader's.  ")
+    top = sum(count for _, count in countries)
+    lines.append(f"- **Top {len(countries)} share:** these countries account for **{share(top, total_crashes):.1f}%** of all crashes.")
+    return f"### 5. 🌍 Top {len(countries)} Countries by Air Crashes\n" + "\n".join(lines) + "\n"
+
+
+def aircraft_findings(aircraft):
+    # aircraft: (aircraft type, crashes), most crashes first
+    (leader, most), rest = aircraft[0], aircraft[1:]
+    lines = [f"- **Most Involved:** The **{leader}** with **{most:,} crashes** tops the list.  "]
+    if rest:
+        second, count = rest[0]
+        lines.append(
+            f"- **Disparity:** that is **{ratio(most, count):.1f} times** the second most involved aircraft, "
+            f"the **{second}** (**{count:,} crashes**).  "
+        )
+    if len(rest) > 1:
+        lines.append(f"- **Rest of the top {len(aircraft)}:** {listing(name for name, _ in rest[1:])}.")
+    return "### 6. 🛩️ Top Aircraft Types Involved in Crashes\n" + "\n".join(lines) + "\n"
+
+
+def quarter_findings(quarters):
+    # quarters: (quarter, fatalities, survivors) in quarter order
+    deadliest = max(quarters, key=lambda row: row[1])
+    safest = min(quarters, key=lambda row: row[1])
+    most_saved = max(quarters, key=lambda row: row[2])
+    exceeded = sum(dead > saved for _, dead, saved in quarters)
+    every = "every quarter" if exceeded == len(quarters) else f"{exceeded} of {len(quarters)} quarters"
+    return f"""### 📉 7. Trend of Air Fatalities and Survivors by Quarter
+- **Fatalities exceed survivors** in {every}.  
+- **{deadliest[0]}** shows the most fatalities (**{deadliest[1]:,}**, with **{deadliest[2]:,}** survivors).  
+- **{safest[0]}** records the fewest (fatalities **{safest[1]:,}**, survivors **{safest[2]:,}**).  
+- Survivors peak in **{most_saved[0]}** (**{most_saved[2]:,}**).
+"""
+
+
+def survivor_share_findings(continents, total_survivors):
+    # continents: (continent, survivors), most survivors first
+    shares = [(name, share(saved, total_survivors)) for name, saved in continents]
+    leaders = shares[:3]
+    lines = [
+        f"- **{leaders[0][0]} leads** with **{leaders[0][1]:.1f}%** of all survivors"
+        + (", followed by " + " and ".join(f"**{name} ({part:.1f}%)**" for name, part in leaders[1:]) if len(leaders) > 1 else "")
+        + ".  "
+    ]
+    if len(leaders) > 1:
+        lines.append(f"- These {len(leaders)} continents account for **{sum(part for _, part in leaders):.1f}%** of all survivors.  ")
+    if len(shares) > len(leaders):
+        lines.append(f"- **{shares[-1][0]}** has the smallest share (**{shares[-1][1]:.1f}%**).")
+    return "### 🌍 8. Share of Total Survivors by Continent\n" + "\n".join(lines) + "\n"
+
+
+def moving_average_findings(window, peaks):
+    # peaks: (manufacturer, highest moving average, ISO date of it), in survivor rank order
+    def month(day):
+        return datetime.date.fromisoformat(day).strftime("%B %Y")
+
+    highest = max(peaks, key=lambda row: row[1])
+    lowest = min(peaks, key=lambda row: row[1])
+    each = ", ".join(f"{name} **~{peak:.0f}** ({day[:4]})" for name, peak, day in peaks)
+    lines = [
+        f"- **Top {len(peaks)} by survivors:** {listing(name for name, _, _ in peaks)}.  ",
+        f"- **{highest[0]} shows the highest peak**, reaching **~{highest[1]:.0f}** survivors ({window} average) in **{month(highest[2])}**.  ",
+        f"- **Peaks:** {each}.  ",
+    ]
+    if len(peaks) > 1:
+        lines.append(f"- **{lowest[0]}** keeps the lowest peak, never above **~{lowest[1]:.0f}**.")
+    return f"### ✈️ 9. Moving Average of Survivors by Top {len(peaks)} Aircraft Manufacturers\n" + "\n".join(lines) + "\n"
+
+
+def survival_findings(countries):
+    # countries: (country, survivors, aboard, rate, bootstrap low, bootstrap high), rates in %
+    ranked = sorted(
+        (row for row in countries if row[2] >= SURVIVAL_MIN_ABOARD), key=lambda row: row[3], reverse=True
+    )
+    lines = [f"- **Highest Survival Rates** (at least {SURVIVAL_MIN_ABOARD} aboard, 95% bootstrap interval):  "]
+    for place, (name, saved, aboard, rate, low, high) in enumerate(ranked[:3]):
+        verb = "leads with" if place == 0 else "follows with"
+        # A single crash has no bootstrap interval (NaN bounds)
+        interval = f"{low:.1f}–{high:.1f}%" if not math.isnan(low) else "a single crash, no interval"
+        lines.append(
+            f"  - **{name}** {verb} **{rate:.2f}%** ({saved:,} survivors out of {aboard:,} aboard; {interval}).  "
+        )
+    bounded = [row for row in ranked if not math.isnan(row[4])]
+    if bounded:
+        surest = max(bounded, key=lambda row: row[4])
+        lines.append(
+            f"- **Most certain:** ranked by the low end of the interval, **{surest[0]}** leads with at least "
+            f"**{surest[4]:.1f}%**; a rate resting on a few crashes has a wide interval.  "
+        )
+    if ranked:
+        busiest = max(ranked, key=lambda row: row[2])
+        lines.append(
+            f"- **Most people aboard:** **{busiest[0]}** (**{busiest[2]:,}**) achieves a **{busiest[3]:.2f}%** "
+            f"survival rate ({busiest[1]:,} survivors)."
+        )
+    return "### 🗺️ 10. Survival Rate by Country\n" + "\n".join(lines) + "\n"
+
+
+def findings_blocks(facts):
+    # Markdown blocks of the Findings section from the tables of
+    # aircrash.prerender.findings_facts()
+    if not facts["yearly"]:
+        return ["## 📊 Findings", "No crashes in the data.", RECOMMENDATIONS]
+    totals = facts["totals"]
+    return [
+        "## 📊 Findings",
+        trend_findings(facts["yearly"]),
+        yearly_fatality_findings(facts["yearly"]),
+        manufacturer_findings(facts["manufacturers"], totals["Fatalities (air)"]),
+        continent_findings(facts["continents"]),
+        country_findings(facts["countries"], totals["Crashes"]),
+        aircraft_findings(facts["aircraft"]),
+        quarter_findings(facts["quarters"]),
+        survivor_share_findings(facts["survivor_shares"], totals["Survivors"]),
+        moving_average_findings(facts["window"], facts["peaks"]),
+        survival_findings(facts["survival"]),
+        RECOMMENDATIONS,
+    ]
+
+
+# Fixed text, shown after the findings
+RECOMMENDATIONS = """
+### 🛠️ Recommendations for Improving Global Aviation Safety (1908–2024)
+
+Based on over a century of air crash data, the following five recommendations represent the most impactful strategies for strengthening global aviation safety:
+
+
+ **1. Modernize and Replace Aging Aircraft Fleets**
+Retire older aircraft models especially legacy types such as DC-series, early Boeing models, and aging Soviet era aircraft.  
+Invest in modern fleets equipped with advanced avionics, improved structural integrity, and real time safety monitoring systems.
+
+
+ **2. Strengthen Aviation Oversight in High Risk Regions**
+Expand international safety audits and provide technical and regulatory support to regions with historically high crash and fatality rates.  
+Enhance ICAO compliance and ensure consistent implementation of global safety standards.
+
+ **3. Improve Pilot Training and Human Factors Programs**
+Increase investment in simulator based emergency training, Crew Resource Management (CRM), and updated cockpit communication protocols.  
+Human error remains a major cause of crashes, and enhanced training can significantly reduce risk.
+
+ **4. Enhance Emergency Response and Survival Capabilities**
+Upgrade airport firefighting systems, rescue readiness, and evacuation procedures.  
+Improve cabin safety design, onboard medical tools, and clearer safety briefing materials to increase survival outcomes.
+
+ **5. Expand Adoption of Advanced Technology and Data Systems**
+Encourage the use of AI assisted monitoring, predictive maintenance, advanced weather detection tools, and integrated data reporting systems.  
+Greater transparency and real time diagnostics help prevent incidents before they occur.
+
+"""
@@ -0,0 +1,62 @@
+"""Read-only containers for data shared by every session in the process.
+
+A snapshot and the aggregates cached for it are built once and handed to all
+sessions without being copied, so nothing that receives them may change
+them. ``freeze`` turns dicts into ``FrozenMapping``, lists into tuples and
+NumPy arrays into read-only views. Frames and series are handed out as
+shallow copies: they share the stored columns, and under pandas
+copy-on-write any change made to one only ever touches that copy.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+
+class FrozenMapping(Mapping):
+    # A dict that cannot be changed after it is built
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items=()):
+        object.__setattr__(self, "_items", {key: freeze(value) for key, value in dict(items).items()})
+
+    def __getitem__(self, key):
+        value = self._items[key]
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return value.copy(deep=False)
+        return value
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __reduce__(self):
+        return FrozenMapping, (self._items,)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._items!r})"
+
+
+def freeze(value):
+    # A read-only equivalent of `value` that shares its data
+    if isinstance(value, FrozenMapping):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenMapping(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, np.ndarray):
+        view = value.view()
+        view.flags.writeable = False
+        return view
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        # A private shallow copy, so the builder's own reference cannot change it either
+        return value.copy(deep=False)
+    return value
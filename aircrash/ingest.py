@@ -0,0 +1,135 @@
+"""Chunked streaming ingestion: aggregate a crash CSV without loading its rows.
+
+Only three aggregates stay resident: the crash cube and the two daily tables
+(totals per day, survivors per manufacturer and day), see
+aircrash.aggregations. None of them has a row per crash: the cube holds one
+cell per combination of its dimensions, the daily tables one per day (and
+manufacturer). Peak memory is a chunk plus the partial aggregates of a few
+chunks on top of them, so it follows the chunk size and the number of
+distinct combinations, not the number of rows::
+
+    python -m aircrash.ingest path/to/crashes.csv --chunksize 250000
+
+The crash records are not kept, so a streamed dashboard cannot filter by
+date range, and its daily survivors per manufacturer follow the
+manufacturer filter only.
+"""
+
+import argparse
+import resource
+import time
+
+import pandas as pd
+
+from .aggregations import (
+    CUBE_DIMENSIONS,
+    CUBE_MEASURES,
+    MANUFACTURER_DAY_DIMENSIONS,
+    RECORD_DIMENSIONS,
+    build_crash_cube,
+    build_day_totals,
+    build_manufacturer_days,
+    crash_records,
+    in_date_order,
+    merge_cubes,
+)
+from .data import COLUMN_DTYPES, DATA_PATH
+from .filters import DATE_COLUMN
+
+DEFAULT_CHUNKSIZE = 250_000
+# Partial cubes are folded into the running state once this many are pending
+MERGE_EVERY = 8
+
+# Per-chunk categoricals would not line up across chunks, so text columns are
+# read as plain strings while streaming and categorized once at the end
+STREAM_DTYPES = {
+    column: "str" if isinstance(dtype, str) and dtype == "category" else dtype
+    for column, dtype in COLUMN_DTYPES.items()
+}
+USE_COLUMNS = RECORD_DIMENSIONS + CUBE_MEASURES[1:]
+
+
+class CubeAccumulator:
+    # Running cube over every chunk seen so far; it holds one cell per
+    # distinct combination of `dimensions` plus the partials not yet folded,
+    # at most MERGE_EVERY chunks' worth
+
+    def __init__(self, dimensions, measures, build):
+        self.dimensions = dimensions
+        self.measures = measures
+        self.build = build
+        self.state = None
+        self.pending = []
+
+    def add(self, chunk):
+        self.pending.append(self.build(chunk))
+        if len(self.pending) >= MERGE_EVERY:
+            self._fold()
+
+    def _fold(self):
+        parts = self.pending if self.state is None else [self.state] + self.pending
+        self.state = merge_cubes(parts, self.dimensions, self.measures)
+        self.pending = []
+
+    def result(self):
+        if self.pending:
+            self._fold()
+        if self.state is None:
+            return pd.DataFrame(columns=self.dimensions + self.measures)
+        cube = self.state
+        for column in self.dimensions:
+            if column in COLUMN_DTYPES:
+                cube[column] = cube[column].astype(COLUMN_DTYPES[column])
+        cube[self.measures] = cube[self.measures].astype("int64")
+        cube = cube.sort_values(self.dimensions, ignore_index=True)
+        return in_date_order(cube) if DATE_COLUMN in self.dimensions else cube
+
+
+def stream_aggregates(path=DATA_PATH, chunksize=DEFAULT_CHUNKSIZE):
+    # The crash cube and the daily tables for the CSV at `path`, read
+    # `chunksize` rows at a time; rows missing a dimension or the date are
+    # left out of all three, as they are out of the crash records
+    accumulators = {
+        "cube": CubeAccumulator(CUBE_DIMENSIONS, CUBE_MEASURES, build_crash_cube),
+        "days": CubeAccumulator([DATE_COLUMN], CUBE_MEASURES, build_day_totals),
+        "manufacturer_days": CubeAccumulator(MANUFACTURER_DAY_DIMENSIONS, ["Survivors"], build_manufacturer_days),
+    }
+    rows = 0
+    with pd.read_csv(
+        path, dtype=STREAM_DTYPES, parse_dates=["Date"], usecols=USE_COLUMNS, chunksize=chunksize
+    ) as reader:
+        for chunk in reader:
+            counted = crash_records(chunk)
+            for accumulator in accumulators.values():
+                accumulator.add(counted)
+            rows += len(chunk)
+    state = {name: accumulator.result() for name, accumulator in accumulators.items()}
+    state["rows"] = rows
+    return state
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate a crash CSV in chunks and report peak memory.")
+    parser.add_argument("path", nargs="?", default=DATA_PATH, help="crash CSV (default: %(default)s)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="rows per chunk")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    state = stream_aggregates(args.path, args.chunksize)
+    elapsed = time.perf_counter() - started
+
+    totals = state["cube"][CUBE_MEASURES].sum()
+    for label, value in [
+        ("rows", state["rows"]),
+        ("cube cells", len(state["cube"])),
+        ("days", len(state["days"])),
+        ("manufacturer days", len(state["manufacturer_days"])),
+    ] + [(measure, int(totals[measure])) for measure in CUBE_MEASURES]:
+        print(f"{label + ':':<19} {value:,}")
+    print(f"{'elapsed:':<19} {elapsed:.2f}s")
+    # ru_maxrss is in kilobytes on Linux
+    print(f"{'peak RSS:':<19} {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
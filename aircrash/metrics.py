@@ -0,0 +1,219 @@
+"""Per-section timings, rows, allocations and cache hits for the dashboard.
+
+Wrap a section in ``with section("name") as record`` and it is timed and
+counted into process-wide latency histograms. Inside it, ``note_rows``
+records how many rows the section worked on and ``note_hit``/``note_miss``
+(or ``lookup`` around a memoized call) record cache behaviour. Allocation
+deltas are only measured while tracemalloc is tracing
+(``start_alloc_tracking``).
+
+Results are exported as one JSON log line per section (``configure_json_log``)
+and as Prometheus text (``prometheus_text``, served by ``start_metrics_server``).
+"""
+
+import contextvars
+import functools
+import json
+import logging
+import math
+import threading
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+# Upper bounds in seconds, Prometheus style; the last bucket is +Inf
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf)
+RECENT_PER_SECTION = 200  # latencies kept per section for exact percentiles
+
+logger = logging.getLogger("aircrash.metrics")
+_current = contextvars.ContextVar("aircrash_section", default=None)
+
+
+class SectionMetrics:
+    # Histograms and running totals per section name, safe to update from
+    # every session thread at once
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.buckets = defaultdict(lambda: [0] * len(LATENCY_BUCKETS))
+        self.totals = defaultdict(lambda: {"count": 0, "seconds": 0.0, "rows": 0, "hits": 0, "misses": 0, "alloc_bytes": 0})
+        self.recent = defaultdict(lambda: deque(maxlen=RECENT_PER_SECTION))
+        self.last = {}
+
+    @contextmanager
+    def section(self, name):
+        record = {"section": name, "rows": None, "hits": 0, "misses": 0, "alloc_bytes": None}
+        token = _current.set(record)
+        tracing = tracemalloc.is_tracing()
+        allocated = tracemalloc.get_traced_memory()[0] if tracing else 0
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - started
+            if tracing and tracemalloc.is_tracing():
+                record["alloc_bytes"] = tracemalloc.get_traced_memory()[0] - allocated
+            _current.reset(token)
+            self.observe(record)
+
+    def observe(self, record):
+        name = record["section"]
+        with self._lock:
+            buckets = self.buckets[name]
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if record["seconds"] <= bound:
+                    buckets[i] += 1
+                    break
+            totals = self.totals[name]
+            totals["count"] += 1
+            totals["seconds"] += record["seconds"]
+            totals["rows"] += record["rows"] or 0
+            totals["hits"] += record["hits"]
+            totals["misses"] += record["misses"]
+            totals["alloc_bytes"] += record["alloc_bytes"] or 0
+            self.recent[name].append(record["seconds"])
+            last = self.last[name] = dict(record, time=time.time())
+        if logger.handlers:
+            logger.info(json.dumps(last))
+
+    def summary(self):
+        # One row per section: last run and percentiles over recent runs
+        with self._lock:
+            rows = []
+            for name, last in self.last.items():
+                recent = np.fromiter(self.recent[name], dtype=float)
+                totals = self.totals[name]
+                lookups = totals["hits"] + totals["misses"]
+                rows.append({
+                    "section": name,
+                    "runs": totals["count"],
+                    "last_ms": last["seconds"] * 1000,
+                    "p50_ms": np.percentile(recent, 50) * 1000,
+                    "p95_ms": np.percentile(recent, 95) * 1000,
+                    "rows": last["rows"],
+                    "alloc_kb": None if last["alloc_bytes"] is None else last["alloc_bytes"] / 1024,
+                    "cache": "miss" if last["misses"] else "hit" if last["hits"] else "",
+                    "hit_rate": totals["hits"] / lookups if lookups else None,
+                })
+            return rows
+
+    def prometheus_text(self):
+        lines = [
+            "# HELP aircrash_section_seconds Wall time per dashboard section.",
+            "# TYPE aircrash_section_seconds histogram",
+        ]
+        with self._lock:
+            for name, buckets in sorted(self.buckets.items()):
+                label = name.replace("\\", "\\\\").replace('"', '\\"')
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, buckets):
+                    cumulative += count
+                    le = "+Inf" if math.isinf(bound) else repr(bound)
+                    lines.append(f'aircrash_section_seconds_bucket{{section="{label}",le="{le}"}} {cumulative}')
+                totals = self.totals[name]
+                lines.append(f'aircrash_section_seconds_sum{{section="{label}"}} {totals["seconds"]}')
+                lines.append(f'aircrash_section_seconds_count{{section="{label}"}} {totals["count"]}')
+            for metric, key, help_text in (
+                ("aircrash_section_rows_total", "rows", "Rows processed per section."),
+                ("aircrash_section_cache_hits_total", "hits", "Cache hits per section."),
+                ("aircrash_section_cache_misses_total", "misses", "Cache misses per section."),
+                ("aircrash_section_alloc_bytes_total", "alloc_bytes", "Net bytes allocated per section while tracing."),
+            ):
+                lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+                for name, totals in sorted(self.totals.items()):
+                    label = name.replace("\\", "\\\\").replace('"', '\\"')
+                    lines.append(f'{metric}{{section="{label}"}} {totals[key]}')
+        return "\n".join(lines) + "\n"
+
+
+METRICS = SectionMetrics()
+section = METRICS.section
+
+
+def note_rows(rows):
+    record = _current.get()
+    if record is not None:
+        record["rows"] = (record["rows"] or 0) + int(rows)
+
+
+def note_hit():
+    record = _current.get()
+    if record is not None:
+        record["hits"] += 1
+
+
+def note_miss():
+    record = _current.get()
+    if record is not None:
+        record["misses"] += 1
+
+
+def lookup(cached, *args, **kwargs):
+    # Call a memoized function whose body calls note_miss(); a call that did
+    # not note a miss was served from the cache
+    record = _current.get()
+    misses = record["misses"] if record is not None else 0
+    result = cached(*args, **kwargs)
+    if record is not None and record["misses"] == misses:
+        record["hits"] += 1
+    return result
+
+
+def start_alloc_tracking():
+    # Trace allocations for the rest of the process; tracemalloc is
+    # process-wide, so it is switched on once at startup and never per session
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def configure_json_log(target):
+    # One JSON object per finished section, to stderr ("-") or appended to a file
+    if logger.handlers:
+        return
+    handler = logging.StreamHandler() if target == "-" else logging.FileHandler(target)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def prometheus_text():
+    return METRICS.prometheus_text()
+
+
+def start_metrics_server(port, host="127.0.0.1"):
+    # Serve prometheus_text() on GET /metrics from a daemon thread
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = prometheus_text().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="aircrash-metrics", daemon=True).start()
+    return server
+
+
+def timed(name):
+    # Decorator form of section() for whole section functions
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with section(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
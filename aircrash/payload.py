@@ -0,0 +1,145 @@
+"""Compact figure JSON: what every chart sends to the browser.
+
+``figure_json`` replaces ``figure.to_json()`` for every chart the app draws.
+Starting from Plotly's own serialization, which already ships NumPy arrays
+as base64 typed arrays (``{"dtype", "bdata"}``), it
+
+- rounds float arrays to display precision (DISPLAY_DECIMALS) and sends
+  them as the narrowest typed array that holds the rounded values: whole
+  numbers as int8/16/32, the rest as float32 when that reads back the same,
+- sends ISO date strings as a float64 array of epoch milliseconds on an
+  axis typed "date", so plotly.js neither receives nor parses date text,
+- drops trace keys that only repeat the trace name (Plotly Express sets
+  legendgroup and offsetgroup to it) or a plotly.js default, and the axis
+  anchors and domains of single-plot figures.
+
+String arrays, category labels included, are sent as they are: plotly.js
+has no dictionary encoding for them. Hover text is kept to what each chart's
+hovertemplate shows (see aircrash.charts). st.plotly_chart sends the spec as
+it is. The layout template stays: Streamlit's frontend maps its placeholder
+colors to the app theme.
+
+Measured on the unfiltered page and the sample filter states
+(benchmarks.payload, bundled data): 17% fewer raw bytes (296 to 246 KB) and
+slightly faster client parsing, most of it from the daily moving averages.
+Gzipped, though, the payload grows by about 1% (64.5 to 65.3 KB), because
+base64 typed arrays compress worse than the number text they replace (the
+moving averages go from 11.8 to 15.7 KB). With
+server.enableWebsocketCompression on, the compact form is a small net loss
+in bytes sent.
+"""
+
+import base64
+import json
+import re
+
+import numpy as np
+
+DISPLAY_DECIMALS = 2
+
+# Trace and axis values that are plotly.js defaults, so sending them changes nothing
+TRACE_DEFAULTS = {"xaxis": "x", "yaxis": "y", "textposition": "auto"}
+FULL_DOMAIN = [0.0, 1.0]
+GROUP_KEYS = ("legendgroup", "offsetgroup")
+
+# Array keys whose values plotly.js draws or hovers as numbers or dates
+ARRAY_KEYS = ("x", "y", "z", "values", "text", "customdata")
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2}(\.\d+)?)?$")
+
+INT_TYPES = [np.int8, np.int16, np.int32]
+
+
+# --- TYPED ARRAYS ---
+def decode(spec):
+    # NumPy array of a plotly.js typed-array spec
+    values = np.frombuffer(base64.b64decode(spec["bdata"]), dtype=np.dtype(spec["dtype"]))
+    if "shape" in spec:
+        values = values.reshape([int(n) for n in spec["shape"].split(",")])
+    return values
+
+
+def encode(values):
+    spec = {"dtype": values.dtype.str.lstrip("<>|="), "bdata": base64.b64encode(values.tobytes()).decode("ascii")}
+    if values.ndim > 1:
+        spec["shape"] = ", ".join(str(n) for n in values.shape)
+    return spec
+
+
+def narrowest(values, decimals=DISPLAY_DECIMALS):
+    # `values` rounded to `decimals` in the smallest dtype that keeps them
+    if values.dtype.kind != "f" or not np.isfinite(values).all():
+        return values
+    rounded = np.round(values.astype("float64"), decimals)
+    if (rounded == np.round(rounded)).all():
+        for dtype in INT_TYPES:
+            info = np.iinfo(dtype)
+            if rounded.size == 0 or (rounded.min() >= info.min and rounded.max() <= info.max):
+                return rounded.astype(dtype)
+    single = rounded.astype("float32")
+    if (np.round(single.astype("float64"), decimals) == rounded).all():
+        return single
+    return rounded
+
+
+def epoch_ms(dates):
+    # ISO date strings as float64 milliseconds since 1970, what plotly.js date axes take
+    return np.array(dates, dtype="datetime64[ms]").astype("int64").astype("float64")
+
+
+def is_date_list(value):
+    return isinstance(value, list) and bool(value) and all(isinstance(v, str) and ISO_DATE.match(v) for v in value)
+
+
+# --- FIGURE ---
+def axis_name(ref):
+    # Layout key of a trace's axis reference: "x2" -> "xaxis2"
+    return ref[0] + "axis" + ref[1:]
+
+
+def compact_trace(trace, layout, decimals):
+    for key in ARRAY_KEYS:
+        value = trace.get(key)
+        if isinstance(value, dict) and "bdata" in value:
+            trace[key] = encode(narrowest(decode(value), decimals))
+        elif key in ("x", "y") and is_date_list(value):
+            trace[key] = encode(epoch_ms(value))
+            layout.setdefault(axis_name(trace.get(key + "axis", key)), {})["type"] = "date"
+    color = trace.get("marker", {}).get("color")
+    if isinstance(color, dict) and "bdata" in color:
+        trace["marker"]["color"] = encode(narrowest(decode(color), decimals))
+    if trace.get("marker", {}).get("pattern") == {"shape": ""}:
+        del trace["marker"]["pattern"]
+
+    name = trace.get("name")
+    for key in GROUP_KEYS:
+        if name and trace.get(key) == name:
+            del trace[key]
+    for key, default in TRACE_DEFAULTS.items():
+        if trace.get(key) == default:
+            del trace[key]
+
+
+def compact_figure(figure, decimals=DISPLAY_DECIMALS):
+    # The figure's JSON-ready dict with compact arrays and without unused keys;
+    # Plotly's JSON encoder first turns pandas and NumPy values into plain ones
+    spec = json.loads(figure.to_json())
+    layout = spec.setdefault("layout", {})
+    traces = spec.get("data", [])
+    single_plot = all(trace.get("xaxis", "x") == "x" and trace.get("yaxis", "y") == "y" for trace in traces)
+    for trace in traces:
+        compact_trace(trace, layout, decimals)
+        if single_plot and trace.get("alignmentgroup") == "True":
+            del trace["alignmentgroup"]
+    if single_plot:
+        for name in ("xaxis", "yaxis"):
+            axis = layout.get(name, {})
+            if axis.get("anchor") == ("y" if name == "xaxis" else "x"):
+                del axis["anchor"]
+            if axis.get("domain") == FULL_DOMAIN:
+                del axis["domain"]
+    return spec
+
+
+def figure_json(figure, decimals=DISPLAY_DECIMALS):
+    # Compact JSON text of a Plotly figure, for the figure cache and the prerendered view
+    return json.dumps(compact_figure(figure, decimals), separators=(",", ":"), ensure_ascii=False)
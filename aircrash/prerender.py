@@ -0,0 +1,242 @@
+"""Prerendered default view: the unfiltered ("All") page as a static snapshot.
+
+Most visitors only ever see the page as it first opens, with no filter set.
+Its overall KPIs, the figure JSON of every chart in its default state, the
+survival table and the Findings text are built once per data version and
+written next to the data (.cache/<name>.prerender.json). The app serves the
+page from there on first load, and builds the snapshot itself only when it
+is missing or was made for other data. Run it as a build step so the first
+visitor does not wait for it either::
+
+    python -m aircrash.prerender                  # rebuild if the data changed
+    python -m aircrash.prerender --force
+    python -m aircrash.prerender --backend duckdb --data other.csv
+
+The chart inputs of the unfiltered page are derived here, so the app and
+the snapshot draw the same figures from the same numbers.
+"""
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+from .aggregations import top_manufacturer_moving_average
+from .backends import BACKENDS, make_backend
+from .charts import (
+    MOVING_AVERAGE_WINDOWS,
+    continent_summary_figure,
+    country_survival_figure,
+    daily_summary_figure,
+    manufacturer_fatalities_figure,
+    quarter_summary_figure,
+    survivors_by_continent_figure,
+    top_countries_figure,
+    type_crashes_figure,
+    visible_moving_average,
+    yearly_summary_figure,
+    yearly_trend_figure,
+)
+from .data import DATA_PATH, UNKNOWN, cache_paths
+from .filters import ALL_STATE
+from .findings import findings_blocks
+from .frozen import freeze
+from .intervals import survival_intervals
+from .payload import figure_json
+
+# Bumped whenever the snapshot's layout or a chart changes, so snapshots
+# made by older code are rebuilt rather than served
+PRERENDER_FORMAT = 4
+
+# Controls of the page as it first opens
+DEFAULT_TOP = 5
+DEFAULT_WINDOW = next(iter(MOVING_AVERAGE_WINDOWS))
+DEFAULT_SURVIVAL_BY = "Country/Region"
+
+TOP_COUNTRIES = 10
+SURVIVAL_MEASURES = ["Survivors", "Fatalities (air)", "Aboard"]
+
+
+def prerender_path(path=DATA_PATH):
+    # Snapshot next to the Parquet sidecar of the CSV at `path`
+    return cache_paths(path)[1].with_suffix(".prerender.json")
+
+
+# --- CHART INPUTS ---
+def yearly_crashes(yearly):
+    # Crashes per year from the backend's "Year" roll-up
+    return yearly[["Year", "Crashes"]].rename(columns={"Crashes": "Crash_Count"})
+
+
+def yearly_totals(yearly):
+    return yearly.rename(
+        columns={"Crashes": "Crash_Count", "Fatalities (air)": "Total_Fatalities"}
+    )[["Year", "Crash_Count", "Total_Fatalities"]]
+
+
+def top_countries(backend, n=TOP_COUNTRIES):
+    # Group by country
+    country_crashes = backend.rollup("Country/Region")[["Country/Region", "Crashes"]].rename(
+        columns={"Crashes": "Crash_Count"}
+    )
+    # Sort descending
+    country_crashes = country_crashes.sort_values(by="Crash_Count", ascending=False)
+    return country_crashes.head(n)
+
+
+def survival_by_group(backend, state, by, workers=None):
+    # Survival rate per value of `by` with its Wilson and bootstrap 95% intervals
+    cells = backend.cells(state, [by] + SURVIVAL_MEASURES)
+    return freeze(survival_intervals(cells, by, workers=workers))
+
+
+# --- FINDINGS ---
+def table(frame, columns):
+    # Rows of `columns` as tuples of plain Python values
+    return list(zip(*(frame[column].tolist() for column in columns)))
+
+
+def moving_average_peaks(moving_average):
+    # (manufacturer, highest moving average, ISO date of it) per leader
+    daily = moving_average["daily"]
+    peaks = daily.groupby("Aircraft Manufacturer", observed=True)["Moving_Avg"].idxmax()
+    return [
+        (name, float(daily.at[peaks[name], "Moving_Avg"]), daily.at[peaks[name], "Date"].date().isoformat())
+        for name in moving_average["leaders"]
+        if name in peaks.index
+    ]
+
+
+def findings_facts(aggregates, yearly, countries, moving_average, survival):
+    # The tables aircrash.findings writes the Findings from, taken from the
+    # cached results the unfiltered page is drawn with
+    continents = aggregates["continent_summary"]
+    survivors = aggregates["survivors_by_continent"]
+    return {
+        "totals": {measure: int(value) for measure, value in aggregates["totals"].items()},
+        "yearly": table(yearly, ["Year", "Crashes", "Fatalities (air)"]),
+        "manufacturers": table(aggregates["manufacturer_fatalities"], ["Aircraft Manufacturer", "Fatalities (air)"]),
+        "continents": table(
+            continents[continents["Continent"] != UNKNOWN], ["Continent", "Crash_Count", "Total_Fatalities"]
+        ),
+        "countries": table(countries, ["Country/Region", "Crash_Count"]),
+        "aircraft": table(aggregates["type_crashes"], ["Aircraft", "Crash_Count"]),
+        "quarters": table(aggregates["quarter_summary"], ["Quarter", "Fatalities", "Survivors"]),
+        "survivor_shares": table(survivors[survivors["Continent"] != UNKNOWN], ["Continent", "Survivors"]),
+        "window": MOVING_AVERAGE_WINDOWS[DEFAULT_WINDOW],
+        "peaks": moving_average_peaks(moving_average),
+        "survival": table(
+            survival, [DEFAULT_SURVIVAL_BY, "Survivors", "Aboard", "Survival_Rate", "Bootstrap_Low", "Bootstrap_High"]
+        ),
+    }
+
+
+# --- SNAPSHOT ---
+def default_figures(aggregates, yearly, countries, moving_average, date_range):
+    # Every chart of the unfiltered page, in page order
+    return {
+        "yearly_trend": yearly_trend_figure(yearly_crashes(yearly)),
+        "yearly_summary": yearly_summary_figure(yearly_totals(yearly)),
+        "manufacturer_fatalities": manufacturer_fatalities_figure(aggregates["manufacturer_fatalities"]),
+        "top_countries": top_countries_figure(countries),
+        "continent_summary": continent_summary_figure(aggregates["continent_summary"]),
+        "type_crashes": type_crashes_figure(aggregates["type_crashes"]),
+        "quarter_summary": quarter_summary_figure(aggregates["quarter_summary"]),
+        "survivors_by_continent": survivors_by_continent_figure(aggregates["survivors_by_continent"]),
+        "daily_summary": daily_summary_figure(
+            *visible_moving_average(moving_average, *date_range), DEFAULT_WINDOW
+        ),
+        "country_survival": country_survival_figure(aggregates["country_survival"]),
+    }
+
+
+def build_default_view(backend, workers=None):
+    # Everything the unfiltered page shows, as plain JSON-ready values
+    aggregates = backend.aggregates(ALL_STATE)
+    yearly = backend.rollup("Year")
+    countries = top_countries(backend)
+    moving_average = top_manufacturer_moving_average(aggregates, DEFAULT_TOP, DEFAULT_WINDOW)
+    survival = survival_by_group(backend, ALL_STATE, DEFAULT_SURVIVAL_BY, workers)
+
+    figures = default_figures(aggregates, yearly, countries, moving_average, backend.date_range())
+    return {
+        "format": PRERENDER_FORMAT,
+        "version": list(backend.version),
+        "rows": int(aggregates["rows"]),
+        "totals": {measure: int(value) for measure, value in aggregates["totals"].items()},
+        "figures": {chart_id: figure_json(figure) for chart_id, figure in figures.items()},
+        "survival": {column: survival[column].tolist() for column in survival.columns},
+        "findings": findings_blocks(findings_facts(aggregates, yearly, countries, moving_average, survival)),
+    }
+
+
+def load_default_view(version, path=DATA_PATH):
+    # The snapshot on disk when it was made for data `version`, else None
+    try:
+        view = json.loads(prerender_path(path).read_text())
+    except (OSError, ValueError):
+        return None
+    if view.get("format") != PRERENDER_FORMAT or view.get("version") != list(version):
+        return None
+    return view
+
+
+def write_default_view(view, path=DATA_PATH):
+    target = prerender_path(path)
+    try:
+        target.parent.mkdir(exist_ok=True)
+        tmp_path = target.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(view))
+        tmp_path.replace(target)
+    except OSError:
+        # A read-only checkout still works, it just prerenders each start
+        return False
+    return True
+
+
+def load_or_build(backend, path=DATA_PATH, workers=None):
+    # The default view of the backend's current data, rebuilt and written
+    # only when the snapshot on disk is missing or made for other data
+    view = load_default_view(backend.version, path)
+    if view is None:
+        view = build_default_view(backend, workers)
+        write_default_view(view, path)
+    return view
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prerender the unfiltered dashboard for the current data.")
+    parser.add_argument("--data", type=Path, default=DATA_PATH, help="crash CSV (default: %(default)s)")
+    parser.add_argument(
+        "--backend", choices=BACKENDS, default=os.environ.get("AIRCRASH_BACKEND", "pandas"),
+        help="backend the app runs on; the snapshot is keyed by its data version",
+    )
+    parser.add_argument("--force", action="store_true", help="rebuild even when the snapshot is current")
+    args = parser.parse_args(argv)
+
+    # The app draws with Streamlit's Plotly template, so the snapshot must too.
+    # The template comes from a private Streamlit module that an upgrade may
+    # move; without it the snapshot would be drawn with the plain Plotly
+    # template, so any snapshot is cleared instead and the app prerenders on
+    # its first load, where Streamlit has set its template.
+    target = prerender_path(args.data)
+    try:
+        from streamlit.elements.lib.streamlit_plotly_theme import configure_streamlit_plotly_theme
+    except ImportError:
+        target.unlink(missing_ok=True)
+        print(f"Streamlit's Plotly template is not importable; cleared {target}; the app will prerender on first load")
+        return
+    configure_streamlit_plotly_theme()
+    started = time.perf_counter()
+    backend = make_backend(args.backend, args.data)
+    if not args.force and load_default_view(backend.version, args.data) is not None:
+        print(f"{target} is up to date")
+        return
+    if not write_default_view(build_default_view(backend), args.data):
+        raise SystemExit(f"could not write {target}")
+    print(f"wrote {target} ({target.stat().st_size / 1024:.0f} KB) in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Type-ahead search over aircraft types and manufacturers.
+
+Names are normalized (case, accents and punctuation folded, letters split
+from digits, so "F27", "F-27" and "F 27" are all "f 27") and indexed twice:
+a sorted token list answers prefix queries with a binary search, and
+trigram posting lists give every name a similarity to the query that
+survives typos. Names whose tokens start with every query token rank first,
+then by trigram similarity, then by crash count::
+
+    index = build_search_index([("Aircraft", "Fokker F 27 Friendship", 12), ...])
+    search(index, "fokker f27")   # [("Aircraft", "Fokker F 27 Friendship"), ...]
+"""
+
+import bisect
+import re
+import unicodedata
+
+import numpy as np
+
+from .frozen import freeze
+
+# Names below this trigram similarity only match on prefixes
+MIN_SIMILARITY = 0.3
+DEFAULT_LIMIT = 10
+
+LETTER_DIGIT = re.compile(r"(?<=[^\W\d_])(?=\d)|(?<=\d)(?=[^\W\d_])")
+NON_ALNUM = re.compile(r"[\W_]+")
+
+
+def normalize(text):
+    # Lower-case ASCII-folded words separated by single spaces
+    text = unicodedata.normalize("NFKD", str(text))
+    text = "".join(c for c in text if not unicodedata.combining(c)).casefold()
+    return " ".join(NON_ALNUM.sub(" ", LETTER_DIGIT.sub(" ", text)).split())
+
+
+def trigrams(name):
+    # Distinct trigrams of a normalized name, padded so word starts weigh more
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def build_search_index(entries):
+    # Index over (column, value, crashes) entries: the entries in order, their
+    # crash counts, the trigram count of each name and a posting list of entry
+    # ids per trigram and per distinct token
+    entries = list(entries)
+    names = [normalize(value) for _, value, _ in entries]
+    grams, tokens = {}, {}
+    gram_counts = np.zeros(len(entries), dtype=np.int32)
+    for i, name in enumerate(names):
+        name_grams = trigrams(name)
+        gram_counts[i] = len(name_grams)
+        for gram in name_grams:
+            grams.setdefault(gram, []).append(i)
+        for token in set(name.split()):
+            tokens.setdefault(token, []).append(i)
+    sorted_tokens = sorted(tokens)
+    return freeze({
+        "entries": [(column, value) for column, value, _ in entries],
+        "crashes": np.array([crashes for _, _, crashes in entries], dtype=np.int64),
+        "gram_counts": gram_counts,
+        "grams": {gram: np.array(ids, dtype=np.int32) for gram, ids in grams.items()},
+        "tokens": sorted_tokens,
+        "token_entries": [np.array(tokens[token], dtype=np.int32) for token in sorted_tokens],
+    })
+
+
+def prefix_entries(index, prefix):
+    # Ids of the entries with a token starting with `prefix`
+    tokens = index["tokens"]
+    lo = bisect.bisect_left(tokens, prefix)
+    hi = bisect.bisect_left(tokens, prefix + "\uffff", lo)
+    if lo == hi:
+        return np.empty(0, dtype=np.int32)
+    return np.unique(np.concatenate(index["token_entries"][lo:hi]))
+
+
+def search(index, query, limit=DEFAULT_LIMIT):
+    # The best `limit` (column, value) entries for `query`, best first
+    query = normalize(query)
+    size = len(index["entries"])
+    if not query or not size:
+        return []
+
+    # How many query tokens each entry has a token starting with
+    words = query.split()
+    prefixed = np.zeros(size, dtype=np.int32)
+    for word in words:
+        prefixed[prefix_entries(index, word)] += 1
+    complete = prefixed == len(words)
+
+    # Jaccard similarity of trigram sets, from the shared trigram counts
+    query_grams = [gram for gram in trigrams(query) if gram in index["grams"]]
+    shared = np.zeros(size, dtype=np.int64)
+    if query_grams:
+        shared = np.bincount(np.concatenate([index["grams"][gram] for gram in query_grams]), minlength=size)
+    similarity = shared / (len(trigrams(query)) + index["gram_counts"] - shared)
+
+    candidates = np.flatnonzero(complete | (similarity >= MIN_SIMILARITY))
+    order = np.lexsort((
+        -index["crashes"][candidates],
+        -similarity[candidates],
+        -prefixed[candidates],
+        ~complete[candidates],
+    ))
+    return [index["entries"][i] for i in candidates[order[:limit]]]
@@ -0,0 +1,202 @@
+"""Process-wide crash data that follows rows appended to the source CSV."""
+
+import io
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .aggregations import (
+    CUBE_DIMENSIONS,
+    CUBE_MEASURES,
+    MANUFACTURER_DAY_DIMENSIONS,
+    append_cells,
+    build_crash_cube,
+    build_day_totals,
+    build_manufacturer_days,
+    crash_records,
+    has_crash_records,
+)
+from .data import (
+    DATA_PATH,
+    align_categories,
+    current_fingerprint,
+    iso_lookup,
+    load_dataset,
+    read_csv_typed,
+    unresolved_countries,
+)
+from .filters import DATE_COLUMN, INDEXED_COLUMNS, STATE_COLUMNS, build_filter_index, extend_filter_index, selection_mask
+from .frozen import freeze
+from .ingest import DEFAULT_CHUNKSIZE, stream_aggregates
+
+# Bytes just before the consumed offset that must be unchanged for new bytes
+# to count as an append rather than a rewrite
+GUARD_BYTES = 4096
+# Filter states whose revision is remembered per snapshot
+REVISION_MEMO_SIZE = 4096
+
+
+def touched_cells(rows, revision):
+    # The distinct filter values of appended rows, tagged with the revision
+    # that added them
+    touched = rows[STATE_COLUMNS].astype(dict.fromkeys(INDEXED_COLUMNS, object)).drop_duplicates()
+    return touched.assign(Revision=revision)
+
+
+def state_revision(snapshot, state):
+    # Revision of the last append with rows inside `state`; 0 when no
+    # appended row matches it, so its cached results are still current
+    touched = snapshot["touched"]
+    if not len(touched):
+        return 0
+    matched = touched["Revision"].to_numpy()[selection_mask(touched, dict(zip(STATE_COLUMNS, state)))]
+    return int(matched.max()) if len(matched) else 0
+
+
+def country_codes(cube):
+    # ISO-3 lookup for every country in the cube, and the names it cannot place
+    countries = cube["Country/Region"].cat.categories
+    return {"country_iso": iso_lookup(countries), "unresolved_countries": unresolved_countries(countries)}
+
+
+class DataStore:
+    # The current snapshot (crash records, or the daily tables when
+    # streaming, cube, filter indexes and versions) for one source file.
+    # Snapshots are frozen (aircrash.frozen) and shared by every session:
+    # refresh() builds a new one from the appended rows and swaps it in, so
+    # readers always see a consistent set.
+
+    def __init__(self, path=DATA_PATH, mode="memory", chunksize=DEFAULT_CHUNKSIZE):
+        self.path = Path(path)
+        self.mode = mode
+        self.chunksize = chunksize
+        self._lock = threading.Lock()
+        self._snapshot = self._load()
+        self._revision_memo = {}
+
+    @property
+    def snapshot(self):
+        return self._snapshot
+
+    def _load(self):
+        while True:
+            stat = self.path.stat()
+            if self.mode == "stream":
+                state = stream_aggregates(self.path, self.chunksize)
+                cube = state["cube"]
+                # No crash records: the daily tables stand in for them
+                tables = {
+                    "days": state["days"],
+                    "manufacturer_days": state["manufacturer_days"],
+                    "manufacturer_day_index": build_filter_index(state["manufacturer_days"]),
+                }
+                version = current_fingerprint(self.path)["sha256"]
+            else:
+                frame = load_dataset(self.path)
+                records = crash_records(frame)
+                cube = build_crash_cube(records)
+                tables = {"crashes": records, "crash_index": build_filter_index(records)}
+                version = frame.attrs["sha256"]
+            # Rows written while loading would be counted again as an append
+            after = self.path.stat()
+            if (after.st_size, after.st_mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                break
+        return freeze({
+            **tables,
+            "cube": cube,
+            "cube_index": build_filter_index(cube),
+            **country_codes(cube),
+            "version": version,
+            # Bumped per append; states untouched by an append keep their revision
+            "revision": 0,
+            "touched": touched_cells(read_csv_typed(self.path, nrows=0).astype({DATE_COLUMN: "datetime64[ns]"}), 0),
+            "columns": list(pd.read_csv(self.path, nrows=0).columns),
+            "offset": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "guard": self._read_bytes(max(stat.st_size - GUARD_BYTES, 0), stat.st_size),
+        })
+
+    def _read_bytes(self, start, end):
+        with open(self.path, "rb") as fh:
+            fh.seek(start)
+            return fh.read(end - start)
+
+    def state_revision(self, state):
+        # state_revision() for the current snapshot, remembered per state
+        # because every section asks for it on every rerun
+        snapshot = self.snapshot
+        key = (snapshot["version"], snapshot["revision"], tuple(state))
+        revision = self._revision_memo.get(key)
+        if revision is None:
+            if len(self._revision_memo) >= REVISION_MEMO_SIZE:
+                self._revision_memo.clear()
+            revision = self._revision_memo[key] = state_revision(snapshot, state)
+        return revision
+
+    def refresh(self):
+        # Fold rows appended to the source since the last look into a new
+        # snapshot, or reload if the file was rewritten; True when data changed
+        with self._lock:
+            snapshot = self._snapshot
+            stat = self.path.stat()
+            if (stat.st_size, stat.st_mtime_ns) == (snapshot["offset"], snapshot["mtime_ns"]):
+                return False
+
+            guard_start = snapshot["offset"] - len(snapshot["guard"])
+            if stat.st_size < snapshot["offset"] or self._read_bytes(guard_start, snapshot["offset"]) != snapshot["guard"]:
+                self._snapshot = self._load()
+                return True
+
+            appended = self._read_bytes(snapshot["offset"], stat.st_size)
+            # A writer may be mid-line; leave any unterminated row for next time
+            appended = appended[: appended.rfind(b"\n") + 1]
+            if not appended.strip():
+                return False
+            self._snapshot = self._append(snapshot, appended, stat)
+            return True
+
+    def _append(self, snapshot, appended, stat):
+        rows = read_csv_typed(io.BytesIO(appended), header=None, names=snapshot["columns"])
+        added = crash_records(rows)
+        if has_crash_records(snapshot):
+            # Appended records go at the end
+            records = pd.concat(align_categories(snapshot["crashes"], added), ignore_index=True)
+            new_records = np.arange(len(snapshot["crashes"]), len(records), dtype=np.int32)
+            tables = {
+                "crashes": records,
+                "crash_index": extend_filter_index(snapshot["crash_index"], records, new_records),
+            }
+        else:
+            days, _ = append_cells(snapshot["days"], build_day_totals(added), [DATE_COLUMN], CUBE_MEASURES)
+            manufacturer_days, new_days = append_cells(
+                snapshot["manufacturer_days"], build_manufacturer_days(added), MANUFACTURER_DAY_DIMENSIONS, ["Survivors"]
+            )
+            tables = {
+                "days": days,
+                "manufacturer_days": manufacturer_days,
+                "manufacturer_day_index": extend_filter_index(
+                    snapshot["manufacturer_day_index"], manufacturer_days, new_days
+                ),
+            }
+        cube, new_cells = append_cells(snapshot["cube"], build_crash_cube(added), CUBE_DIMENSIONS, CUBE_MEASURES)
+
+        revision = snapshot["revision"] + 1
+        touched = pd.concat([snapshot["touched"], touched_cells(rows, revision)], ignore_index=True)
+
+        offset = snapshot["offset"] + len(appended)
+        guard = (snapshot["guard"] + appended)[-GUARD_BYTES:]
+        return freeze({
+            **snapshot,
+            **tables,
+            "cube": cube,
+            "cube_index": extend_filter_index(snapshot["cube_index"], cube, new_cells),
+            **country_codes(cube),
+            "revision": revision,
+            "touched": touched.drop_duplicates(STATE_COLUMNS, keep="last", ignore_index=True),
+            "offset": offset,
+            # Only the consumed bytes are known: an unterminated row keeps the file "changed"
+            "mtime_ns": stat.st_mtime_ns if offset == stat.st_size else None,
+            "guard": guard,
+        })
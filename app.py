@@ -1,10 +1,38 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import streamlit as st
 
 import pandas as pd
 
-import plotly.express as px
+from aircrash import metrics
+
+from aircrash.aggregations import top_manufacturer_moving_average
+
+from aircrash.backends import make_backend
+
+from aircrash.charts import (
+    FIGURE_CACHE_BUDGET,
+    MOVING_AVERAGE_WINDOWS,
+    SECTION_CHARTS,
+    FigureCache,
+    daily_summary_figure,
+    visible_moving_average,
+)
+
+from aircrash.data import DATA_PATH
+
+from aircrash.filters import ALL_STATE, DATE_FILTER, FILTERS, SEARCH_COLUMNS, STATE_COLUMNS
+
+from aircrash.frozen import freeze
+
+from aircrash.ingest import DEFAULT_CHUNKSIZE
 
-import plotly.graph_objects as go
+from aircrash.prerender import DEFAULT_SURVIVAL_BY, DEFAULT_TOP, DEFAULT_WINDOW, load_or_build, survival_by_group
+
+from aircrash.search import build_search_index, search
 
 #--Page configuration---
 st.set_page_config(
@@ -22,11 +50,155 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-def load_data():
-    df = pd.read_csv("cleaned_aircrashes_2024.csv")
-    return df
+# --- DATA LOADING ---
+# "pandas" answers from crash cubes held in memory, "duckdb" runs SQL over
+# the file itself for data larger than RAM (see aircrash.backends)
+BACKEND = os.environ.get("AIRCRASH_BACKEND", "pandas")
+# With pandas, "memory" loads every row; "stream" aggregates the CSV in
+# chunks and keeps only the cube and daily tables resident, which leaves out
+# the date-range filter (see aircrash.ingest)
+INGEST_MODE = os.environ.get("AIRCRASH_INGEST", "memory")
+INGEST_CHUNKSIZE = int(os.environ.get("AIRCRASH_CHUNKSIZE", DEFAULT_CHUNKSIZE))
+# How often open pages look for rows appended to the CSV (0 turns it off)
+REFRESH_SECONDS = float(os.environ.get("AIRCRASH_REFRESH_SECONDS", 5))
+
+# --- INSTRUMENTATION ---
+# Every section is timed into process-wide histograms (aircrash.metrics).
+# AIRCRASH_METRICS_LOG ("-" for stderr, or a file) writes one JSON line per
+# section, AIRCRASH_METRICS_PORT serves Prometheus text on /metrics, and
+# ?debug=1 (or AIRCRASH_DEBUG=1) opens the timings panel in the sidebar.
+# AIRCRASH_TRACK_ALLOC=1 also measures allocations with tracemalloc, for the
+# whole process (it slows every section down).
+METRICS_LOG = os.environ.get("AIRCRASH_METRICS_LOG")
+METRICS_PORT = int(os.environ.get("AIRCRASH_METRICS_PORT", 0))
+DEBUG_PANEL = os.environ.get("AIRCRASH_DEBUG") == "1" or st.query_params.get("debug") == "1"
+TRACK_ALLOC = os.environ.get("AIRCRASH_TRACK_ALLOC") == "1"
+
+
+@st.cache_resource(show_spinner=False)
+def start_metrics_exporters():
+    if METRICS_LOG:
+        metrics.configure_json_log(METRICS_LOG)
+    if TRACK_ALLOC:
+        metrics.start_alloc_tracking()
+    if METRICS_PORT:
+        return metrics.start_metrics_server(METRICS_PORT)
+
+
+start_metrics_exporters()
+
+
+@st.cache_resource(show_spinner=False)
+def get_backend():
+    # The query backend over the crash data, shared by every session
+    metrics.note_miss()
+    return make_backend(BACKEND, DATA_PATH, INGEST_MODE, INGEST_CHUNKSIZE)
+
+
+# --- AGGREGATION ENGINE ---
+# Results are frozen (aircrash.frozen) and cached as resources, so every
+# session reads the same objects instead of unpickling a private copy of
+# each one; the memory a session adds stays the same whatever the data size
+AGGREGATE_CACHE_SIZE = 256
+
+
+@st.cache_resource(max_entries=AGGREGATE_CACHE_SIZE, show_spinner=False)
+def section_aggregates(year, country, continent, quarter, aircraft, manufacturer, dates, token=None):
+    # Data for every filter-dependent section, memoized per filter state in a
+    # bounded LRU shared by all sessions. `token` (the backend's cache token)
+    # only changes when new data touches this state.
+    metrics.note_miss()
+    return get_backend().aggregates((year, country, continent, quarter, aircraft, manufacturer, dates))
+
+
+@st.cache_resource(max_entries=AGGREGATE_CACHE_SIZE, show_spinner=False)
+def date_span(year, country, continent, quarter, aircraft, manufacturer, token=None):
+    # First and last crash date under every filter but the date range, the
+    # span the date slider offers; None when no crash matches
+    selections = dict(zip(STATE_COLUMNS, (year, country, continent, quarter, aircraft, manufacturer)))
+    return get_backend().date_range(selections)
+
+
+# --- SEARCH INDEX ---
+SEARCH_RESULTS = 10
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_search_index(version):
+    # Aircraft and manufacturer names ranked by crash count, rebuilt only
+    # when the data version changes
+    metrics.note_miss()
+    entries = []
+    for column in SEARCH_COLUMNS:
+        totals = get_backend().rollup(column)
+        entries += [(column, value, crashes) for value, crashes in zip(totals[column], totals["Crashes"])]
+    return build_search_index(entries)
+
+
+# --- FIGURE CACHE ---
+# Threads that build the filtered charts side by side (see prefetch_charts);
+# 1 builds each chart in turn as its section renders
+FIGURE_WORKERS = int(os.environ.get("AIRCRASH_FIGURE_WORKERS", min(4, os.cpu_count() or 1)))
+
+
+@st.cache_resource(show_spinner=False)
+def get_figure_cache():
+    return FigureCache(FIGURE_CACHE_BUDGET)
+
+
+@st.cache_resource(show_spinner=False)
+def get_figure_pool():
+    # Bounded pool shared by every session; None when figures build inline
+    if FIGURE_WORKERS > 1:
+        return ThreadPoolExecutor(FIGURE_WORKERS, thread_name_prefix="figures")
+
+
+# --- ROLLING STATISTICS ---
+@st.cache_resource(max_entries=AGGREGATE_CACHE_SIZE, show_spinner=False)
+def manufacturer_moving_average(year, country, continent, quarter, aircraft, manufacturer, dates, token, top, window):
+    # Daily survivors and their moving average for the `top` manufacturers
+    # with the most survivors under the given filters
+    metrics.note_miss()
+    aggregates = metrics.lookup(
+        section_aggregates, year, country, continent, quarter, aircraft, manufacturer, dates, token
+    )
+    return top_manufacturer_moving_average(aggregates, top, window)
+
+
+# --- SURVIVAL INTERVALS ---
+# Groups the survival table can rank, as (label, column)
+SURVIVAL_GROUPS = [("Country", "Country/Region"), ("Continent", "Continent"), ("Manufacturer", "Aircraft Manufacturer")]
+# Processes the bootstrap shards run on; 1 keeps them in the server process
+BOOTSTRAP_WORKERS = int(os.environ.get("AIRCRASH_BOOTSTRAP_WORKERS", os.cpu_count() or 1))
+
+
+@st.cache_resource(max_entries=AGGREGATE_CACHE_SIZE, show_spinner=False)
+def survival_table(year, country, continent, quarter, aircraft, manufacturer, dates, token, by):
+    # Survival rate per value of `by` with its Wilson and bootstrap 95%
+    # intervals, memoized per filter state like the section aggregates
+    metrics.note_miss()
+    return survival_by_group(
+        get_backend(), (year, country, continent, quarter, aircraft, manufacturer, dates), by, BOOTSTRAP_WORKERS
+    )
+
 
-df = load_data()
+# --- PRERENDERED DEFAULT VIEW ---
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_default_view(version):
+    # The unfiltered page (KPIs, figure JSON, survival table and findings)
+    # read from its snapshot next to the data, which is only rebuilt when the
+    # data version changed since it was written (aircrash.prerender)
+    metrics.note_miss()
+    view = load_or_build(get_backend(), DATA_PATH, BOOTSTRAP_WORKERS)
+    return freeze({**view, "survival": pd.DataFrame(view["survival"])})
+
+
+with metrics.section("load"):
+    backend = metrics.lookup(get_backend)
+    first_crash, last_crash = backend.date_range()
+    default_view = metrics.lookup(get_default_view, backend.version)
+figure_cache = get_figure_cache()
+figure_pool = get_figure_pool()
 
 # --- HEADER ---
 st.title("✈️ Global Aircrash Analysis Dashboard (1908 – 2024)")
@@ -40,63 +212,180 @@ st.sidebar.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# --- LIVE DATA ---
+@st.fragment(run_every=REFRESH_SECONDS or None)
+@metrics.timed("refresh")
+def watch_for_new_rows():
+    # Fold rows appended to the CSV into the shared backend; every session
+    # reruns once per new revision, and only the cache entries for filter
+    # states those rows touch are recomputed
+    backend.refresh()
+    token = backend.version
+    seen = st.session_state.setdefault("data_token", token)
+    if token != seen:
+        st.session_state["data_token"] = token
+        st.rerun()
+
+
+watch_for_new_rows()
+
 # --- SIDEBAR FILTERS ---
 st.sidebar.header("🔎 Filter Crashes")
-# --- Year Dropdown ---
-year = st.sidebar.selectbox(
-    "Select Year:",
-    options= ["All"] + sorted(df["Year"].dropna().unique())
-)
-# --- Country Dropdown ---
-country = st.sidebar.selectbox(
-    "Select Country:",
-    options= ["All"] + sorted(df["Country/Region"].dropna().unique())
-)
-# --- Continent Dropdown ---
-continent = st.sidebar.selectbox(
-    "Select Continent:",
-    options= ["All"] + sorted(df["Continent"].dropna().unique())
-)
-# --- Quarter Dropdown ---
-quarter = st.sidebar.selectbox(
-    "Select Quarter:",
-    options= ["All"] + sorted(df["Quarter"].dropna().unique())
-)
-# --- APPLY FILTERS ---
-filtered_df = df[
-    (df["Country/Region"] == country) &
-    (df["Year"] == year) &
-    (df["Quarter"] == quarter) &
-    (df["Continent"] == continent)
+
+# Sections that depend on the filters run as keyed fragments: a filter change
+# reruns only these, while everything built from the full dataset (and the
+# Findings) keeps what it rendered on the last full run
+FILTERED_SECTIONS = [
+    "filters",
+    "filtered_kpis",
+    "manufacturer_fatalities",
+    "continent_summary",
+    "type_crashes",
+    "quarter_summary",
+    "survivors_by_continent",
+    "daily_summary",
+    "country_survival",
 ]
 
+
+def is_unfiltered(state):
+    # True for the state of the page as it first opens, which the prerendered
+    # default view already holds
+    return state[:len(ALL_STATE)] == ALL_STATE
+
+
+def clamp_dates(value, span):
+    # A (start, end) date range cut to `span`, or all of `span` when the two
+    # do not overlap
+    start, end = max(value[0], span[0]), min(value[1], span[1])
+    return (start, end) if start <= end else span
+
+
+def slider_span(state):
+    # The date slider's span for the column filters of `state`: the crashes
+    # they leave, or all the data when they leave none
+    columns = state[:len(STATE_COLUMNS) - 1]
+    return date_span(*columns, backend.cache_token(columns + ("All",))) or (first_crash, last_crash)
+
+
+def current_filter_state():
+    # (years, countries, continents, quarters, aircraft, manufacturers, dates)
+    # as currently selected in the sidebar, followed by the backend's cache
+    # token for it. Empty selections are "All", and so is a date range
+    # spanning every crash the other filters leave, so they share the
+    # unfiltered cache entries; values are sorted so the order they were
+    # picked in does not matter. The search result picked, if any, narrows
+    # its own column to that one value.
+    state = [tuple(sorted(st.session_state.get(key) or ())) or "All" for key, _, _ in FILTERS]
+    picked = st.session_state.get("search_pick")
+    state += [(picked[1],) if picked and picked[0] == column else "All" for column in SEARCH_COLUMNS]
+    if not backend.filters_dates:
+        state = tuple(state) + ("All",)
+        return state + (backend.cache_token(state),)
+    span = slider_span(tuple(state))
+    start, end = clamp_dates(st.session_state.get(DATE_FILTER[0], span), span)
+    start = None if start <= span[0] else start.isoformat()
+    end = None if end >= span[1] else end.isoformat()
+    state.append("All" if start is None and end is None else (start, end))
+    state = tuple(state)
+    return state + (backend.cache_token(state),)
+
+
+# --- RENDER PIPELINE ---
+# Figure cache keys hold the chart id, the data version and the chart's inputs
+data_version = backend.version[0]
+
+
+def chart_key(chart_id, inputs):
+    return (chart_id, data_version) + tuple(inputs)
+
+
+def prefetch_charts():
+    # Start building every filtered chart of the current state on the figure
+    # pool before the sections render, so the figures build side by side
+    # while each section waits for its own in page order. Inputs are looked
+    # up here, on the script thread; the pool only builds and serializes
+    # figures and never calls Streamlit.
+    state = current_filter_state()
+    if figure_pool is None or is_unfiltered(state):
+        return
+    aggregates = metrics.lookup(section_aggregates, *state)
+    if not aggregates["rows"]:
+        return
+    for chart_id, build in SECTION_CHARTS.items():
+        figure_cache.prefetch(chart_key(chart_id, state), partial(build, aggregates[chart_id]), figure_pool)
+    # The moving average with its controls as last set
+    top = st.session_state.get("ma_top", DEFAULT_TOP)
+    window = st.session_state.get("ma_window", DEFAULT_WINDOW)
+    start, end = st.session_state.get("ma_range", (first_crash, last_crash))
+    moving_average = metrics.lookup(manufacturer_moving_average, *state, top, window)
+    figure_cache.prefetch(chart_key("daily_summary", state + (top, window, start, end)), lambda: daily_summary_figure(
+        *visible_moving_average(moving_average, start, end), window
+    ), figure_pool)
+
+
+def rerun_filtered_sections():
+    prefetch_charts()
+    st.rerun(FILTERED_SECTIONS)
+
+
+@st.fragment(key="filters")
+@metrics.timed("filters")
+def sidebar_filters():
+    # Current selections drive the cascading options of every multi-select
+    selections = dict(zip(STATE_COLUMNS, current_filter_state()))
+    # --- Aircraft / Manufacturer Search ---
+    query = st.sidebar.text_input(
+        "Search Aircraft or Manufacturer:", key="search", placeholder="e.g. Fokker F27, Antonov An-24"
+    )
+    matches = search(get_search_index(backend.version), query, SEARCH_RESULTS) if query else []
+    picked = st.session_state.get("search_pick")
+    # Keep the result picked earlier while the query changes
+    options = [None] + matches + ([picked] if picked and picked not in matches else [])
+    st.sidebar.selectbox(
+        "Search Results:", options=options, key="search_pick", on_change=rerun_filtered_sections,
+        format_func=lambda match: "All" if match is None else f"{match[1]} ({match[0]})",
+    )
+    # --- Year / Country / Continent / Quarter Multi-selects (empty means All) ---
+    for key, column, label in FILTERS:
+        options = backend.options(selections, column)
+        current = () if selections[column] == "All" else selections[column]
+        # Keep selections that no longer have data visible instead of dropping them
+        options = sorted(set(options).union(current))
+        st.sidebar.multiselect(
+            label, options=options, key=key, placeholder="All", on_change=rerun_filtered_sections
+        )
+    # --- Date Range ---
+    # Spans the crashes the other filters leave; a range set earlier is cut to it
+    key, _, label = DATE_FILTER
+    if not backend.filters_dates:
+        st.sidebar.caption(f"{label} not available: streaming ingestion keeps daily totals, not crash dates.")
+        return
+    low, high = slider_span(tuple(selections.values()))
+    if low == high:
+        st.sidebar.caption(f"{label} {low:%Y-%m-%d}, the only crash date left")
+        return
+    st.session_state[key] = clamp_dates(st.session_state.get(key, (low, high)), (low, high))
+    st.sidebar.slider(label, min_value=low, max_value=high, key=key, on_change=rerun_filtered_sections)
+
+
+sidebar_filters()
+prefetch_charts()
+
 # KPI section
 # --- KPI SECTION (Overall and Filtered) ---
 
 
 # --- Overall totals ---
-total_aboard_all = int(df["Aboard"].sum())
-total_fatalities_all = int(df["Fatalities (air)"].sum())
-ground_fatalities_all = int(df["Ground"].sum())
-total_crashes_all = len(df)
-survivors_all = int(df["Survivors"].sum())
-
-# --- Filtered totals ---
-filtered_df = df.copy()
-if country != "All":
-    filtered_df = filtered_df[filtered_df["Country/Region"] == country]
-if year != "All":
-    filtered_df = filtered_df[filtered_df["Year"] == year]
-if quarter != "All":
-    filtered_df = filtered_df[filtered_df["Quarter"] == quarter]
-if continent != "All":
-    filtered_df = filtered_df[filtered_df["Continent"] == continent]  
-
-total_aboard_filt = int(filtered_df["Aboard"].sum())
-total_fatalities_filt = int(filtered_df["Fatalities (air)"].sum())
-ground_fatalities_filt = int(filtered_df["Ground"].sum())
-total_crashes_filt = len(filtered_df)
-survivors_filt = int(filtered_df["Survivors"].sum())
+with metrics.section("overall_kpis"):
+    metrics.note_hit()
+    metrics.note_rows(default_view["rows"])
+totals_all = default_view["totals"]
+total_aboard_all = int(totals_all["Aboard"])
+total_fatalities_all = int(totals_all["Fatalities (air)"])
+ground_fatalities_all = int(totals_all["Ground"])
+total_crashes_all = int(totals_all["Crashes"])
+survivors_all = int(totals_all["Survivors"])
 
 
 
@@ -109,14 +398,6 @@ kpis_overall = [
     {"label":"🕊️ Survivors", "value": survivors_all, "color":"#9C27B0"},
 ]
 
-kpis_filtered = [
-    {"label":"🧍 Total Aboard", "value": total_aboard_filt, "color":"#4CAF50"},
-    {"label":"💀 Air Fatalities", "value": total_fatalities_filt, "color":"#f44336"},
-    {"label":"🏠 Ground Fatalities", "value": ground_fatalities_filt, "color":"#FF9800"},
-    {"label":"✈️ Total Crashes", "value": total_crashes_filt, "color":"#2196F3"},
-    {"label":"🕊️ Survivors", "value": survivors_filt, "color":"#9C27B0"},
-]
-
 
 # Overall totals
 st.markdown("### 🌍 Overall Totals")
@@ -140,552 +421,302 @@ st.markdown("---")
 
 # Filtered view
 st.markdown("### 🎯 Filtered View")
-cols = st.columns(5)
-for col, kpi in zip(cols, kpis_filtered):
-    col.markdown(f"""
-        <div style="
-            background-color:{kpi['color']};
-            color:white;
-            padding:20px;
-            border-radius:10px;
-            text-align:center;
-            font-size:16px;
-            font-weight:bold;">
-            {kpi['label']}<br>
-            <span style="font-size:24px;font-weight:bold;">{kpi['value']:,}</span>
-        </div>
-    """, unsafe_allow_html=True)
 
 
+@st.fragment(key="filtered_kpis")
+@metrics.timed("filtered_kpis")
+def filtered_kpis():
+    # --- Filtered totals ---
+    state = current_filter_state()
+    aggregates_filt = default_view if is_unfiltered(state) else metrics.lookup(section_aggregates, *state)
+    metrics.note_rows(aggregates_filt["rows"])
+    totals_filt = aggregates_filt["totals"]
+    total_aboard_filt = int(totals_filt["Aboard"])
+    total_fatalities_filt = int(totals_filt["Fatalities (air)"])
+    ground_fatalities_filt = int(totals_filt["Ground"])
+    total_crashes_filt = int(totals_filt["Crashes"])
+    survivors_filt = int(totals_filt["Survivors"])
+
+    kpis_filtered = [
+        {"label":"🧍 Total Aboard", "value": total_aboard_filt, "color":"#4CAF50"},
+        {"label":"💀 Air Fatalities", "value": total_fatalities_filt, "color":"#f44336"},
+        {"label":"🏠 Ground Fatalities", "value": ground_fatalities_filt, "color":"#FF9800"},
+        {"label":"✈️ Total Crashes", "value": total_crashes_filt, "color":"#2196F3"},
+        {"label":"🕊️ Survivors", "value": survivors_filt, "color":"#9C27B0"},
+    ]
+
+    cols = st.columns(5)
+    for col, kpi in zip(cols, kpis_filtered):
+        col.markdown(f"""
+            <div style="
+                background-color:{kpi['color']};
+                color:white;
+                padding:20px;
+                border-radius:10px;
+                text-align:center;
+                font-size:16px;
+                font-weight:bold;">
+                {kpi['label']}<br>
+                <span style="font-size:24px;font-weight:bold;">{kpi['value']:,}</span>
+            </div>
+        """, unsafe_allow_html=True)
+
+
+filtered_kpis()
 
-# Analysis
 
-st.markdown("### How have global air crashes changed over time (1908–2024)?")
 
-# Group by Year
-yearly_trend = df.groupby("Year").size().reset_index(name="Crash_Count")
-
-# Plot line chart with color
-fig = px.line(
-    yearly_trend,
-    x="Year",
-    y="Crash_Count",
-    title="✈️ Global Air Crash Trend Over Time",
-    markers=True,
-    line_shape='linear',
-)
-
-# Update line color to crimson/red
-fig.update_traces(line=dict(color='crimson', width=3), marker=dict(color='crimson'))
-
-# Style layout
-fig.update_layout(
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    xaxis_title="Year",
-    yaxis_title="Number of Crashes",
-    title_font_size=20,
-)
-
-st.plotly_chart(fig, use_container_width=True)
-
-
-st.markdown("### Which years recorded the highest number of air crashes and fatalities?")
+# Analysis
+# Each chart is built by a function from its aggregated frame; show_chart()
+# serves it from the figure cache when the same inputs were seen before, and
+# the page as it first opens straight from the prerendered default view
+def show_prerendered(chart_id):
+    metrics.note_hit()
+    st.plotly_chart(json.loads(default_view["figures"][chart_id]), use_container_width=True)
 
-# --- Prepare Data ---
-yearly_summary = df.groupby("Year").agg(
-    Crash_Count=("Year", "count"),
-    Total_Fatalities=("Fatalities (air)", "sum")
-).reset_index()
-
-# --- Plotly Combined Bar Chart with colors ---
-fig = px.bar(
-    yearly_summary,
-    x="Year",
-    y=["Crash_Count", "Total_Fatalities"],
-    barmode="group",  # bars side by side
-    labels={"value": "Count", "variable": "Metric"},
-    title="📊 Total Crashes and Fatalities Per Year",
-    color_discrete_map={
-        "Crash_Count": "#2196F3",       
-        "Total_Fatalities": "#f44336"    
-    }
-)
 
-# Layout styling
-fig.update_layout(
-    title_font_size=20,
-    xaxis_title="Year",
-    yaxis_title="Count",
-    legend_title="Metric",
-    xaxis_tickangle=-45,
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)'
-)
+def show_chart(chart_id, inputs, build, prerendered=False):
+    if prerendered:
+        show_prerendered(chart_id)
+        return
+    # Waits for the figure when prefetch_charts() started it on the pool
+    spec = figure_cache.get_or_build(chart_key(chart_id, inputs), build)
+    st.plotly_chart(spec, use_container_width=True)
 
-# Display in Streamlit
-st.plotly_chart(fig, use_container_width=True)
 
+def filtered_aggregate(name):
+    aggregates = metrics.lookup(section_aggregates, *current_filter_state())
+    metrics.note_rows(aggregates["rows"])
+    return aggregates[name]
 
 
-st.markdown("###  Top 10 Aircraft Manufacturers by Air Fatalities")
+def no_crashes_match(state):
+    # True, with a note shown in place of the section, when the filters leave
+    # no crashes; plotly cannot draw a figure without traces
+    if is_unfiltered(state) or metrics.lookup(section_aggregates, *state)["rows"]:
+        return False
+    st.info("No crashes match these filters.")
+    return True
 
-# Use filtered data
-data = filtered_df.copy()
 
-manufacturer_col = "Aircraft Manufacturer"  
-fatal_col = "Fatalities (air)"  
+def show_section_chart(chart_id):
+    # A chart drawn from the section aggregate of the same name
+    state = current_filter_state()
+    if no_crashes_match(state):
+        return
+    show_chart(chart_id, state, lambda: SECTION_CHARTS[chart_id](
+        filtered_aggregate(chart_id)
+    ), is_unfiltered(state))
 
-# Group by manufacturer and sum fatalities
-manufacturer_fatalities = (
-    data.groupby(manufacturer_col)[fatal_col]
-        .sum()
-        .sort_values(ascending=False)
-        .head(10)
-        .reset_index()
-)
 
-# Plot column/bar chart
-fig = px.bar(
-    manufacturer_fatalities,
-    x=manufacturer_col,
-    y=fatal_col,
-    text=fatal_col,
-    color=fatal_col,
-    color_continuous_scale="Reds",
-    title="✈️ Top 10 Aircraft Manufacturers by Air Fatalities"
-)
+st.markdown("### How have global air crashes changed over time (1908–2024)?")
 
-fig.update_layout(
-    xaxis_title="Manufacturer",
-    yaxis_title="Total Air Fatalities",
-    title_font_size=20
-)
 
-fig.update_traces(texttemplate='%{text}', textposition='outside')
+# Group by Year
+with metrics.section("yearly_trend"):
+    metrics.note_rows(default_view["rows"])
+    show_prerendered("yearly_trend")
 
-st.plotly_chart(fig, use_container_width=True)
 
+st.markdown("### Which years recorded the highest number of air crashes and fatalities?")
 
 
-st.markdown("### Which countries have recorded the highest number of air crashes?")
+# --- Prepare Data ---
+with metrics.section("yearly_summary"):
+    metrics.note_rows(default_view["rows"])
+    show_prerendered("yearly_summary")
 
-# Group by country
-country_crashes = df.groupby("Country/Region").size().reset_index(name="Crash_Count")
-# Sort descending
-country_crashes = country_crashes.sort_values(by="Crash_Count", ascending=False)
-top_countries = country_crashes.head(10)
-
-# Horizontal bar chart with color
-fig = px.bar(
-    top_countries,
-    x="Crash_Count",
-    y="Country/Region",
-    orientation='h',
-    text="Crash_Count",
-    title="🛩️ Top 10 Countries by Air Crashes",
-    color="Crash_Count",
-    color_continuous_scale="Reds"  # gradient from light to dark red
-)
-fig.update_layout(
-    xaxis_title="Number of Crashes",
-    yaxis_title="Country",
-    yaxis=dict(autorange="reversed"),  # highest at top
-    title_font_size=20,
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    coloraxis_colorbar=dict(title="Crash Count")
-)
-st.plotly_chart(fig, use_container_width=True)
 
 
+st.markdown("###  Top 10 Aircraft Manufacturers by Air Fatalities")
 
-st.markdown("### How do air crash patterns differ by continent?")
+@st.fragment(key="manufacturer_fatalities")
+@metrics.timed("manufacturer_fatalities")
+def manufacturer_fatalities_section():
+    # Top 10 manufacturers by summed fatalities for the current filters
+    show_section_chart("manufacturer_fatalities")
 
-data = filtered_df  
-
-# --- GROUP BY CONTINENT ---
-continent_summary = data.groupby("Continent").agg(
-    Crash_Count=("Continent", "count"),
-    Total_Fatalities=("Fatalities (air)", "sum")
-).reset_index()
-
-fig = px.bar(
-    continent_summary,
-    x="Continent",
-    y=["Crash_Count", "Total_Fatalities"],
-    barmode="group",
-    labels={"value": "Count", "variable": "Metric"},
-    title="🌍 Air Crash Patterns by Continent",
-    color_discrete_map={
-        "Crash_Count": "#2196F3",        
-        "Total_Fatalities": "#f44336"    
-    }
-)
-# Layout styling
-fig.update_layout(
-    title_font_size=20,
-    xaxis_title="Continent",
-    yaxis_title="Count",
-    legend_title="Metric",
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)'
-)
-st.plotly_chart(fig, use_container_width=True)
 
+manufacturer_fatalities_section()
 
-st.markdown("### Which aircraft types were most involved in crashes?")
 
-data = filtered_df     
 
-# --- GROUP BY AIRCRAFT TYPE ---
-type_crashes = data.groupby("Aircraft").size().reset_index(name="Crash_Count")
+st.markdown("### Which countries have recorded the highest number of air crashes?")
 
-# Sort descending
-type_crashes = type_crashes.sort_values(by="Crash_Count", ascending=False)
 
-# Take Top 10 for a cleaner funnel
-top_types = type_crashes.head(10)
-fig = px.funnel(
-    top_types,
-    x="Crash_Count",
-    y="Aircraft",
-    title="✈️ Top Aircraft Types Most Involved in Crashes",
-)
-# Set all bars to crimson
-fig.update_traces(marker=dict(color='crimson'))
-
-# Layout styling
-fig.update_layout(
-    title_font_size=20,
-    xaxis_title="Crash Count",
-    yaxis_title="Aircraft",
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-)
+with metrics.section("top_countries"):
+    metrics.note_rows(default_view["rows"])
+    show_prerendered("top_countries")
 
-st.plotly_chart(fig, use_container_width=True)
 
 
-st.markdown("### What is the trend of air fatalities and survivors by quarter?")
-#  USE FILTERED DATA
-data = filtered_df.copy()
-
-#  GROUP DATA BY QUARTER
-quarter_summary = (
-    data.groupby("Quarter")
-        .agg(Fatalities=("Fatalities (air)", "sum"),
-             Survivors=("Survivors", "sum"))
-        .reset_index()
-)
+st.markdown("### How do air crash patterns differ by continent?")
 
-# Ensure quarters are in correct order
-quarter_order = ["Qtr 1", "Qtr 2", "Qtr 3", "Qtr 4"]
-quarter_summary["Quarter"] = pd.Categorical(quarter_summary["Quarter"], categories=quarter_order, ordered=True)
-quarter_summary = quarter_summary.sort_values("Quarter")
-
-#  MELT TO LONG FORM
-long_df = quarter_summary.melt(
-    id_vars="Quarter",
-    value_vars=["Fatalities", "Survivors"],
-    var_name="Metric",
-    value_name="Count"
-)
-#  CREATE SCATTER PLOT
-fig = px.scatter(
-    long_df,
-    x="Quarter",
-    y="Count",
-    color="Metric",
-    labels={"Count": "Number of People", "Quarter": "Quarter"},
-    title="📊 Trend of Air Fatalities and Survivors by Quarter",
-    color_discrete_map={"Fatalities": "red", "Survivors": "green"}
-)
-fig.update_traces(mode="markers+lines")
-fig.update_layout(title_font_size=20, xaxis_title="Quarter", yaxis_title="Count", legend_title="Metric")
 
-st.plotly_chart(fig, use_container_width=True)
+@st.fragment(key="continent_summary")
+@metrics.timed("continent_summary")
+def continent_summary_section():
+    # --- GROUP BY CONTINENT ---
+    show_section_chart("continent_summary")
 
 
+continent_summary_section()
 
-st.markdown("### What share of total survivors came from each continent?")
 
-#  FILTERED DATA
-data = filtered_df.copy()
+st.markdown("### Which aircraft types were most involved in crashes?")
 
 
-#  GROUP BY CONTINENT
-survivors_by_continent = (
-    data.groupby("Continent")["Survivors"]
-        .sum()
-        .reset_index()
-        .sort_values("Survivors", ascending=False)
-)
+@st.fragment(key="type_crashes")
+@metrics.timed("type_crashes")
+def type_crashes_section():
+    # --- TOP 10 AIRCRAFT TYPES BY CRASH COUNT ---
+    show_section_chart("type_crashes")
 
 
-#  CREATE DOUGHNUT CHART
-fig_survivors = go.Figure(
-    go.Pie(
-        labels=survivors_by_continent["Continent"],
-        values=survivors_by_continent["Survivors"],
-        hole=0.4,  # doughnut effect
-        textinfo="percent+label",
-        textposition="inside",
-        pull=[0.05]*len(survivors_by_continent),
-        marker=dict(
-            colors=[
-                "#1f77b4", "#ff7f0e", "#2ca02c",
-                "#d62728", "#9467bd", "#8c564b"
-            ],
-            line=dict(color="black", width=1)
-        )
-    )
-)
+type_crashes_section()
 
-fig_survivors.update_layout(
-    title="🌍 Share of Total Survivors by Continent",
-    title_font_size=20,
-    legend_title_text="Continent",
-    height=450,
-    width=450,
-    paper_bgcolor="rgba(0,0,0,0)",
-    plot_bgcolor="rgba(0,0,0,0)"
-)
-st.plotly_chart(fig_survivors, use_container_width=True)
 
+st.markdown("### What is the trend of air fatalities and survivors by quarter?")
 
-st.markdown("### Moving average of survivors for Top 5 aircraft manufacturers over time")
 
-# Filtered data
-data = filtered_df.copy()
+@st.fragment(key="quarter_summary")
+@metrics.timed("quarter_summary")
+def quarter_summary_section():
+    #  FILTERED TOTALS BY QUARTER (already in quarter order)
+    show_section_chart("quarter_summary")
 
-manufacturer_col = "Aircraft Manufacturer" 
 
+quarter_summary_section()
 
-# --- Select top 10 manufacturers by total survivors ---
-top_manufacturers = (
-    data.groupby(manufacturer_col)["Survivors"].sum()
-        .sort_values(ascending=False)
-        .head(5)
-        .index
-)
 
-data_top5 = data[data[manufacturer_col].isin(top_manufacturers)]
 
-# Sort by date
-data_top5 = data_top5.sort_values("Date")
+st.markdown("### What share of total survivors came from each continent?")
 
-# Group by Date and Manufacturer
-daily_summary = (
-    data_top5.groupby(["Date", manufacturer_col])["Survivors"]
-        .sum()
-        .reset_index()
-)
 
-# Calculate 7-day moving average
-daily_summary["Moving_Avg"] = (
-    daily_summary.groupby(manufacturer_col)["Survivors"]
-    .transform(lambda x: x.rolling(window=7, min_periods=1).mean())
-)
+@st.fragment(key="survivors_by_continent")
+@metrics.timed("survivors_by_continent")
+def survivors_by_continent_section():
+    #  FILTERED SURVIVORS BY CONTINENT
+    show_section_chart("survivors_by_continent")
 
 
-# Define colors for each manufacturer
-top5_list = daily_summary[manufacturer_col].unique()
-color_map = {
-    top5_list[0]: "#1f77b4",
-    top5_list[1]: "#ff7f0e",
-    top5_list[2]: "#2ca02c",
-    top5_list[3]: "#d62728",
-    top5_list[4]: "#9467bd"
-}
-fig = px.line(
-    daily_summary,
-    x="Date",
-    y="Moving_Avg",
-    color=manufacturer_col,
-    labels={"Moving_Avg": "Survivors (7-day MA)", "Date": "Date"},
-    title="📈 Moving Average of Survivors by Top 5 Manufacturers",
-    markers=True,
-    color_discrete_map=color_map  # assign specific colors
-)
-# Thicker lines and layout adjustments
-fig.update_traces(line=dict(width=4))
-fig.update_layout(
-    title_font_size=24,
-    xaxis_title="Date",
-    yaxis_title="Number of Survivors",
-    legend_title="Manufacturer",
-    hovermode="x unified",
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)'
-)
-st.plotly_chart(fig, use_container_width=True)
+survivors_by_continent_section()
 
 
-st.markdown("### How does the air-crash survival rate vary across countries?")
+st.markdown("### Moving average of survivors for the top aircraft manufacturers over time")
 
-data = filtered_df.copy()
 
-# --- Calculate survival rate ---
-country_survival = (
-    data.groupby("Country/Region")
-        .agg(
-            Survivors=("Survivors", "sum"),
-            Fatalities=("Fatalities (air)", "sum"),
-            Aboard=("Aboard", "sum")
+@st.fragment(key="daily_summary")
+@metrics.timed("daily_summary")
+def daily_summary_section():
+    # Window and top-N controls only rerun this fragment
+    left, right = st.columns(2)
+    window = left.radio(
+        "Moving-average window:", options=list(MOVING_AVERAGE_WINDOWS), horizontal=True, key="ma_window"
+    )
+    top = right.slider("Top manufacturers:", min_value=1, max_value=15, value=DEFAULT_TOP, key="ma_top")
+    start, end = st.slider(
+        "Visible date range:", min_value=first_crash, max_value=last_crash,
+        value=(first_crash, last_crash), key="ma_range"
+    )
+    state = current_filter_state()
+    if no_crashes_match(state):
+        return
+    inputs = state + (top, window)
+    controls = (top, window, start, end)
+
+    # Survivors per day and moving average for the top manufacturers
+    if not backend.filters_dates and any(
+        value != "All" for column, value in zip(STATE_COLUMNS, state) if column != "Aircraft Manufacturer"
+    ):
+        st.caption(
+            "Streaming ingestion keeps survivors per manufacturer and day only, so this chart "
+            "follows the manufacturer filter alone."
         )
-        .reset_index()
-)
+    show_chart("daily_summary", inputs + (start, end), lambda: daily_summary_figure(
+        *visible_moving_average(metrics.lookup(manufacturer_moving_average, *inputs), start, end), window
+    ), is_unfiltered(state) and controls == (DEFAULT_TOP, DEFAULT_WINDOW, first_crash, last_crash))
 
-# Avoid division errors
-country_survival["Survival_Rate"] = (
-    country_survival["Survivors"] / country_survival["Aboard"]
-).fillna(0) * 100
-
-# Rename for easier mapping
-country_survival.rename(columns={"Country/Region": "Country"}, inplace=True)
-
-# --- Choropleth Map ---
-fig = px.choropleth(
-    country_survival,
-    locations="Country",
-    locationmode="country names",
-    color="Survival_Rate",
-    hover_name="Country",
-    hover_data={
-        "Survivors": True,
-        "Fatalities": True,
-        "Aboard": True,
-        "Survival_Rate": ":.2f"
-    },
-    color_continuous_scale="greens",
-    title="🌍 Global Air-Crash Survival Rate by Country (%)"
-)
 
-fig.update_layout(
-    title_font_size=20,
-    geo=dict(showframe=False, showcoastlines=True, projection_type="natural earth"),
-    paper_bgcolor='rgba(0,0,0,0)',
-    plot_bgcolor='rgba(0,0,0,0)'
-)
-
-st.plotly_chart(fig, use_container_width=True)
-st.markdown("### 📋 Survival Rate Table")
-
-st.dataframe(
-    country_survival[["Country", "Survivors", "Fatalities", "Aboard", "Survival_Rate"]]
-        .sort_values(by="Survival_Rate", ascending=False)
-)
+daily_summary_section()
 
-# --- Findings Section ---
-st.markdown("## 📊 Findings")
-
-# Global Air Crash Trends
-st.markdown("### 1. ✈️ Global Air Crash Trends")
-st.markdown("""
-- **Early 1900s–1940s:** Air crashes increased steadily as aviation technology and commercial flights expanded.  
-- **1945–1970:** The highest crash frequency occurred, with several years exceeding **70–80 crashes/year**, likely due to rapid growth of commercial aviation and post-war developments.  
-- **1970s onward:** Crash numbers began a gradual decline, reflecting improvements in aircraft design, safety regulations, and air traffic control.  
-- **2000–2024:** Sharp and consistent decrease in crashes, reaching historically low levels of **fewer than 10 crashes/year**, demonstrating significant advancements in aviation safety.
-""")
-
-st.markdown("### 2. Total Crashes and Fatalities Per Year")
-st.markdown("""
-- **Trend Similarity:** Fatalities follow a similar trend to crashes but show **major spikes** in certain years.
-- **Spike Periods:** Late 1950s–1960s, Late 1970s, Early 1980s, Early 1990s
-- **High-Fatality Years:** Some years recorded over **2,000–2,800 fatalities**, often due to **one or two large catastrophic accidents**.
-- **Recent Decades:** Crashes and fatalities have **dropped significantly**, even as **global air traffic increased** dramatically.
-""")
-
-# --- Findings for Top 10 Aircraft Manufacturers ---
-st.markdown("### 3. Top 10 Aircraft Manufacturers by Air Fatalities")
-st.markdown("""
-- **Highest Fatalities:** McDonnell Douglas and Boeing account for the most air fatalities historically (**24,406** and **20,583**, respectively).  
-- **Older Manufacturers:** Lockheed, Antonov, Tupolev, Ilyushin show high totals due to older aircraft designs, military use, and less stringent safety regulations during peak production years.  
-- **Modern Manufacturers:** Airbus, despite widespread use, has comparatively lower totals, reflecting advances in safety and newer fleet age.
-""")
-
-st.markdown("""
-### 4. ✈️ Air Crash Patterns by Continent
-- **Highest Fatalities:** Europe and Asia lead with totals near or above **30,000 fatalities**. North America and Africa follow with **15,000–20,000 fatalities**.  
-- **Crash vs Fatalities:** Across all continents, fatalities far exceed crash counts, indicating many crashes involve large loss of life.  
-- **Lowest Counts:** Oceania and South America have the lowest totals, each under **15,000 fatalities**.
-
-### 5. 🌍 Top 10 Countries by Air Crashes
-- **Leader:** The United States recorded **844 crashes**, far higher than any other country.  
-- **Second Place:** Russia with **256 crashes**.  
-
-
-### 6.🛩️ Top Aircraft Types Involved in Crashes
-- **Most Involved:** The Douglas DC-3 with **549 crashes** dominates the list.  
-- **Disparity:** DC-3 crashes are over **six times higher** than the second most involved aircraft, the De Havilland Canada DHC-6 Twin Otter (**90 crashes**).  
-- **Manufacturers:** Older aircraft models from **Douglas** and **Boeing** dominate the crash data.
-""")
-
-st.markdown("""
-### 📉 7. Trend of Air Fatalities and Survivors by Quarter
-- **Fatalities consistently exceed survivors** in every quarter.  
-- **Quarter 3** shows the highest counts for both fatalities (**~30,000**) and survivors (**~13,000**).  
-- **Quarter 2** records the lowest totals (fatalities **~24,000**, survivors **~9,500**).  
-- Survivors remain fairly stable from Q1 → Q2 before rising in Q3, while fatalities dip from Q1 → Q2, then sharply spike in Q3.  
-- Both metrics decline slightly in **Quarter 4**.
-
-
-### 🌍 8. Share of Total Survivors by Continent
-- **Asia leads** with **30%** of global survivors, followed by **North America (23.6%)** and **Europe (22.1%)**.  
-- These three continents account for **~75.7%** of all survivors.  
-- **Africa** contributes **15%**, while **South America** is lower at **7.6%**.  
-- **Oceania and Unknown** regions represent minimal shares.
-
-
-### ✈️ 9. Moving Average of Survivors by Top 5 Aircraft Manufacturers
-- Before the **1980s**, all manufacturers recorded **low, stable survivor averages** (typically under 50).  
-- **Airbus shows a major spike** in the late 1970s–early 1980s, reaching **~250**, the highest moving average among all manufacturers.  
-- From the **1990s to early 2010s**, Boeing, McDonnell Douglas, and Airbus show **frequent peaks** between **50–150 survivors**.  
-- After **2015**, averages stabilize below **100**, with Boeing showing the most activity (peaks up to **~80**).  
-- **Lockheed and Tupolev** maintain relatively **lower survivor averages** across the entire timeline.
-        
-
-### 🗺️ 10. Survival Rate by Country
-- **Highest Survival Rates:**  
-  - **Moldova** leads with a **67.37%** survival rate (223 survivors out of 331 aboard).  
-  - **Armenia** follows with **61.43%** (266 survivors out of 433 aboard).  
-- **Mid-Range Performers:**  
-  - **Singapore (59.06%)**, **Luxembourg (58.87%)**, and **Guadeloupe (57.72%)** maintain strong rates above **55%**.  
-- **Major Contributor Example:**  
-  - **Japan**, with the highest observed number aboard (**2,895**), achieves a **55.72%** survival rate (1,613 survivors).  
-- **Lower Range in Top 10:**  
-  - **Ghana** records the lowest visible survival rate at **52.55%** (175 survivors out of 333 aboard).             
-
-""")
-
-st.markdown("""
-### 🛠️ Recommendations for Improving Global Aviation Safety (1908–2024)
-
-Based on over a century of air crash data, the following five recommendations represent the most impactful strategies for strengthening global aviation safety:
-
-
- **1. Modernize and Replace Aging Aircraft Fleets**
-Retire older aircraft models especially legacy types such as DC-series, early Boeing models, and aging Soviet era aircraft.  
-Invest in modern fleets equipped with advanced avionics, improved structural integrity, and real time safety monitoring systems.
 
+st.markdown("### How does the air-crash survival rate vary across countries?")
 
- **2. Strengthen Aviation Oversight in High Risk Regions**
-Expand international safety audits and provide technical and regulatory support to regions with historically high crash and fatality rates.  
-Enhance ICAO compliance and ensure consistent implementation of global safety standards.
 
- **3. Improve Pilot Training and Human Factors Programs**
-Increase investment in simulator based emergency training, Crew Resource Management (CRM), and updated cockpit communication protocols.  
-Human error remains a major cause of crashes, and enhanced training can significantly reduce risk.
+@st.fragment(key="country_survival")
+@metrics.timed("country_survival")
+def country_survival_section():
+    # --- Survival rate per country ---
+    state = current_filter_state()
+    if no_crashes_match(state):
+        return
+    show_section_chart("country_survival")
+    unresolved = backend.unresolved_countries()
+    if unresolved:
+        st.caption("Not shown on the map (no ISO-3 code): " + ", ".join(unresolved))
+    st.markdown("### 📋 Survival Rate Table")
+
+    label = st.radio("Group by:", [label for label, _ in SURVIVAL_GROUPS], horizontal=True, key="survival_by")
+    by = dict(SURVIVAL_GROUPS)[label]
+    if is_unfiltered(state) and by == DEFAULT_SURVIVAL_BY:
+        table = default_view["survival"]
+    else:
+        table = metrics.lookup(survival_table, *state, by)
+    st.caption(
+        "95% intervals. Wilson counts everyone aboard as an independent trial; the bootstrap "
+        "resamples whole crashes, so a rate resting on a few crashes stays wide; a group with a "
+        "single crash has nothing to resample and no bootstrap interval. Groups with nobody "
+        "aboard have no rate."
+    )
+    no_interval = "Empty when the group has fewer than 2 crashes"
+    st.dataframe(
+        table.rename(columns={by: label, "Fatalities (air)": "Fatalities"})
+            .sort_values(by="Survival_Rate", ascending=False),
+        column_config={
+            "Survival_Rate": st.column_config.NumberColumn(help="Empty when nobody was aboard"),
+            "Bootstrap_Low": st.column_config.NumberColumn(help=no_interval),
+            "Bootstrap_High": st.column_config.NumberColumn(help=no_interval),
+        },
+    )
 
- **4. Enhance Emergency Response and Survival Capabilities**
-Upgrade airport firefighting systems, rescue readiness, and evacuation procedures.  
-Improve cabin safety design, onboard medical tools, and clearer safety briefing materials to increase survival outcomes.
 
- **5. Expand Adoption of Advanced Technology and Data Systems**
-Encourage the use of AI assisted monitoring, predictive maintenance, advanced weather detection tools, and integrated data reporting systems.  
-Greater transparency and real time diagnostics help prevent incidents before they occur.
+country_survival_section()
 
-""")
+# --- Findings Section ---
+# Written from the unfiltered data when the default view was prerendered
+for block in default_view["findings"]:
+    st.markdown(block)
+
+
+# --- DEBUG PANEL ---
+# Opt-in per page (?debug=1): section timings for the whole process, refreshed
+# together with the filtered sections
+@st.fragment(key="debug_panel")
+def debug_panel():
+    with st.sidebar.expander("⏱️ Section timings", expanded=True):
+        if not TRACK_ALLOC:
+            st.caption("Allocations are measured with AIRCRASH_TRACK_ALLOC=1.")
+        summary = pd.DataFrame(metrics.METRICS.summary())
+        if summary.empty:
+            st.caption("No sections recorded yet.")
+            return
+        st.dataframe(
+            summary.sort_values("last_ms", ascending=False),
+            hide_index=True,
+            column_config={
+                "last_ms": st.column_config.NumberColumn("last ms", format="%.1f"),
+                "p50_ms": st.column_config.NumberColumn("p50 ms", format="%.1f"),
+                "p95_ms": st.column_config.NumberColumn("p95 ms", format="%.1f"),
+                "alloc_kb": st.column_config.NumberColumn("alloc KB", format="%.0f"),
+                "hit_rate": st.column_config.NumberColumn("hit rate", format="percent"),
+            },
+        )
+        st.download_button(
+            "Prometheus metrics", metrics.prometheus_text(), file_name="aircrash_metrics.txt", mime="text/plain"
+        )
 
 
+if DEBUG_PANEL:
+    FILTERED_SECTIONS.append("debug_panel")
+    debug_panel()
@@ -0,0 +1 @@
+"""Benchmarks for the dashboard at scaled data sizes (python -m benchmarks.run)."""
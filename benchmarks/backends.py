@@ -0,0 +1,172 @@
+"""Parity check and side-by-side timings of the pandas and DuckDB backends.
+
+For each scale the synthetic CSV (benchmarks.synthetic) also gets a sorted
+Parquet copy. Both backends answer the sample filter states of
+benchmarks.run, and every answer the page uses (section aggregates,
+roll-ups, sidebar options, date span, unresolved countries) must match
+between them; then each question is timed on both::
+
+    python -m benchmarks.backends --scales 1 10
+    python -m benchmarks.backends --scales 10 --source csv    # DuckDB on the CSV
+
+Exits 1 when any answer differs. The "rows" metric is left out of the
+comparison: pandas counts cube cells, DuckDB source rows. The test suite runs
+the same parity check on the bundled CSV (tests/test_backends.py).
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+import pandas as pd
+
+from aircrash.backends import DuckDBBackend, PandasBackend, write_parquet
+from aircrash.filters import FILTER_COLUMNS, SEARCH_COLUMNS, STATE_COLUMNS, make_state
+from aircrash.intervals import survival_intervals
+from aircrash.store import DataStore
+
+from .run import DEFAULT_SCALES, most_common, multi_states, sample_states
+from .synthetic import DEFAULT_SEED, write_synthetic
+
+
+def comparable(value):
+    # Frames with their label columns as plain objects (pandas keeps
+    # categoricals, DuckDB returns strings), so results compare on values alone
+    if isinstance(value, pd.DataFrame):
+        frame = value.reset_index(drop=True)
+        for column in frame.columns:
+            dtype = frame[column].dtype
+            if not (pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype)):
+                frame[column] = frame[column].astype(object)
+        return frame
+    if isinstance(value, pd.Series):
+        return value.astype("int64")
+    return value
+
+
+def differences(name, expected, actual):
+    # Descriptions of where `actual` differs from `expected`
+    expected, actual = comparable(expected), comparable(actual)
+    try:
+        if isinstance(expected, pd.DataFrame):
+            pd.testing.assert_frame_equal(expected, actual, check_dtype=False)
+        elif isinstance(expected, pd.Series):
+            pd.testing.assert_series_equal(expected, actual, check_dtype=False, check_names=False)
+        elif expected != actual:
+            raise AssertionError(f"{expected!r} != {actual!r}")
+    except AssertionError as error:
+        return [f"{name}: {str(error).strip().splitlines()[0]}"]
+    return []
+
+
+def questions(states):
+    # (name, call) pairs of everything the page asks a backend
+    asked = [(f"aggregates{state}", lambda backend, state=state: backend.aggregates(state)) for state in states]
+    asked += [(f"rollup {by}", lambda backend, by=by: backend.rollup(by)) for by in ("Year", "Country/Region")]
+    for state in states[:3]:
+        selections = dict(zip(STATE_COLUMNS, state))
+        asked += [
+            (f"options {column} {state}", lambda backend, s=selections, c=column: backend.options(s, c))
+            for column in FILTER_COLUMNS
+        ]
+    # Both backends must hand the bootstrap the same crash cells
+    asked += [
+        (f"survival {state}", lambda backend, state=state: survival_intervals(
+            backend.cells(state, ["Country/Region", "Survivors", "Aboard"]), "Country/Region", workers=1
+        ))
+        for state in states[:3]
+    ]
+    asked.append(("date_range", lambda backend: backend.date_range()))
+    asked.append(("unresolved_countries", lambda backend: backend.unresolved_countries()))
+    return asked
+
+
+def parity(backends, asked):
+    failures = []
+    reference, other = backends
+    for name, ask in asked:
+        expected, actual = ask(reference), ask(other)
+        if name.startswith("aggregates"):
+            for key in expected:
+                if key != "rows":
+                    failures += differences(f"{name} {key}", expected[key], actual[key])
+        else:
+            failures += differences(name, expected, actual)
+    return failures
+
+
+def timed(run, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def bench_scale(path, source, repeat, threads):
+    started = time.perf_counter()
+    pandas_backend = PandasBackend(DataStore(path))
+    pandas_start = time.perf_counter() - started
+    started = time.perf_counter()
+    duckdb_backend = DuckDBBackend(path if source == "csv" else write_parquet(path), threads)
+    duckdb_start = time.perf_counter() - started
+
+    dataset = pandas_backend.store.snapshot
+    single, several = sample_states(dataset), multi_states(dataset)
+    searched = [make_state({column: most_common(dataset["cube"], column, 1)}) for column in SEARCH_COLUMNS]
+    failures = parity((pandas_backend, duckdb_backend), questions(single + several + searched))
+
+    rows = [("startup", pandas_start, duckdb_start)]
+    for label, group in (("aggregates", single), ("aggregates:multi", several)):
+        rows.append((
+            label,
+            timed(lambda: [pandas_backend.aggregates(state) for state in group], repeat),
+            timed(lambda: [duckdb_backend.aggregates(state) for state in group], repeat),
+        ))
+    selections = dict(zip(STATE_COLUMNS, several[-1]))
+    rows.append((
+        "options",
+        timed(lambda: [pandas_backend.options(selections, c) for c in FILTER_COLUMNS], repeat),
+        timed(lambda: [duckdb_backend.options(selections, c) for c in FILTER_COLUMNS], repeat),
+    ))
+    rows.append((
+        "rollups",
+        timed(lambda: [pandas_backend.rollup(by) for by in ("Year", "Country/Region")], repeat),
+        timed(lambda: [duckdb_backend.rollup(by) for by in ("Year", "Country/Region")], repeat),
+    ))
+    return rows, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the pandas and DuckDB backends.")
+    parser.add_argument("--scales", type=float, nargs="+", default=DEFAULT_SCALES, help="data sizes, e.g. 1 10 100")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (median reported)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed for the synthetic data")
+    parser.add_argument("--source", choices=("parquet", "csv"), default="parquet", help="file DuckDB reads")
+    parser.add_argument("--threads", type=int, help="DuckDB threads (default: every core)")
+    args = parser.parse_args(argv)
+
+    failures = []
+    print(f"{'scale':>6}  {'case':<20} {'pandas (ms)':>12} {'duckdb (ms)':>12} {'ratio':>7}")
+    for scale in args.scales:
+        path = write_synthetic(scale, seed=args.seed)
+        # A stale Parquet copy would shadow the CSV under --source csv
+        path.with_suffix(".parquet").unlink(missing_ok=True)
+        rows, failed = bench_scale(path, args.source, args.repeat, args.threads)
+        for case, pandas_seconds, duckdb_seconds in rows:
+            print(
+                f"{scale:>5g}x  {case:<20} {pandas_seconds * 1000:>12.2f} {duckdb_seconds * 1000:>12.2f}"
+                f" {duckdb_seconds / pandas_seconds:>6.2f}x"
+            )
+        failures += [f"{scale:g}x {failure}" for failure in failed]
+
+    for failure in failures:
+        print(f"MISMATCH {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
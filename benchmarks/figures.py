@@ -0,0 +1,113 @@
+"""Sequential versus thread-pool construction of the filtered charts.
+
+For every sample filter state of benchmarks.run, the charts a filter change
+redraws (charts.SECTION_CHARTS and the moving average) are built into a fresh
+FigureCache twice: one after another in page order, as with
+AIRCRASH_FIGURE_WORKERS=1, and prefetched on a pool of N threads and then
+collected in page order, as app.py does. The aggregates are computed once up
+front, since both paths look them up the same way. Reports the wall time of
+each path and the speedup, and exits 1 when the two paths build different
+figures::
+
+    python -m benchmarks.figures --scales 1 10 --workers 2 4 8
+
+Figure building is mostly Python holding the GIL; the speedup comes from
+the parts that release it (NumPy, pandas and JSON encoding) and is bounded
+by the cores available.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from aircrash.aggregations import filtered_aggregates, top_manufacturer_moving_average
+from aircrash.charts import (
+    FIGURE_CACHE_BUDGET,
+    SECTION_CHARTS,
+    FigureCache,
+    daily_summary_figure,
+    visible_moving_average,
+)
+from aircrash.prerender import DEFAULT_TOP, DEFAULT_WINDOW
+from aircrash.store import DataStore
+
+from .run import DEFAULT_SCALES, multi_states, sample_states
+from .synthetic import DEFAULT_SEED, write_synthetic
+
+DEFAULT_WORKERS = [2, 4]
+
+
+def chart_jobs(dataset, states):
+    # (key, build) per chart and state, in page order
+    dates = dataset["crashes"]["Date"]
+    first, last = dates.min(), dates.max()
+
+    def daily_summary(moving_average):
+        return daily_summary_figure(*visible_moving_average(moving_average, first, last), DEFAULT_WINDOW)
+
+    jobs = []
+    for state in states:
+        aggregates = filtered_aggregates(dataset, state)
+        jobs += [((chart_id, state), partial(build, aggregates[chart_id])) for chart_id, build in SECTION_CHARTS.items()]
+        moving_average = top_manufacturer_moving_average(aggregates, DEFAULT_TOP, DEFAULT_WINDOW)
+        jobs.append((("daily_summary", state), partial(daily_summary, moving_average)))
+    return jobs
+
+
+def sequential(jobs):
+    cache = FigureCache(FIGURE_CACHE_BUDGET)
+    return [cache.get_or_build(key, build) for key, build in jobs]
+
+
+def pooled(jobs, pool):
+    cache = FigureCache(FIGURE_CACHE_BUDGET)
+    for key, build in jobs:
+        cache.prefetch(key, build, pool)
+    return [cache.get_or_build(key, build) for key, build in jobs]
+
+
+def timed(run, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare sequential and thread-pool figure construction.")
+    parser.add_argument("--scales", type=float, nargs="+", default=DEFAULT_SCALES, help="data sizes, e.g. 1 10 100")
+    parser.add_argument("--workers", type=int, nargs="+", default=DEFAULT_WORKERS, help="pool sizes to time")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (median reported)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed for the synthetic data")
+    args = parser.parse_args(argv)
+
+    failures = []
+    print(f"{os.cpu_count()} cores")
+    print(f"{'scale':>6}  {'path':<12} {'charts':>7} {'time (ms)':>11} {'speedup':>8}")
+    for scale in args.scales:
+        dataset = DataStore(write_synthetic(scale, seed=args.seed)).snapshot
+        jobs = chart_jobs(dataset, sample_states(dataset) + multi_states(dataset))
+        sequential(jobs[:len(SECTION_CHARTS) + 1])  # plotly imports and first-call setup
+        baseline, expected = timed(lambda: sequential(jobs), args.repeat)
+        print(f"{scale:>5g}x  {'sequential':<12} {len(jobs):>7} {baseline * 1000:>11.1f} {1:>7.2f}x")
+        for workers in args.workers:
+            with ThreadPoolExecutor(workers, thread_name_prefix="figures") as pool:
+                seconds, specs = timed(lambda: pooled(jobs, pool), args.repeat)
+            print(f"{scale:>5g}x  {f'{workers} threads':<12} {len(jobs):>7} {seconds * 1000:>11.1f} {baseline / seconds:>7.2f}x")
+            if specs != expected:
+                failures.append(f"{scale:g}x with {workers} threads built different figures")
+
+    for failure in failures:
+        print(f"MISMATCH {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Import-time budget for the dashboard modules, measured with ``-X importtime``.
+
+Each module is imported in a fresh interpreter and its cumulative import time
+(itself plus everything it pulled in) is compared to the budget in
+import_budget.json. Budgets are ratios of the reference module's import time
+(pandas, which nearly every module pulls in) measured in the same run, so
+they hold on slow and fast hosts alike; each leaves at least a third of headroom
+over what was measured. Modules that must stay lazy, such as plotly.express
+in aircrash.charts, are listed per module and fail the check when imported
+eagerly::
+
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --top 15     # slowest imports of each module
+    python -m benchmarks.importtime --check      # exit 1 over budget
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BUDGET_PATH = Path(__file__).resolve().parent / "import_budget.json"
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_times(module):
+    # {imported module: cumulative microseconds} for one cold `import module`
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True, cwd=ROOT,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(module, repeat):
+    # Median cumulative time over `repeat` runs, with the last run's breakdown
+    runs = [import_times(module) for _ in range(repeat)]
+    return statistics.median(run[module] for run in runs) / 1000, runs[-1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check module import times against a budget.")
+    parser.add_argument("--budget", type=Path, default=BUDGET_PATH, help="budget JSON (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="cold imports per module (median reported)")
+    parser.add_argument("--top", type=int, default=0, help="also list the slowest imports of each module")
+    parser.add_argument("--check", action="store_true", help="exit 1 when a budget is exceeded")
+    args = parser.parse_args(argv)
+
+    budget = json.loads(args.budget.read_text())
+    reference, _ = measure(budget["reference"], args.repeat)
+    print(f"{budget['reference']} (reference): {reference:.1f} ms")
+    failures = []
+    print(f"{'module':<24} {'import (ms)':>12} {'budget (ms)':>12}")
+    for module, limits in budget["modules"].items():
+        milliseconds, times = measure(module, args.repeat)
+        allowed = limits["ratio"] * reference
+        over = milliseconds > allowed
+        eager = [name for name in limits.get("lazy", []) if name in times]
+        print(f"{module:<24} {milliseconds:>12.1f} {allowed:>12.0f}" + ("  OVER" if over else ""))
+        if over:
+            failures.append(
+                f"{module} took {milliseconds:.0f} ms, budget {allowed:.0f} ms ({limits['ratio']}x {budget['reference']})"
+            )
+        for name in eager:
+            failures.append(f"{module} imports {name} eagerly")
+        if args.top:
+            slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[1:args.top + 1]
+            for name, microseconds in slowest:
+                print(f"    {name:<40} {microseconds / 1000:>8.1f}")
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    if args.check and failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""Load test: many concurrent browser sessions changing filters on a live server.
+
+Starts ``streamlit run app.py`` headless on a free port (or targets --url)
+and connects --sessions websocket clients, ramped in over --ramp seconds.
+Each session loads the page, then makes --changes random filter changes
+with a think time between them: it picks one of the Year / Country /
+Continent / Quarter multi-selects and either clears it or selects one to
+three of the options the server currently offers, exactly as a browser
+sends the change, and waits for the reruns it triggers to finish. Reports
+the first-load and rerun latency percentiles, throughput, errors and the
+server's RSS over time, and with --check exits 1 when a limit in
+load_budget.json is exceeded::
+
+    python -m benchmarks.load --sessions 50
+    python -m benchmarks.load --sessions 200 --changes 5 --check
+    python -m benchmarks.load --scale 10 --backend duckdb
+    python -m benchmarks.load --url ws://host:8501 --pid 1234
+
+One session loads the page before the clock starts, so the cold start
+(data load, prerender, imports) is reported on its own and the rest
+measure the warm server. Widget ids and options are read from the page
+the server sends, so the harness follows app.py without changes. The
+auto-refresh fragment is turned off (AIRCRASH_REFRESH_SECONDS=0) and XSRF
+protection disabled for the local server. The budget limits are keys of
+the summary --output writes (e.g. rerun_p95_ms, peak_rss_mb, errors).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from websockets.asyncio.client import connect
+
+from aircrash.data import DATA_PATH
+from aircrash.filters import FILTERS
+
+from .synthetic import DEFAULT_SEED, write_synthetic
+
+BUDGET_PATH = Path(__file__).resolve().parent / "load_budget.json"
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+FILTER_KEYS = [key for key, _, _ in FILTERS]
+CLEAR_CHANCE = 0.25  # share of changes that clear a filter instead of selecting
+STARTUP_TIMEOUT = 120
+
+
+# --- SERVER ---
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(data, backend, port, log):
+    env = dict(os.environ, AIRCRASH_DATA=str(data), AIRCRASH_BACKEND=backend, AIRCRASH_REFRESH_SECONDS="0")
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", str(APP_PATH),
+            "--server.headless", "true", "--server.port", str(port), "--server.address", "127.0.0.1",
+            "--server.enableXsrfProtection", "false", "--browser.gatherUsageStats", "false",
+        ],
+        env=env, stdout=log, stderr=subprocess.STDOUT,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            break
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return server
+        except OSError:
+            time.sleep(0.25)
+    server.kill()
+    log.seek(0)
+    raise SystemExit("server did not start:\n" + log.read().decode(errors="replace")[-2000:])
+
+
+def rss_mb(pid):
+    # Resident pages of process `pid` from /proc (Linux), in MB
+    with open(f"/proc/{pid}/statm") as fh:
+        return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+# --- SESSIONS ---
+class Session:
+    # One browser tab: the websocket, the filter widgets it was last sent and
+    # what it has selected in them
+
+    def __init__(self, websocket, timeout):
+        self.websocket = websocket
+        self.timeout = timeout
+        self.widgets = {}  # key -> (widget id, offered options)
+        self.fragment_id = ""
+        self.selected = {key: [] for key in FILTER_KEYS}
+
+    async def run(self, fragment_id=""):
+        # Ask for a (fragment) rerun with the current selections and read the
+        # page until the last run it triggers finishes; returns the error
+        # shown on the page, if any
+        message = BackMsg()
+        message.rerun_script.fragment_id = fragment_id
+        for key, values in self.selected.items():
+            if key in self.widgets:
+                widget = message.rerun_script.widget_states.widgets.add()
+                widget.id = self.widgets[key][0]
+                widget.string_array_value.data.extend(values)
+        await self.websocket.send(message.SerializeToString())
+
+        error = None
+        while True:
+            reply = ForwardMsg()
+            reply.ParseFromString(await asyncio.wait_for(self.websocket.recv(), self.timeout))
+            kind = reply.WhichOneof("type")
+            if kind == "delta" and reply.delta.WhichOneof("type") == "new_element":
+                element = reply.delta.new_element
+                if element.WhichOneof("type") == "exception":
+                    error = error or element.exception.message
+                elif element.WhichOneof("type") == "multiselect":
+                    key = element.multiselect.id.rsplit("-", 1)[-1]
+                    if key in self.selected:
+                        self.widgets[key] = (element.multiselect.id, list(element.multiselect.options))
+                        self.fragment_id = reply.delta.fragment_id
+            # A change callback that calls st.rerun ends the first run early
+            elif kind == "script_finished" and reply.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                if reply.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    error = error or "compile error"
+                return error
+
+    def change(self, rng):
+        # A random edit of one filter, chosen from the options now offered
+        key = rng.choice(FILTER_KEYS)
+        offered = self.widgets[key][1]
+        if offered and (not self.selected[key] or rng.random() >= CLEAR_CHANCE):
+            self.selected[key] = rng.sample(offered, min(len(offered), rng.randint(1, 3)))
+        else:
+            self.selected[key] = []
+
+
+async def drive(url, number, args, results):
+    rng = random.Random(args.seed * 100_003 + number)
+    await asyncio.sleep(args.ramp * number / max(args.sessions, 1))
+    async with connect(f"{url}/_stcore/stream", subprotocols=["streamlit"], max_size=None) as websocket:
+        session = Session(websocket, args.timeout)
+        started = time.perf_counter()
+        error = await session.run()
+        results["first_load"].append((time.perf_counter() - results["started"], time.perf_counter() - started))
+        for _ in range(args.changes):
+            if error:
+                results["errors"].append(error)
+                error = None
+            await asyncio.sleep(rng.uniform(0.5, 1.5) * args.think)
+            session.change(rng)
+            started = time.perf_counter()
+            error = await session.run(session.fragment_id)
+            results["rerun"].append((time.perf_counter() - results["started"], time.perf_counter() - started))
+        if error:
+            results["errors"].append(error)
+
+
+async def sample_rss(pid, interval, results, done):
+    # (seconds since start, RSS MB, sessions still running) every `interval`
+    while not done.is_set():
+        results["rss"].append((time.perf_counter() - results["started"], rss_mb(pid), results["active"]))
+        try:
+            await asyncio.wait_for(done.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+    results["rss"].append((time.perf_counter() - results["started"], rss_mb(pid), 0))
+
+
+async def load(url, pid, args):
+    # Timings are (seconds since start when it finished, seconds it took)
+    results = {"first_load": [], "rerun": [], "errors": [], "rss": [], "active": args.sessions}
+
+    async def session(number):
+        try:
+            await drive(url, number, args, results)
+        except Exception as error:  # a timeout or dropped connection ends one session, not the run
+            results["errors"].append(f"session {number}: {type(error).__name__}: {error}")
+        finally:
+            results["active"] -= 1
+
+    done = asyncio.Event()
+    results["started"] = time.perf_counter()
+    sampler = asyncio.create_task(sample_rss(pid, args.interval, results, done)) if pid else None
+    await asyncio.gather(*(session(number) for number in range(args.sessions)))
+    results["seconds"] = time.perf_counter() - results["started"]
+    done.set()
+    if sampler:
+        await sampler
+    return results
+
+
+async def cold_start(url, timeout):
+    # Seconds until the first session's page finished, imports and data load included
+    async with connect(f"{url}/_stcore/stream", subprotocols=["streamlit"], max_size=None) as websocket:
+        started = time.perf_counter()
+        error = await Session(websocket, timeout).run()
+        if error:
+            raise SystemExit(f"app raised: {error}")
+        return time.perf_counter() - started
+
+
+# --- REPORT ---
+def percentiles(timings):
+    # p50, p95, p99 and max in milliseconds
+    timings = [seconds * 1000 for _, seconds in timings]
+    if len(timings) < 2:
+        return (timings[0],) * 4 if timings else (0.0,) * 4
+    cuts = statistics.quantiles(timings, n=100, method="inclusive")
+    return cuts[49], cuts[94], cuts[98], max(timings)
+
+
+def summarize(results, cold_seconds, rss_start):
+    summary = {"cold_start_ms": cold_seconds * 1000}
+    for name in ("first_load", "rerun"):
+        p50, p95, p99, worst = percentiles(results[name])
+        summary.update({f"{name}_p50_ms": p50, f"{name}_p95_ms": p95, f"{name}_p99_ms": p99, f"{name}_max_ms": worst})
+    summary["reruns"] = len(results["rerun"])
+    summary["reruns_per_second"] = len(results["rerun"]) / results["seconds"]
+    summary["errors"] = len(results["errors"])
+    if results["rss"]:
+        summary["rss_start_mb"] = rss_start
+        summary["peak_rss_mb"] = max(mb for _, mb, _ in results["rss"])
+        summary["rss_end_mb"] = results["rss"][-1][1]
+    return summary
+
+
+def rss_timeline(results, rows):
+    # About `rows` evenly spaced samples with the reruns finished since the previous one
+    samples = results["rss"]
+    step = max(1, len(samples) // rows)
+    picked = samples[::step] + ([samples[-1]] if (len(samples) - 1) % step else [])
+    finished = [at for at, _ in results["rerun"]]
+    lines, previous = [], 0
+    for seconds, mb, active in picked:
+        count = sum(1 for at in finished if at <= seconds)
+        lines.append(f"{seconds:>7.1f}s {mb:>9.1f} {active:>9} {count - previous:>8}")
+        previous = count
+    return lines
+
+
+def check(summary, budget):
+    # Failures for every limit in `budget` the run exceeded
+    return [
+        f"{limit} {summary[limit]:.1f}, budget {allowed}"
+        for limit, allowed in budget.items()
+        if summary.get(limit) is not None and summary[limit] > allowed
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Drive concurrent sessions against a local dashboard server.")
+    parser.add_argument("--sessions", type=int, default=50, help="concurrent browser sessions")
+    parser.add_argument("--changes", type=int, default=10, help="filter changes per session")
+    parser.add_argument("--think", type=float, default=1.0, help="mean seconds between a session's changes")
+    parser.add_argument("--ramp", type=float, default=10.0, help="seconds over which sessions connect")
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds a run may take before it fails")
+    parser.add_argument("--data", type=Path, default=DATA_PATH, help="crash CSV the server loads")
+    parser.add_argument("--scale", type=float, help="load a synthetic CSV of this size instead (see benchmarks.run)")
+    parser.add_argument("--backend", choices=("pandas", "duckdb"), default="pandas", help="AIRCRASH_BACKEND")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed for data and filter sequences")
+    parser.add_argument("--url", help="target a running server (e.g. ws://127.0.0.1:8501) instead of starting one")
+    parser.add_argument("--pid", type=int, help="server process to sample RSS from with --url")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between RSS samples")
+    parser.add_argument("--budget", type=Path, default=BUDGET_PATH, help="budget JSON (default: %(default)s)")
+    parser.add_argument("--check", action="store_true", help="exit 1 when a budget is exceeded")
+    parser.add_argument("--output", type=Path, help="also write the summary and RSS samples as JSON")
+    args = parser.parse_args(argv)
+
+    server = None
+    log = tempfile.TemporaryFile()
+    if args.url:
+        url, pid = args.url.rstrip("/"), args.pid
+    else:
+        data = write_synthetic(args.scale, seed=args.seed) if args.scale else args.data
+        port = free_port()
+        server = start_server(data, args.backend, port, log)
+        url, pid = f"ws://127.0.0.1:{port}", server.pid
+    try:
+        rss_start = rss_mb(pid) if pid else None
+        cold_seconds = asyncio.run(cold_start(url, args.timeout))
+        results = asyncio.run(load(url, pid, args))
+    except OSError as error:
+        raise SystemExit(f"cannot reach {url}: {error}")
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+    summary = summarize(results, cold_seconds, rss_start)
+
+    print(f"{args.sessions} sessions x {args.changes} changes in {results['seconds']:.1f}s ({os.cpu_count()} cores)")
+    print(f"cold start {summary['cold_start_ms']:.0f} ms")
+    print(f"{'':<12} {'runs':>6} {'p50 (ms)':>10} {'p95 (ms)':>10} {'p99 (ms)':>10} {'max (ms)':>10}")
+    for name in ("first_load", "rerun"):
+        print(
+            f"{name:<12} {len(results[name]):>6} {summary[f'{name}_p50_ms']:>10.1f} {summary[f'{name}_p95_ms']:>10.1f}"
+            f" {summary[f'{name}_p99_ms']:>10.1f} {summary[f'{name}_max_ms']:>10.1f}"
+        )
+    print(f"throughput {summary['reruns_per_second']:.1f} reruns/s, {summary['errors']} errors")
+    if results["rss"]:
+        print(f"\n{'time':>8} {'rss (MB)':>9} {'sessions':>9} {'reruns':>8}")
+        for line in rss_timeline(results, 20):
+            print(line)
+    for error in sorted(set(results["errors"]))[:10]:
+        print(f"ERROR {error}", file=sys.stderr)
+    if args.output:
+        args.output.write_text(json.dumps({"summary": summary, "rss": results["rss"]}, indent=2))
+
+    failures = check(summary, json.loads(args.budget.read_text()))
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    if args.check and failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
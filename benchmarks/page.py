@@ -0,0 +1,72 @@
+"""Full-page timings for one CSV, run in a fresh interpreter by benchmarks.run.
+
+Prints one JSON object: the cold first run (imports, load and every chart),
+a warm rerun, a filter change, the first run of a new session once the
+shared caches are warm (with the RSS each such session adds) and the
+process's peak RSS::
+
+    python -m benchmarks.page .cache/bench/aircrashes_10x_seed7.csv
+"""
+
+import json
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+EXTRA_SESSIONS = 10
+
+
+def current_rss_mb():
+    # Resident pages from /proc (Linux), in MB
+    with open("/proc/self/statm") as fh:
+        return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    # The app reads these at import, so they must be set before AppTest runs it
+    os.environ["AIRCRASH_DATA"] = argv[0]
+    os.environ["AIRCRASH_REFRESH_SECONDS"] = "0"
+
+    started = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=600).run()
+    cold_start = time.perf_counter() - started
+    if at.exception:
+        raise SystemExit(f"app raised: {at.exception[0].value}")
+
+    started = time.perf_counter()
+    at.run()
+    page_run = time.perf_counter() - started
+
+    started = time.perf_counter()
+    at.sidebar.multiselect(key="continent").select("Europe").run()
+    filter_rerun = time.perf_counter() - started
+
+    # Sessions are kept alive so their state stays counted in the RSS
+    sessions, timings = [at], []
+    rss_before = current_rss_mb()
+    for _ in range(EXTRA_SESSIONS):
+        started = time.perf_counter()
+        sessions.append(AppTest.from_file(str(APP_PATH), default_timeout=600).run())
+        sessions[-1].sidebar.multiselect(key="continent").select("Europe").run()
+        timings.append(time.perf_counter() - started)
+    session_mb = (current_rss_mb() - rss_before) / EXTRA_SESSIONS
+
+    print(json.dumps({
+        "cold_start": cold_start,
+        "page_run": page_run,
+        "filter_rerun": filter_rerun,
+        "new_session": sorted(timings)[len(timings) // 2],
+        "session_mb": session_mb,
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+if __name__ == "__main__":
+    main()
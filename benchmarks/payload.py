@@ -0,0 +1,191 @@
+"""Per-chart payload size and client parse time, Plotly's JSON against aircrash.payload.
+
+For each scale every chart of the unfiltered page (aircrash.prerender) and
+the filtered charts of the sample states of benchmarks.run are serialized
+twice, with Streamlit's Plotly template as in the app: with
+``figure.to_json()`` as before, and with ``figure_json`` as the app now
+sends them. Reports the bytes of each, raw as Streamlit sends them by
+default and gzipped as with server.enableWebsocketCompression, and the
+client parse time:
+JSON.parse, decoding the typed arrays and turning date strings into epoch
+milliseconds, as plotly.js does before drawing, timed in Node when it is
+installed (Python's json module otherwise). Exits 1 when a compact figure
+shows different values than Plotly's, after rounding to display precision::
+
+    python -m benchmarks.payload --scales 1 10
+"""
+
+import argparse
+import gzip
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from aircrash.aggregations import top_manufacturer_moving_average
+from aircrash.backends import PandasBackend
+from aircrash.charts import SECTION_CHARTS
+from aircrash.filters import ALL_STATE
+from aircrash.payload import ARRAY_KEYS, DISPLAY_DECIMALS, decode, epoch_ms, figure_json, is_date_list
+from aircrash.prerender import DEFAULT_TOP, DEFAULT_WINDOW, default_figures, top_countries
+from aircrash.store import DataStore
+
+from .run import DEFAULT_SCALES, sample_states
+from .synthetic import DEFAULT_SEED, write_synthetic
+
+# Parses each spec read from stdin the way plotly.js first reads a figure:
+# JSON.parse, typed arrays decoded from base64, date strings parsed to ms
+PARSE_JS = r"""
+const specs = JSON.parse(require("fs").readFileSync(0, "utf8"));
+const repeat = Number(process.argv[1]);
+const ISO = /^\d{4}-\d{2}-\d{2}/;
+const TYPES = {i1: Int8Array, u1: Uint8Array, i2: Int16Array, u2: Uint16Array, i4: Int32Array,
+               u4: Uint32Array, f4: Float32Array, f8: Float64Array};
+function walk(value) {
+  if (Array.isArray(value)) {
+    if (value.length && typeof value[0] === "string" && ISO.test(value[0])) return value.map(Date.parse);
+    return value.map(walk);
+  }
+  if (value && typeof value === "object") {
+    if ("bdata" in value) {
+      const bytes = Buffer.from(value.bdata, "base64");
+      return new TYPES[value.dtype](bytes.buffer, bytes.byteOffset, bytes.length / TYPES[value.dtype].BYTES_PER_ELEMENT);
+    }
+    for (const key in value) value[key] = walk(value[key]);
+  }
+  return value;
+}
+const timings = specs.map(spec => {
+  const runs = [];
+  for (let i = 0; i < repeat; i++) {
+    const started = process.hrtime.bigint();
+    walk(JSON.parse(spec));
+    runs.push(Number(process.hrtime.bigint() - started) / 1e6);
+  }
+  runs.sort((a, b) => a - b);
+  return runs[Math.floor(runs.length / 2)];
+});
+process.stdout.write(JSON.stringify(timings));
+"""
+
+
+def parse_times(specs, repeat):
+    # Median milliseconds to parse each spec, in Node when available
+    node = shutil.which("node")
+    if node:
+        result = subprocess.run(
+            [node, "-e", PARSE_JS, str(repeat)], input=json.dumps(specs), capture_output=True, text=True, check=True
+        )
+        return json.loads(result.stdout), "node"
+    timings = []
+    for spec in specs:
+        runs = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            json.loads(spec)
+            runs.append((time.perf_counter() - started) * 1000)
+        timings.append(statistics.median(runs))
+    return timings, "python"
+
+
+def values(array):
+    # A trace array as float64, whichever way it was serialized
+    if isinstance(array, dict):
+        return decode(array).astype("float64")
+    if is_date_list(array):
+        return epoch_ms(array)
+    return np.asarray(array, dtype="float64")
+
+
+def differences(name, plain, compact):
+    # Where the compact spec draws other numbers than Plotly's own
+    failures = []
+    plain, compact = json.loads(plain), json.loads(compact)
+    for i, (before, after) in enumerate(zip(plain["data"], compact["data"])):
+        for key in ARRAY_KEYS:
+            if key not in before:
+                continue
+            try:
+                expected = np.round(values(before[key]), DISPLAY_DECIMALS)
+            except (TypeError, ValueError):
+                # Labels, which are sent as they are
+                if before[key] != after.get(key):
+                    failures.append(f"{name} trace {i} {key} changed")
+                continue
+            actual = values(after[key])
+            if expected.shape != actual.shape or not np.allclose(expected, actual, rtol=0, atol=10 ** -DISPLAY_DECIMALS / 2):
+                failures.append(f"{name} trace {i} {key} differs")
+    return failures
+
+
+def page_figures(backend, states):
+    # (chart id, figure) of the unfiltered page, then of each filtered state
+    aggregates = backend.aggregates(ALL_STATE)
+    moving_average = top_manufacturer_moving_average(aggregates, DEFAULT_TOP, DEFAULT_WINDOW)
+    figures = list(default_figures(
+        aggregates, backend.rollup("Year"), top_countries(backend), moving_average, backend.date_range()
+    ).items())
+    for state in states:
+        aggregates = backend.aggregates(state)
+        figures += [(chart_id, build(aggregates[chart_id])) for chart_id, build in SECTION_CHARTS.items()]
+    return figures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare chart payloads before and after compaction.")
+    parser.add_argument("--scales", type=float, nargs="+", default=DEFAULT_SCALES, help="data sizes, e.g. 1 10 100")
+    parser.add_argument("--repeat", type=int, default=50, help="parses per chart (median reported)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed for the synthetic data")
+    args = parser.parse_args(argv)
+
+    # The charts as the app draws them, with the template Streamlit sets
+    from streamlit.elements.lib.streamlit_plotly_theme import configure_streamlit_plotly_theme
+
+    configure_streamlit_plotly_theme()
+    failures = []
+    for scale in args.scales:
+        backend = PandasBackend(DataStore(write_synthetic(scale, seed=args.seed)))
+        figures = page_figures(backend, sample_states(backend.store.snapshot))
+        plain = [figure.to_json() for _, figure in figures]
+        compact = [figure_json(figure) for _, figure in figures]
+        for (chart_id, _), before, after in zip(figures, plain, compact):
+            failures += [f"{scale:g}x {failure}" for failure in differences(chart_id, before, after)]
+        plain_ms, parser_name = parse_times(plain, args.repeat)
+        compact_ms, _ = parse_times(compact, args.repeat)
+
+        # Totals per chart over the page and every sample state
+        rows = {}
+        for (chart_id, _), before, after, before_ms, after_ms in zip(figures, plain, compact, plain_ms, compact_ms):
+            row = rows.setdefault(chart_id, [0, 0, 0, 0, 0.0, 0.0])
+            for i, value in enumerate((
+                len(before.encode()), len(after.encode()),
+                len(gzip.compress(before.encode())), len(gzip.compress(after.encode())),
+                before_ms, after_ms,
+            )):
+                row[i] += value
+
+        print(f"\n{scale:g}x, {len(figures)} figures, parse time in {parser_name}")
+        print(
+            f"{'chart':<24} {'bytes':>9} {'compact':>9} {'gzip':>8} {'compact':>8}"
+            f" {'parse (ms)':>11} {'compact':>8} {'saved':>6}"
+        )
+        for chart_id, (size, small, zipped, small_zipped, before_ms, after_ms) in [*rows.items(), ("total", [
+            sum(row[i] for row in rows.values()) for i in range(6)
+        ])]:
+            print(
+                f"{chart_id:<24} {size:>9} {small:>9} {zipped:>8} {small_zipped:>8}"
+                f" {before_ms:>11.2f} {after_ms:>8.2f} {1 - small / size:>6.0%}"
+            )
+
+    for failure in failures:
+        print(f"MISMATCH {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Benchmark suite: load, filter, per-chart aggregation and full page at scaled sizes.
+
+Each scale gets a synthetic CSV (benchmarks.synthetic). In-process cases
+report the median of --repeat timings and the peak tracemalloc allocation
+(Python and NumPy; Arrow-backed strings are not traced) of one extra run; page
+cases run the app through AppTest in a fresh interpreter and
+report its peak RSS instead, or for page:new_session the RSS each extra
+session adds::
+
+    python -m benchmarks.run --scales 1 10 100
+    python -m benchmarks.run --scales 1 10 --save-baseline
+    python -m benchmarks.run --scales 1 10 --check      # exit 1 on regressions
+
+1000x is supported but writes a ~0.5 GB CSV and takes minutes.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from aircrash.aggregations import (
+    dimension_totals,
+    filtered_aggregates,
+    filtered_positions,
+    filtered_records,
+    rollup,
+    top_n,
+)
+from aircrash.backends import PandasBackend
+from aircrash.data import cache_paths, load_dataset, read_csv_typed
+from aircrash.filters import ALL_STATE, FILTER_COLUMNS, SEARCH_COLUMNS, make_state
+from aircrash.intervals import survival_intervals
+from aircrash.prerender import build_default_view, load_default_view, prerender_path, write_default_view
+from aircrash.search import build_search_index, search
+from aircrash.store import DataStore
+
+from .synthetic import DEFAULT_SEED, write_synthetic
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines.json"
+DEFAULT_SCALES = [1, 10]
+DEFAULT_TOLERANCE = 0.25  # slower than baseline by more than this share counts as a regression
+# Typed into the sidebar search, typos included
+SEARCH_QUERIES = ["boeing 737", "fokkr f27", "antonov an-24", "dc3", "cesna", "airbus a32", "l"]
+
+
+def most_common(cube, column, n):
+    values = cube.groupby(column, observed=True)["Crashes"].sum().nlargest(n).index.tolist()
+    return tuple(sorted(int(value) if column == "Year" else value for value in values))
+
+
+def sample_states(dataset):
+    # Representative sidebar states: everything, each single filter on its
+    # most common value, and a combination of all four
+    cube = dataset["cube"]
+    common = {column: most_common(cube, column, 1)[0] for column in FILTER_COLUMNS}
+    states = [ALL_STATE]
+    states += [make_state({column: value}) for column, value in common.items()]
+    states.append(make_state(common))
+    return states
+
+
+def multi_states(dataset):
+    # Multi-value sidebar states: several years, countries, continents and
+    # quarters, the middle half of the date range, and all of them at once
+    cube = dataset["cube"]
+    start, end = (date.date().isoformat() for date in dataset["crashes"]["Date"].quantile([0.25, 0.75]))
+    chosen = {
+        "Year": most_common(cube, "Year", 20),
+        "Country/Region": most_common(cube, "Country/Region", 5),
+        "Continent": most_common(cube, "Continent", 2),
+        "Quarter": most_common(cube, "Quarter", 2),
+    }
+    states = [make_state({column: values}) for column, values in chosen.items()]
+    states.append(make_state({"Date": (start, end)}))
+    states.append(make_state({**chosen, "Date": (start, end)}))
+    states.append(make_state({"Continent": chosen["Continent"], "Quarter": chosen["Quarter"], "Date": (start, end)}))
+    return states
+
+
+def chart_cases(dataset, states, several):
+    # The aggregation behind each chart, run over every sample state
+    # (unfiltered charts once), named after the chart ids in app.py
+    cube = dataset["cube"]
+    records = dataset["crashes"]
+
+    def over_states(aggregate):
+        return lambda: [aggregate(*filtered_positions(dataset, state)) for state in states]
+
+    def country_survival(table, positions):
+        by_country = dimension_totals(table, "Country/Region", positions)
+        return by_country["Survivors"] / by_country["Aboard"]
+
+    def daily_summary(state):
+        positions = filtered_records(dataset, state)
+        rows = records if positions is None else records.take(positions)
+        return rows.groupby(["Aircraft Manufacturer", "Date"], observed=True)["Survivors"].sum()
+
+    return {
+        "chart:yearly_trend": lambda: rollup(cube, by="Year"),
+        "chart:top_countries": lambda: top_n(rollup(cube, by="Country/Region"), "Crashes", 10),
+        "chart:manufacturer_fatalities": over_states(
+            lambda table, positions: top_n(
+                dimension_totals(table, "Aircraft Manufacturer", positions), "Fatalities (air)", 10
+            )
+        ),
+        "chart:continent_summary": over_states(lambda table, positions: dimension_totals(table, "Continent", positions)),
+        "chart:type_crashes": over_states(
+            lambda table, positions: top_n(dimension_totals(table, "Aircraft", positions), "Crashes", 10)
+        ),
+        "chart:quarter_summary": over_states(lambda table, positions: dimension_totals(table, "Quarter", positions)),
+        "chart:daily_summary": lambda: [daily_summary(state) for state in states],
+        "chart:country_survival": over_states(country_survival),
+        "survival_intervals": lambda: survival_intervals(
+            records[["Country/Region", "Survivors", "Fatalities (air)", "Aboard"]], "Country/Region", workers=1
+        ),
+        "all_sections": lambda: [filtered_aggregates(dataset, state) for state in states],
+        "all_sections:multi": lambda: [filtered_aggregates(dataset, state) for state in several],
+    }
+
+
+def measure(run, repeat):
+    # (median seconds over `repeat` runs, peak traced MB of one more run)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"seconds": statistics.median(timings), "peak_mb": peak / 2**20}
+
+
+def clear_sidecar(path):
+    for cached in cache_paths(path):
+        cached.unlink(missing_ok=True)
+
+
+def bench_scale(path, repeat):
+    results = {}
+
+    def load_cold():
+        clear_sidecar(path)
+        return load_dataset(path)
+
+    results["load_csv"] = measure(lambda: read_csv_typed(path), repeat)
+    results["load_data:cold"] = measure(load_cold, repeat)
+    load_dataset(path)
+    results["load_data:warm"] = measure(lambda: load_dataset(path), repeat)
+    results["store_build"] = measure(lambda: DataStore(path), repeat)
+
+    dataset = DataStore(path).snapshot
+    states = sample_states(dataset)
+    results["filtering"] = measure(lambda: [filtered_positions(dataset, state) for state in states], repeat)
+    several = multi_states(dataset)
+    results["filtering:multi"] = measure(lambda: [filtered_positions(dataset, state) for state in several], repeat)
+    for name, run in chart_cases(dataset, states, several).items():
+        results[name] = measure(run, repeat)
+
+    def search_entries():
+        for column in SEARCH_COLUMNS:
+            totals = rollup(dataset["cube"], by=column)
+            yield from ((column, value, crashes) for value, crashes in zip(totals[column], totals["Crashes"]))
+
+    results["search:build"] = measure(lambda: build_search_index(search_entries()), repeat)
+    index = build_search_index(search_entries())
+    results["search:query"] = measure(lambda: [search(index, query) for query in SEARCH_QUERIES], repeat)
+
+    # The unfiltered page: built from the data, then served from its snapshot
+    backend = PandasBackend(DataStore(path))
+    results["prerender:build"] = measure(lambda: build_default_view(backend, workers=1), repeat)
+    write_default_view(build_default_view(backend, workers=1), path)
+    results["prerender:load"] = measure(lambda: load_default_view(backend.version, path), repeat)
+
+    # The page runs in its own interpreter so cold start includes imports,
+    # and without a snapshot so it includes prerendering the default view
+    clear_sidecar(path)
+    prerender_path(path).unlink(missing_ok=True)
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.page", str(path)],
+        capture_output=True, text=True, check=True, cwd=Path(__file__).resolve().parent.parent,
+    ).stdout
+    page = json.loads(output.strip().splitlines()[-1])
+    for name in ("cold_start", "page_run", "filter_rerun"):
+        results[f"page:{name}"] = {"seconds": page[name], "peak_rss_mb": page["peak_rss_mb"]}
+    results["page:new_session"] = {"seconds": page["new_session"], "session_mb": page["session_mb"]}
+    return results
+
+
+def compare(results, baseline, tolerance):
+    # Rows of (scale, case, result, ratio to baseline or None, regressed)
+    rows = []
+    for scale, cases in results.items():
+        for case, result in cases.items():
+            reference = baseline.get(scale, {}).get(case)
+            ratio = result["seconds"] / reference["seconds"] if reference and reference["seconds"] else None
+            rows.append((scale, case, result, ratio, ratio is not None and ratio > 1 + tolerance))
+    return rows
+
+
+def report(rows):
+    print(f"{'scale':>6}  {'case':<32} {'time (ms)':>11} {'memory (MB)':>12} {'vs baseline':>12}")
+    for scale, case, result, ratio, regressed in rows:
+        if "session_mb" in result:
+            memory, kind = result["session_mb"], "sess"
+        elif "peak_rss_mb" in result:
+            memory, kind = result["peak_rss_mb"], "rss"
+        else:
+            memory, kind = result["peak_mb"], "peak"
+        versus = "" if ratio is None else f"{ratio:.2f}x" + (" SLOWER" if regressed else "")
+        print(f"{scale:>6}  {case:<32} {result['seconds'] * 1000:>11.2f} {memory:>8.1f} {kind:<3} {versus:>12}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard at scaled data sizes.")
+    parser.add_argument("--scales", type=float, nargs="+", default=DEFAULT_SCALES, help="data sizes, e.g. 1 10 100 1000")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (median reported)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed for the synthetic data")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline JSON (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown vs baseline")
+    parser.add_argument("--check", action="store_true", help="exit 1 when any case regressed")
+    parser.add_argument("--json", type=Path, help="also write the results here")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for scale in args.scales:
+        path = write_synthetic(scale, seed=args.seed)
+        print(f"benchmarking {scale:g}x ({path.name})", file=sys.stderr)
+        results[f"{scale:g}x"] = bench_scale(path, args.repeat)
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text()).get("results", {})
+    rows = compare(results, baseline, args.tolerance)
+    report(rows)
+
+    document = {"machine": platform.platform(), "python": platform.python_version(), "results": results}
+    if args.json:
+        args.json.write_text(json.dumps(document, indent=2))
+    if args.save_baseline:
+        # Merge, so saving some scales keeps the others
+        saved = json.loads(args.baseline.read_text()) if args.baseline.exists() else {"results": {}}
+        saved.update(machine=document["machine"], python=document["python"])
+        saved["results"].update(results)
+        args.baseline.write_text(json.dumps(saved, indent=2, sort_keys=True) + "\n")
+        print(f"baseline saved to {args.baseline}", file=sys.stderr)
+    if args.check and any(regressed for *_, regressed in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Synthetic crash CSVs that keep the bundled data's distributions at N times its size.
+
+Rows are drawn with replacement from the cleaned CSV, one column group at a
+time, so every group keeps its joint distribution (country with continent,
+manufacturer with aircraft, date parts together, people counts together)
+while the combinations across groups grow with the scale like real data::
+
+    python -m benchmarks.synthetic 100 -o .cache/bench/aircrashes_100x.csv
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from aircrash.data import DATA_PATH
+
+DEFAULT_SEED = 7
+BENCH_DIR = Path(DATA_PATH).parent / ".cache" / "bench"
+
+# Columns sampled together; each group is drawn with its own row index
+COLUMN_GROUPS = [
+    ["Date", "Year", "Quarter", "Month", "Day"],
+    ["Country/Region", "Continent"],
+    ["Aircraft Manufacturer", "Aircraft"],
+    ["Ground", "Fatalities (air)", "Aboard", "Survivors"],
+]
+# Rows generated and written per batch, so 1000x never sits in memory at once
+BATCH_ROWS = 500_000
+
+
+def synthetic_rows(source, rows, rng):
+    batch = {}
+    for group in COLUMN_GROUPS:
+        picks = rng.integers(0, len(source), size=rows)
+        for column in group:
+            batch[column] = source[column].to_numpy()[picks]
+    return pd.DataFrame(batch, columns=list(source.columns))
+
+
+def write_synthetic(scale, output=None, source_path=DATA_PATH, seed=DEFAULT_SEED):
+    # The CSV at `output` (default: the bench cache) with `scale` times the
+    # source's rows; reused as is when it already exists
+    output = Path(output or BENCH_DIR / f"aircrashes_{scale:g}x_seed{seed}.csv")
+    if output.exists():
+        return output
+    source = pd.read_csv(source_path, dtype=str, keep_default_na=False)
+    rng = np.random.default_rng(seed)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_suffix(".csv.tmp")
+    remaining = int(len(source) * scale)
+    with open(tmp_path, "w", newline="") as fh:
+        header = True
+        while remaining:
+            rows = min(remaining, BATCH_ROWS)
+            synthetic_rows(source, rows, rng).to_csv(fh, index=False, header=header)
+            header = False
+            remaining -= rows
+    tmp_path.replace(output)
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic crash CSV scaled from the bundled data.")
+    parser.add_argument("scale", type=float, help="size relative to the bundled CSV, e.g. 10")
+    parser.add_argument("-o", "--output", help="CSV to write (default: under %s)" % BENCH_DIR)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args(argv)
+    print(write_synthetic(args.scale, args.output, seed=args.seed))
+
+
+if __name__ == "__main__":
+    main()
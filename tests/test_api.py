@@ -0,0 +1,51 @@
+import threading
+import time
+
+from aircrash import api
+from aircrash.api import AnalyticsAPI, BuildCache
+from aircrash.filters import make_state
+from aircrash.store import DataStore
+
+
+def test_concurrent_misses_build_once():
+    cache = BuildCache(max_entries=16)
+    builds = []
+    start = threading.Barrier(4)
+
+    def build():
+        builds.append(threading.get_ident())
+        # Hold the build open so the other callers miss while it runs
+        time.sleep(0.2)
+        return b'{"Crashes": 5035}'
+
+    bodies = []
+
+    def ask():
+        start.wait()
+        bodies.append(cache.get_or_build(("/kpis", "All"), build))
+
+    threads = [threading.Thread(target=ask) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert bodies == [b'{"Crashes": 5035}'] * 4
+    assert cache.misses == 4 and not cache._pending
+
+
+def test_endpoints_share_one_aggregation_per_state(monkeypatch):
+    calls = []
+    aggregate = api.filtered_aggregates
+
+    def counted(dataset, state):
+        calls.append(state)
+        return aggregate(dataset, state)
+
+    monkeypatch.setattr(api, "filtered_aggregates", counted)
+    server = AnalyticsAPI(DataStore(), refresh_seconds=0)
+    state = make_state({"Continent": ("Europe",)})
+    for path in ["/kpis", "/top-manufacturers", "/continents", "/survival"]:
+        server.respond(path, state)
+    assert calls == [state]
@@ -0,0 +1,64 @@
+import datetime
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from aircrash.backends import make_backend
+
+APP = "../app.py"
+
+# Filter states that leave no crashes: Armenia has none in 1913, and
+# Ireland's are all in Europe
+EMPTY_STATES = [
+    {"year": [1913], "country": ["Armenia"]},
+    {"country": ["Ireland"], "continent": ["Asia"]},
+]
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setenv("AIRCRASH_REFRESH_SECONDS", "0")
+    return AppTest.from_file(APP, default_timeout=180).run()
+
+
+def test_default_view_renders(app):
+    assert not app.exception
+    assert len(app.get("plotly_chart")) == 10
+
+
+@pytest.mark.parametrize("filters", EMPTY_STATES)
+def test_empty_filter_state(app, filters):
+    for key, value in filters.items():
+        app.session_state[key] = value
+    app.run()
+    assert not app.exception
+    assert any("No crashes match these filters" in info.value for info in app.info)
+
+
+def test_date_range_follows_other_filters(app):
+    # No Oceania crash falls in 1908-1912, so the range is reset to Oceania's span
+    app.session_state["dates"] = (datetime.date(1908, 9, 17), datetime.date(1912, 12, 31))
+    app.session_state["continent"] = ["Oceania"]
+    app.run()
+    assert not app.exception
+    assert not app.info
+    span = make_backend("pandas").date_range({"Continent": ("Oceania",)})
+    assert span[0] > datetime.date(1912, 12, 31)
+    assert app.sidebar.slider(key="dates").value == span
+
+
+def test_stream_mode_leaves_out_the_date_filter(monkeypatch):
+    monkeypatch.setenv("AIRCRASH_REFRESH_SECONDS", "0")
+    monkeypatch.setenv("AIRCRASH_INGEST", "stream")
+    # The backend is a process-wide resource; start and leave with a fresh one
+    st.cache_resource.clear()
+    try:
+        app = AppTest.from_file(APP, default_timeout=180).run()
+        app.session_state["continent"] = ["Europe"]
+        app.run()
+    finally:
+        st.cache_resource.clear()
+    assert not app.exception
+    assert "dates" not in [slider.key for slider in app.sidebar.slider]
+    assert any("follows the manufacturer filter alone" in caption.value for caption in app.caption)
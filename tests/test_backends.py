@@ -0,0 +1,26 @@
+import pytest
+
+from aircrash.backends import DuckDBBackend, PandasBackend
+from aircrash.data import DATA_PATH
+from aircrash.filters import ALL_STATE, make_state
+from aircrash.store import DataStore
+from benchmarks.backends import parity, questions
+
+pytest.importorskip("duckdb")
+
+STATES = {
+    "unfiltered": ALL_STATE,
+    "multi-select": make_state({"Continent": ("Asia", "Europe"), "Quarter": ("Qtr 1", "Qtr 3"), "Year": (1972, 1989)}),
+    "date range": make_state({"Date": ("1990-01-01", "2010-12-31")}),
+    "date range and filters": make_state({"Continent": ("Europe",), "Date": ("1950-06-01", None)}),
+}
+
+
+@pytest.fixture(scope="module")
+def backends():
+    return PandasBackend(DataStore(DATA_PATH)), DuckDBBackend(DATA_PATH)
+
+
+@pytest.mark.parametrize("state", STATES.values(), ids=STATES.keys())
+def test_backends_agree(backends, state):
+    assert parity(backends, questions([state])) == []
@@ -0,0 +1,48 @@
+import threading
+import time
+
+import plotly.graph_objects as go
+
+from aircrash.charts import FigureCache
+
+
+def test_concurrent_misses_build_once():
+    cache = FigureCache(budget=1024 * 1024)
+    builds = []
+    start = threading.Barrier(2)
+
+    def build():
+        builds.append(threading.get_ident())
+        # Hold the build open so the second caller misses while it runs
+        time.sleep(0.2)
+        return go.Figure(go.Bar(x=["a", "b"], y=[1, 2]))
+
+    results = []
+
+    def ask():
+        start.wait()
+        results.append(cache.get_or_build("chart", build))
+
+    threads = [threading.Thread(target=ask) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert len(results) == 2 and results[0] == results[1]
+    assert cache.misses == 2 and not cache._pending
+
+
+def test_failed_build_is_retried():
+    cache = FigureCache(budget=1024 * 1024)
+
+    def broken():
+        raise ValueError("no data")
+
+    try:
+        cache.get_or_build("chart", broken)
+    except ValueError:
+        pass
+    spec = cache.get_or_build("chart", lambda: go.Figure(go.Bar(x=["a"], y=[1])))
+    assert spec["data"][0]["type"] == "bar"
@@ -0,0 +1,60 @@
+import tracemalloc
+
+import pandas as pd
+
+from aircrash.data import DATA_PATH
+from aircrash.ingest import stream_aggregates
+from benchmarks.synthetic import write_synthetic
+
+SOURCE_ROWS = 10
+CHUNKSIZE = 250
+
+
+def write_source(path):
+    # The first rows of the bundled CSV, so the combinations synthetic rows
+    # can take are few enough to be exhausted
+    header, *rows = DATA_PATH.read_bytes().splitlines(keepends=True)[: SOURCE_ROWS + 1]
+    path.write_bytes(header + b"".join(rows))
+    return path
+
+
+def traced_stream(path):
+    # stream_aggregates() and the peak memory it traced
+    tracemalloc.start()
+    try:
+        state = stream_aggregates(path, chunksize=CHUNKSIZE)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return state, peak
+
+
+def resident_cells(state):
+    return len(state["cube"]) + len(state["days"]) + len(state["manufacturer_days"])
+
+
+def test_resident_cells_and_peak_memory_stay_bounded_as_input_grows(tmp_path):
+    source = write_source(tmp_path / "source.csv")
+    # Both files span more than MERGE_EVERY chunks, so both hold the most
+    # partial cubes they ever will
+    small = write_synthetic(500, tmp_path / "small.csv", source_path=source)
+    large = write_synthetic(2500, tmp_path / "large.csv", source_path=source)
+    small_state, small_peak = traced_stream(small)
+    large_state, large_peak = traced_stream(large)
+
+    rows = pd.read_csv(large)
+    assert large_state["rows"] == 5 * small_state["rows"] == len(rows)
+    # Far more distinct rows than resident cells: nothing is kept per row
+    assert len(rows.drop_duplicates()) > 2 * resident_cells(large_state)
+    # Every table is bounded by its combinations, however many rows there are
+    source_rows = pd.read_csv(source)
+    dates = source_rows["Date"].nunique()
+    countries = source_rows["Country/Region"].nunique()
+    aircraft = len(source_rows[["Aircraft Manufacturer", "Aircraft"]].drop_duplicates())
+    manufacturers = source_rows["Aircraft Manufacturer"].nunique()
+    assert len(large_state["cube"]) <= dates * countries * aircraft
+    assert len(large_state["days"]) <= dates
+    assert len(large_state["manufacturer_days"]) <= dates * manufacturers
+    assert resident_cells(large_state) < 2 * resident_cells(small_state)
+    # Five times the rows, read in chunks of the same size
+    assert large_peak < 1.5 * small_peak
@@ -0,0 +1,80 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from aircrash import intervals
+from aircrash.data import DATA_PATH
+from aircrash.intervals import bootstrap_rates, survival_intervals
+from aircrash.store import DataStore
+
+
+def test_single_crash_has_no_bootstrap_interval():
+    cells = pd.DataFrame({
+        "Country": ["A", "A", "A", "B", "C"],
+        "Survivors": [1, 5, 0, 3, 0],
+        "Aboard": [10, 10, 10, 4, 0],
+    })
+    table = survival_intervals(cells, "Country", replicates=200).set_index("Country")
+
+    assert table.at["A", "Bootstrap_Low"] < table.at["A", "Bootstrap_High"]
+    assert np.isnan(table.at["B", "Bootstrap_Low"]) and np.isnan(table.at["B", "Bootstrap_High"])
+    assert table.at["B", "Survival_Rate"] == 75
+    # Nobody aboard: no rate at all
+    assert np.isnan(table.at["C", "Survival_Rate"])
+
+
+def test_concurrent_callers_share_one_pool(monkeypatch):
+    started = []
+
+    class Pool:
+        def __init__(self, *args, **kwargs):
+            # Slow to start, like a spawn pool, so unguarded callers would overlap
+            time.sleep(0.05)
+            started.append(self)
+
+    monkeypatch.setattr(intervals, "_pool", None)
+    monkeypatch.setattr(intervals, "ProcessPoolExecutor", Pool)
+    barrier = threading.Barrier(8)
+    pools = []
+
+    def call():
+        barrier.wait()
+        pools.append(intervals.get_pool(2))
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(started) == 1
+    assert all(pool is started[0] for pool in pools)
+
+
+def test_process_pool_matches_in_process(monkeypatch):
+    # The bundled data is below PARALLEL_MIN_DRAWS, so lower it to reach the pool
+    cells = DataStore(DATA_PATH).snapshot["crashes"][["Continent", "Survivors", "Aboard"]]
+    in_process = survival_intervals(cells, "Continent", replicates=400, workers=1)
+
+    monkeypatch.setattr(intervals, "PARALLEL_MIN_DRAWS", 0)
+    monkeypatch.setattr(intervals, "_pool", None)
+    started = []
+    get_pool = intervals.get_pool
+    monkeypatch.setattr(intervals, "get_pool", lambda workers: started.append(workers) or get_pool(workers))
+    try:
+        pooled = survival_intervals(cells, "Continent", replicates=400, workers=2)
+        # Shard by shard, not just the percentiles: the seeds go with the shards
+        codes = np.array([0, 0, 1, 1])
+        values = np.array([1.0, 2.0, 3.0, 4.0])
+        assert np.array_equal(
+            bootstrap_rates(codes, values, values * 2, 2, 400, workers=2),
+            bootstrap_rates(codes, values, values * 2, 2, 400, workers=1),
+        )
+    finally:
+        if intervals._pool is not None:
+            intervals._pool.shutdown()
+
+    assert started and started[0] == 2
+    pd.testing.assert_frame_equal(pooled, in_process)